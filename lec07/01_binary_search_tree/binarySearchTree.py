@@ -7,6 +7,7 @@ class TreeNode:
     self.data = data
     self.left = None
     self.right = None
+    self.size = 1  # 이 노드를 루트로 하는 서브트리의 노드 수
 
 
 class BinarySearchTree:
@@ -15,6 +16,18 @@ class BinarySearchTree:
   def __init__(self):
     self.root = None
 
+  def __len__(self):
+    """트리의 노드 수"""
+    return self._size(self.root)
+
+  def _size(self, node):
+    """서브트리의 노드 수 (빈 트리는 0)"""
+    return node.size if node is not None else 0
+
+  def _update_size(self, node):
+    """자식들의 크기로 노드의 서브트리 크기 갱신"""
+    node.size = 1 + self._size(node.left) + self._size(node.right)
+
   def insert(self, value):
     """값을 트리에 삽입"""
     self.root = self._insert_recursive(self.root, value)
@@ -29,6 +42,7 @@ class BinarySearchTree:
     elif value > node.data:
       node.right = self._insert_recursive(node.right, value)
 
+    self._update_size(node)
     return node
 
   def delete(self, value):
@@ -56,6 +70,7 @@ class BinarySearchTree:
       node.data = temp.data
       node.right = self._delete_recursive(node.right, temp.data)
 
+    self._update_size(node)
     return node
 
   def _find_min(self, node):
@@ -64,6 +79,98 @@ class BinarySearchTree:
       node = node.left
     return node
 
+  def __iter__(self):
+    """중위 순회를 지연 생성 (리스트를 만들지 않고 하나씩 반환)"""
+    stack = []
+    node = self.root
+
+    while stack or node is not None:
+      while node is not None:
+        stack.append(node)
+        node = node.left
+      node = stack.pop()
+      yield node.data
+      node = node.right
+
+  def range(self, low, high):
+    """low <= 값 < high 인 값들을 오름차순으로 지연 생성 (범위 밖 서브트리는 건너뜀)"""
+    stack = []
+    node = self.root
+
+    while stack or node is not None:
+      while node is not None:
+        if node.data < low:
+          # 왼쪽 서브트리는 모두 low보다 작음
+          node = node.right
+        else:
+          stack.append(node)
+          node = node.left
+
+      if not stack:
+        return
+      node = stack.pop()
+      if node.data >= high:
+        return  # 이후 값은 모두 high 이상
+      yield node.data
+      node = node.right
+
+  def floor(self, value):
+    """value 이하인 가장 큰 값 (없으면 None)"""
+    result = None
+    node = self.root
+    while node is not None:
+      if node.data == value:
+        return node.data
+      if node.data < value:
+        result = node.data
+        node = node.right
+      else:
+        node = node.left
+    return result
+
+  def ceiling(self, value):
+    """value 이상인 가장 작은 값 (없으면 None)"""
+    result = None
+    node = self.root
+    while node is not None:
+      if node.data == value:
+        return node.data
+      if node.data > value:
+        result = node.data
+        node = node.left
+      else:
+        node = node.right
+    return result
+
+  def rank(self, value):
+    """value보다 작은 값의 개수"""
+    count = 0
+    node = self.root
+    while node is not None:
+      if value <= node.data:
+        node = node.left
+      else:
+        count += 1 + self._size(node.left)
+        node = node.right
+    return count
+
+  def select(self, k):
+    """k번째로 작은 값 (0부터 시작, 범위를 벗어나면 None)"""
+    if not 0 <= k < self._size(self.root):
+      return None
+
+    node = self.root
+    while node is not None:
+      left_size = self._size(node.left)
+      if k < left_size:
+        node = node.left
+      elif k > left_size:
+        k -= left_size + 1
+        node = node.right
+      else:
+        return node.data
+    return None
+
   def inorder_traversal(self):
     """중위 순회 (오름차순)"""
     result = []
@@ -133,21 +240,103 @@ class BinarySearchTree:
     self.root = None
 
   def copy(self):
-    """트리를 복사하여 새로운 BinarySearchTree 객체 반환"""
+    """트리를 복사하여 새로운 BinarySearchTree 객체 반환 (반복문, O(n))"""
     new_tree = BinarySearchTree()
-    new_tree.root = self._copy_recursive(self.root)
+    if self.root is None:
+      return new_tree
+
+    new_tree.root = TreeNode(self.root.data)
+    stack = [(self.root, new_tree.root)]
+
+    while stack:
+      node, new_node = stack.pop()
+      new_node.size = node.size
+      if node.left is not None:
+        new_node.left = TreeNode(node.left.data)
+        stack.append((node.left, new_node.left))
+      if node.right is not None:
+        new_node.right = TreeNode(node.right.data)
+        stack.append((node.right, new_node.right))
+
     return new_tree
 
-  def _copy_recursive(self, node):
-    """트리 복사 재귀 헬퍼 함수"""
-    if node is None:
-      return None
+  @classmethod
+  def from_sorted(cls, values):
+    """정렬된 값들로부터 완전히 균형 잡힌 트리를 O(n)에 생성"""
+    values = list(values)
+    for i in range(1, len(values)):
+      if not values[i - 1] < values[i]:
+        raise ValueError("values must be strictly increasing")
+
+    tree = cls()
+    # (구간 시작, 구간 끝, 부모 노드, 왼쪽 자식 여부): 구간의 가운데 값이 서브트리 루트
+    stack = [(0, len(values), None, False)]
+
+    while stack:
+      low, high, parent, is_left = stack.pop()
+      if low >= high:
+        continue
+
+      middle = (low + high) // 2
+      node = TreeNode(values[middle])
+      node.size = high - low
+
+      if parent is None:
+        tree.root = node
+      elif is_left:
+        parent.left = node
+      else:
+        parent.right = node
+
+      stack.append((middle + 1, high, node, False))
+      stack.append((low, middle, node, True))
+
+    return tree
+
+  def serialize(self):
+    """트리를 전위 순회 배열로 변환 (반복문, 이 배열만으로 같은 모양의 트리를 복원 가능)"""
+    result = []
+    stack = [self.root] if self.root is not None else []
+
+    while stack:
+      node = stack.pop()
+      result.append(node.data)
+      if node.right is not None:
+        stack.append(node.right)
+      if node.left is not None:
+        stack.append(node.left)
+
+    return result
+
+  @classmethod
+  def deserialize(cls, preorder):
+    """전위 순회 배열로부터 트리를 O(n)에 복원"""
+    tree = cls()
+    nodes = []  # 전위 순서의 노드들 (크기 계산용)
+    stack = []  # 오른쪽 자식을 아직 받을 수 있는 조상 노드들
+
+    for value in preorder:
+      node = TreeNode(value)
+      nodes.append(node)
+
+      if not stack:
+        tree.root = node
+      elif value < stack[-1].data:
+        stack[-1].left = node
+      else:
+        # value보다 작은 조상 중 가장 마지막 노드의 오른쪽 자식
+        parent = stack.pop()
+        while stack and stack[-1].data < value:
+          parent = stack.pop()
+        parent.right = node
+
+      stack.append(node)
 
-    new_node = TreeNode(node.data)
-    new_node.left = self._copy_recursive(node.left)
-    new_node.right = self._copy_recursive(node.right)
+    # 전위 순서를 뒤집으면 자식이 항상 부모보다 먼저 처리됨
+    for node in reversed(nodes):
+      tree._update_size(node)
 
-    return new_node
+    return tree
 
 
 # 사용 예시
@@ -179,10 +368,39 @@ if __name__ == "__main__":
 
   print("\n=== 새로운 기능 테스트 ===")
 
+  # 순서 통계와 범위 검색
+  print("\n=== 순서 통계 / 범위 검색 테스트 ===")
+  ordered = BinarySearchTree()
+  for value in [50, 30, 70, 20, 40, 60, 80, 35, 45, 65]:
+    ordered.insert(value)
+  print("노드 수:", len(ordered))
+  print("지연 중위 순회의 처음 3개:", [value for value, _ in zip(ordered, range(3))])
+  print("range(35, 65):", list(ordered.range(35, 65)))
+  print("floor(64):", ordered.floor(64), "/ ceiling(64):", ordered.ceiling(64))
+  print("floor(10):", ordered.floor(10), "/ ceiling(90):", ordered.ceiling(90))
+  print("rank(60) (60보다 작은 값의 개수):", ordered.rank(60))
+  print("select(0), select(5), select(9):",
+        ordered.select(0), ordered.select(5), ordered.select(9))
+
   # 트리 시각적 출력
   print("\n트리 구조 출력:")
   bst.print_tree()
 
+  # 일괄 생성 / 직렬화
+  print("\n=== 일괄 생성 / 직렬화 테스트 ===")
+  balanced = BinarySearchTree.from_sorted([10, 20, 30, 40, 50, 60, 70])
+  print("from_sorted([10, 20, ..., 70]):")
+  balanced.print_tree()
+  snapshot = balanced.serialize()
+  print("전위 순회 배열로 직렬화:", snapshot)
+  restored = BinarySearchTree.deserialize(snapshot)
+  print("복원한 트리의 전위 순회:", restored.preorder_traversal())
+
+  large_tree = BinarySearchTree.from_sorted(range(1000000))
+  large_copy = BinarySearchTree.deserialize(large_tree.copy().serialize())
+  print(f"1000000개 트리 복사/직렬화/복원: 노드 수 {len(large_copy)}, "
+        f"500000번째 값 {large_copy.select(500000)}")
+
   # 트리 복사
   print("\n트리 복사 테스트")
   copied_tree = bst.copy()
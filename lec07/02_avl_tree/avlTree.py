@@ -0,0 +1,298 @@
+# avlTree.py - AVL Tree (self-balancing binary search tree)
+
+class AVLNode:
+  """AVL 트리 노드 클래스"""
+
+  def __init__(self, data):
+    self.data = data
+    self.left = None
+    self.right = None
+    self.height = 1  # 이 노드를 루트로 하는 서브트리의 높이
+
+
+class AVLTree:
+  """AVL 트리 클래스
+
+  모든 노드에서 왼쪽/오른쪽 서브트리의 높이 차이를 1 이하로 유지하므로
+  입력 순서와 관계없이 삽입/삭제/검색이 최악의 경우에도 O(log n)입니다.
+  BinarySearchTree와 같은 인터페이스를 제공하며, 재귀 대신 경로 스택을 사용합니다.
+  """
+
+  def __init__(self):
+    self.root = None
+
+  def _height(self, node):
+    """노드의 높이 (빈 트리는 0)"""
+    return node.height if node is not None else 0
+
+  def _update_height(self, node):
+    """자식들의 높이로 노드의 높이 갱신"""
+    node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+  def _rotate_right(self, node):
+    """오른쪽 회전 후 새 서브트리 루트 반환"""
+    new_root = node.left
+    node.left = new_root.right
+    new_root.right = node
+    self._update_height(node)
+    self._update_height(new_root)
+    return new_root
+
+  def _rotate_left(self, node):
+    """왼쪽 회전 후 새 서브트리 루트 반환"""
+    new_root = node.right
+    node.right = new_root.left
+    new_root.left = node
+    self._update_height(node)
+    self._update_height(new_root)
+    return new_root
+
+  def _rebalance(self, node):
+    """노드의 균형을 맞추고 새 서브트리 루트 반환"""
+    self._update_height(node)
+    balance = self._height(node.left) - self._height(node.right)
+
+    if balance > 1:
+      # LR 경우: 왼쪽 자식을 먼저 왼쪽 회전
+      if self._height(node.left.left) < self._height(node.left.right):
+        node.left = self._rotate_left(node.left)
+      return self._rotate_right(node)
+
+    if balance < -1:
+      # RL 경우: 오른쪽 자식을 먼저 오른쪽 회전
+      if self._height(node.right.right) < self._height(node.right.left):
+        node.right = self._rotate_right(node.right)
+      return self._rotate_left(node)
+
+    return node
+
+  def _rebalance_path(self, path, subtree):
+    """경로를 거슬러 올라가며 서브트리를 다시 연결하고 균형 조정"""
+    for parent, is_left in reversed(path):
+      if is_left:
+        parent.left = subtree
+      else:
+        parent.right = subtree
+      subtree = self._rebalance(parent)
+    self.root = subtree
+
+  def insert(self, value):
+    """값을 트리에 삽입"""
+    path = []  # (지나온 노드, 왼쪽으로 내려갔는지)
+    node = self.root
+
+    while node is not None:
+      if value < node.data:
+        path.append((node, True))
+        node = node.left
+      elif value > node.data:
+        path.append((node, False))
+        node = node.right
+      else:
+        return  # 중복 값은 삽입하지 않음
+
+    self._rebalance_path(path, AVLNode(value))
+
+  def delete(self, value):
+    """값을 트리에서 삭제"""
+    path = []
+    node = self.root
+
+    while node is not None and node.data != value:
+      is_left = value < node.data
+      path.append((node, is_left))
+      node = node.left if is_left else node.right
+
+    if node is None:
+      return  # 삭제할 값이 없음
+
+    if node.left is not None and node.right is not None:
+      # 자식이 둘 다 있는 경우: 오른쪽 서브트리의 최솟값으로 대체
+      path.append((node, False))
+      successor = node.right
+      while successor.left is not None:
+        path.append((successor, True))
+        successor = successor.left
+      node.data = successor.data
+      replacement = successor.right
+    else:
+      replacement = node.left if node.left is not None else node.right
+
+    self._rebalance_path(path, replacement)
+
+  def search(self, value):
+    """값이 트리에 있는지 확인"""
+    node = self.root
+    while node is not None:
+      if value < node.data:
+        node = node.left
+      elif value > node.data:
+        node = node.right
+      else:
+        return True
+    return False
+
+  def height(self):
+    """트리의 높이"""
+    return self._height(self.root)
+
+  def inorder_traversal(self):
+    """중위 순회 (오름차순)"""
+    result = []
+    stack = []
+    node = self.root
+
+    while stack or node is not None:
+      while node is not None:
+        stack.append(node)
+        node = node.left
+      node = stack.pop()
+      result.append(node.data)
+      node = node.right
+
+    return result
+
+  def preorder_traversal(self):
+    """전위 순회"""
+    result = []
+    stack = [self.root] if self.root is not None else []
+
+    while stack:
+      node = stack.pop()
+      result.append(node.data)
+      if node.right is not None:
+        stack.append(node.right)
+      if node.left is not None:
+        stack.append(node.left)
+
+    return result
+
+  def postorder_traversal(self):
+    """후위 순회 (루트-오른쪽-왼쪽 순서로 방문한 뒤 뒤집음)"""
+    result = []
+    stack = [self.root] if self.root is not None else []
+
+    while stack:
+      node = stack.pop()
+      result.append(node.data)
+      if node.left is not None:
+        stack.append(node.left)
+      if node.right is not None:
+        stack.append(node.right)
+
+    result.reverse()
+    return result
+
+  def print_tree(self, prefix="", is_last=True):
+    """트리를 시각적으로 출력 (높이가 O(log n)이므로 재귀 사용)"""
+    if self.root is not None:
+      self._print_tree_recursive(self.root, prefix, is_last)
+    else:
+      print("(빈 트리)")
+
+  def _print_tree_recursive(self, node, prefix, is_last):
+    """트리 출력 재귀 헬퍼 함수"""
+    if node is not None:
+      print(prefix, end="")
+
+      if is_last:
+        print("└── ", end="")
+        new_prefix = prefix + "    "
+      else:
+        print("├── ", end="")
+        new_prefix = prefix + "│   "
+
+      print(f"{node.data} (h={node.height})")
+
+      if node.left is not None or node.right is not None:
+        self._print_tree_recursive(node.left, new_prefix, node.right is None)
+        self._print_tree_recursive(node.right, new_prefix, True)
+
+  def clear(self):
+    """트리의 모든 노드를 삭제"""
+    self.root = None
+
+  def copy(self):
+    """트리를 복사하여 새로운 AVLTree 객체 반환"""
+    new_tree = AVLTree()
+    if self.root is None:
+      return new_tree
+
+    new_tree.root = AVLNode(self.root.data)
+    new_tree.root.height = self.root.height
+    stack = [(self.root, new_tree.root)]
+
+    while stack:
+      node, new_node = stack.pop()
+      for child, is_left in ((node.left, True), (node.right, False)):
+        if child is None:
+          continue
+        new_child = AVLNode(child.data)
+        new_child.height = child.height
+        if is_left:
+          new_node.left = new_child
+        else:
+          new_node.right = new_child
+        stack.append((child, new_child))
+
+    return new_tree
+
+
+# 사용 예시
+if __name__ == "__main__":
+  avl = AVLTree()
+
+  # 노드 삽입
+  print("노드 삽입: 50, 30, 70, 20, 40, 60, 80")
+  values = [50, 30, 70, 20, 40, 60, 80]
+  for value in values:
+    avl.insert(value)
+
+  print("중위 순회 (오름차순):", avl.inorder_traversal())
+  print("전위 순회:", avl.preorder_traversal())
+  print("후위 순회:", avl.postorder_traversal())
+
+  # 노드 삭제
+  print("\n노드 20 삭제")
+  avl.delete(20)
+  print("중위 순회:", avl.inorder_traversal())
+
+  print("\n노드 30 삭제")
+  avl.delete(30)
+  print("중위 순회:", avl.inorder_traversal())
+
+  print("\n노드 50 삭제")
+  avl.delete(50)
+  print("중위 순회:", avl.inorder_traversal())
+
+  print("\n트리 구조 출력:")
+  avl.print_tree()
+
+  # 정렬된 순서로 삽입 (일반 이진 탐색 트리는 연결 리스트가 됨)
+  print("\n=== 정렬된 입력 테스트 ===")
+  sorted_tree = AVLTree()
+  print("1부터 15까지 순서대로 삽입")
+  for value in range(1, 16):
+    sorted_tree.insert(value)
+  sorted_tree.print_tree()
+
+  large_tree = AVLTree()
+  for value in range(100000):
+    large_tree.insert(value)
+  print(f"\n0~99999를 순서대로 삽입한 트리의 높이: {large_tree.height()}")
+  for value in range(0, 100000, 2):
+    large_tree.delete(value)
+  print(f"짝수를 모두 삭제한 뒤 높이: {large_tree.height()}")
+  print(f"99999 검색: {large_tree.search(99999)}, 50000 검색: {large_tree.search(50000)}")
+
+  # 트리 복사
+  print("\n트리 복사 테스트")
+  copied_tree = sorted_tree.copy()
+  copied_tree.insert(16)
+  print("원본 트리 중위 순회:", sorted_tree.inorder_traversal())
+  print("복사된 트리 중위 순회:", copied_tree.inorder_traversal())
+
+  # 트리 전체 삭제
+  print("\n트리 전체 삭제")
+  sorted_tree.clear()
+  sorted_tree.print_tree()
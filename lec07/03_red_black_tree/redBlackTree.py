@@ -0,0 +1,444 @@
+# redBlackTree.py - Red-Black Tree (self-balancing binary search tree)
+
+RED = 0
+BLACK = 1
+
+
+class RBNode:
+  """레드-블랙 트리 노드 클래스"""
+
+  def __init__(self, data, color=RED):
+    self.data = data
+    self.color = color
+    self.left = None
+    self.right = None
+    self.parent = None
+
+
+class RedBlackTree:
+  """레드-블랙 트리 클래스
+
+  다음 성질을 유지하여 트리의 높이를 2 log(n + 1) 이하로 제한합니다.
+  1. 루트와 모든 NIL 리프는 검은색
+  2. 빨간 노드의 자식은 모두 검은색
+  3. 각 노드에서 리프까지 가는 모든 경로의 검은 노드 수가 같음
+  BinarySearchTree와 같은 인터페이스를 제공하며, 모든 연산은 반복문으로 구현합니다.
+  """
+
+  def __init__(self):
+    # 모든 빈 자식이 가리키는 검은색 NIL 센티널
+    self.nil = RBNode(None, BLACK)
+    self.root = self.nil
+
+  def _rotate_left(self, node):
+    """왼쪽 회전"""
+    child = node.right
+    node.right = child.left
+    if child.left is not self.nil:
+      child.left.parent = node
+
+    child.parent = node.parent
+    if node.parent is self.nil:
+      self.root = child
+    elif node is node.parent.left:
+      node.parent.left = child
+    else:
+      node.parent.right = child
+
+    child.left = node
+    node.parent = child
+
+  def _rotate_right(self, node):
+    """오른쪽 회전"""
+    child = node.left
+    node.left = child.right
+    if child.right is not self.nil:
+      child.right.parent = node
+
+    child.parent = node.parent
+    if node.parent is self.nil:
+      self.root = child
+    elif node is node.parent.right:
+      node.parent.right = child
+    else:
+      node.parent.left = child
+
+    child.right = node
+    node.parent = child
+
+  def insert(self, value):
+    """값을 트리에 삽입"""
+    parent = self.nil
+    node = self.root
+
+    while node is not self.nil:
+      parent = node
+      if value < node.data:
+        node = node.left
+      elif value > node.data:
+        node = node.right
+      else:
+        return  # 중복 값은 삽입하지 않음
+
+    new_node = RBNode(value)
+    new_node.left = new_node.right = self.nil
+    new_node.parent = parent
+
+    if parent is self.nil:
+      self.root = new_node
+    elif value < parent.data:
+      parent.left = new_node
+    else:
+      parent.right = new_node
+
+    self._insert_fixup(new_node)
+
+  def _insert_fixup(self, node):
+    """삽입 후 빨간 노드가 연속되지 않도록 색 변경과 회전"""
+    while node.parent.color == RED:
+      grandparent = node.parent.parent
+
+      if node.parent is grandparent.left:
+        uncle = grandparent.right
+        if uncle.color == RED:
+          # 경우 1: 삼촌이 빨간색 -> 색만 바꾸고 위로 이동
+          node.parent.color = BLACK
+          uncle.color = BLACK
+          grandparent.color = RED
+          node = grandparent
+        else:
+          if node is node.parent.right:
+            # 경우 2: 꺾인 모양 -> 회전하여 경우 3으로 변환
+            node = node.parent
+            self._rotate_left(node)
+          # 경우 3: 일자 모양 -> 색 변경 후 조부모 회전
+          node.parent.color = BLACK
+          grandparent.color = RED
+          self._rotate_right(grandparent)
+      else:
+        uncle = grandparent.left
+        if uncle.color == RED:
+          node.parent.color = BLACK
+          uncle.color = BLACK
+          grandparent.color = RED
+          node = grandparent
+        else:
+          if node is node.parent.left:
+            node = node.parent
+            self._rotate_right(node)
+          node.parent.color = BLACK
+          grandparent.color = RED
+          self._rotate_left(grandparent)
+
+    self.root.color = BLACK
+
+  def _transplant(self, old, new):
+    """old 서브트리 자리에 new 서브트리를 연결"""
+    if old.parent is self.nil:
+      self.root = new
+    elif old is old.parent.left:
+      old.parent.left = new
+    else:
+      old.parent.right = new
+    new.parent = old.parent
+
+  def _find_min(self, node):
+    """최솟값을 가진 노드 찾기"""
+    while node.left is not self.nil:
+      node = node.left
+    return node
+
+  def _find_node(self, value):
+    """값을 가진 노드 찾기 (없으면 NIL)"""
+    node = self.root
+    while node is not self.nil and node.data != value:
+      node = node.left if value < node.data else node.right
+    return node
+
+  def delete(self, value):
+    """값을 트리에서 삭제"""
+    node = self._find_node(value)
+    if node is self.nil:
+      return  # 삭제할 값이 없음
+
+    removed_color = node.color
+    if node.left is self.nil:
+      replacement = node.right
+      self._transplant(node, node.right)
+    elif node.right is self.nil:
+      replacement = node.left
+      self._transplant(node, node.left)
+    else:
+      # 자식이 둘 다 있는 경우: 오른쪽 서브트리의 최솟값 노드로 대체
+      successor = self._find_min(node.right)
+      removed_color = successor.color
+      replacement = successor.right
+
+      if successor.parent is node:
+        replacement.parent = successor
+      else:
+        self._transplant(successor, successor.right)
+        successor.right = node.right
+        successor.right.parent = successor
+
+      self._transplant(node, successor)
+      successor.left = node.left
+      successor.left.parent = successor
+      successor.color = node.color
+
+    # 검은 노드가 빠졌으면 경로별 검은 노드 수를 복구
+    if removed_color == BLACK:
+      self._delete_fixup(replacement)
+
+  def _delete_fixup(self, node):
+    """삭제 후 "검은색 하나가 더 붙은" 노드를 위로 올리거나 회전으로 해소"""
+    while node is not self.root and node.color == BLACK:
+      if node is node.parent.left:
+        sibling = node.parent.right
+        if sibling.color == RED:
+          # 경우 1: 형제가 빨간색 -> 회전하여 형제를 검은색으로 만듦
+          sibling.color = BLACK
+          node.parent.color = RED
+          self._rotate_left(node.parent)
+          sibling = node.parent.right
+
+        if sibling.left.color == BLACK and sibling.right.color == BLACK:
+          # 경우 2: 형제의 자식이 모두 검은색 -> 형제를 빨간색으로 하고 위로 이동
+          sibling.color = RED
+          node = node.parent
+        else:
+          if sibling.right.color == BLACK:
+            # 경우 3: 형제의 가까운 자식만 빨간색 -> 회전하여 경우 4로 변환
+            sibling.left.color = BLACK
+            sibling.color = RED
+            self._rotate_right(sibling)
+            sibling = node.parent.right
+          # 경우 4: 형제의 먼 자식이 빨간색 -> 회전으로 해소
+          sibling.color = node.parent.color
+          node.parent.color = BLACK
+          sibling.right.color = BLACK
+          self._rotate_left(node.parent)
+          node = self.root
+      else:
+        sibling = node.parent.left
+        if sibling.color == RED:
+          sibling.color = BLACK
+          node.parent.color = RED
+          self._rotate_right(node.parent)
+          sibling = node.parent.left
+
+        if sibling.right.color == BLACK and sibling.left.color == BLACK:
+          sibling.color = RED
+          node = node.parent
+        else:
+          if sibling.left.color == BLACK:
+            sibling.right.color = BLACK
+            sibling.color = RED
+            self._rotate_left(sibling)
+            sibling = node.parent.left
+          sibling.color = node.parent.color
+          node.parent.color = BLACK
+          sibling.left.color = BLACK
+          self._rotate_right(node.parent)
+          node = self.root
+
+    node.color = BLACK
+
+  def search(self, value):
+    """값이 트리에 있는지 확인"""
+    return self._find_node(value) is not self.nil
+
+  def height(self):
+    """트리의 높이 (너비 우선으로 계산)"""
+    level = [self.root] if self.root is not self.nil else []
+    height = 0
+    while level:
+      height += 1
+      level = [child for node in level for child in (node.left, node.right)
+               if child is not self.nil]
+    return height
+
+  def inorder_traversal(self):
+    """중위 순회 (오름차순)"""
+    result = []
+    stack = []
+    node = self.root
+
+    while stack or node is not self.nil:
+      while node is not self.nil:
+        stack.append(node)
+        node = node.left
+      node = stack.pop()
+      result.append(node.data)
+      node = node.right
+
+    return result
+
+  def preorder_traversal(self):
+    """전위 순회"""
+    result = []
+    stack = [self.root] if self.root is not self.nil else []
+
+    while stack:
+      node = stack.pop()
+      result.append(node.data)
+      if node.right is not self.nil:
+        stack.append(node.right)
+      if node.left is not self.nil:
+        stack.append(node.left)
+
+    return result
+
+  def postorder_traversal(self):
+    """후위 순회 (루트-오른쪽-왼쪽 순서로 방문한 뒤 뒤집음)"""
+    result = []
+    stack = [self.root] if self.root is not self.nil else []
+
+    while stack:
+      node = stack.pop()
+      result.append(node.data)
+      if node.left is not self.nil:
+        stack.append(node.left)
+      if node.right is not self.nil:
+        stack.append(node.right)
+
+    result.reverse()
+    return result
+
+  def print_tree(self, prefix="", is_last=True):
+    """트리를 시각적으로 출력 (높이가 O(log n)이므로 재귀 사용)"""
+    if self.root is not self.nil:
+      self._print_tree_recursive(self.root, prefix, is_last)
+    else:
+      print("(빈 트리)")
+
+  def _print_tree_recursive(self, node, prefix, is_last):
+    """트리 출력 재귀 헬퍼 함수"""
+    if node is not self.nil:
+      print(prefix, end="")
+
+      if is_last:
+        print("└── ", end="")
+        new_prefix = prefix + "    "
+      else:
+        print("├── ", end="")
+        new_prefix = prefix + "│   "
+
+      print(f"{node.data} ({'R' if node.color == RED else 'B'})")
+
+      if node.left is not self.nil or node.right is not self.nil:
+        self._print_tree_recursive(node.left, new_prefix, node.right is self.nil)
+        self._print_tree_recursive(node.right, new_prefix, True)
+
+  def clear(self):
+    """트리의 모든 노드를 삭제"""
+    self.root = self.nil
+
+  def copy(self):
+    """트리를 복사하여 새로운 RedBlackTree 객체 반환"""
+    new_tree = RedBlackTree()
+    if self.root is self.nil:
+      return new_tree
+
+    def clone(node, parent):
+      new_node = RBNode(node.data, node.color)
+      new_node.left = new_node.right = new_tree.nil
+      new_node.parent = parent
+      return new_node
+
+    new_tree.root = clone(self.root, new_tree.nil)
+    stack = [(self.root, new_tree.root)]
+
+    while stack:
+      node, new_node = stack.pop()
+      if node.left is not self.nil:
+        new_node.left = clone(node.left, new_node)
+        stack.append((node.left, new_node.left))
+      if node.right is not self.nil:
+        new_node.right = clone(node.right, new_node)
+        stack.append((node.right, new_node.right))
+
+    return new_tree
+
+  def is_valid(self):
+    """레드-블랙 트리 성질을 만족하는지 검사 (디버깅용)"""
+    if self.root.color != BLACK:
+      return False
+
+    black_heights = set()
+    stack = [(self.root, 0)]
+    while stack:
+      node, black_count = stack.pop()
+      if node is self.nil:
+        black_heights.add(black_count + 1)
+        continue
+      if node.color == RED and (node.left.color == RED or node.right.color == RED):
+        return False
+      black_count += node.color == BLACK
+      stack.append((node.left, black_count))
+      stack.append((node.right, black_count))
+
+    return len(black_heights) <= 1
+
+
+# 사용 예시
+if __name__ == "__main__":
+  rbt = RedBlackTree()
+
+  # 노드 삽입
+  print("노드 삽입: 50, 30, 70, 20, 40, 60, 80")
+  values = [50, 30, 70, 20, 40, 60, 80]
+  for value in values:
+    rbt.insert(value)
+
+  print("중위 순회 (오름차순):", rbt.inorder_traversal())
+  print("전위 순회:", rbt.preorder_traversal())
+  print("후위 순회:", rbt.postorder_traversal())
+
+  # 노드 삭제
+  print("\n노드 20 삭제")
+  rbt.delete(20)
+  print("중위 순회:", rbt.inorder_traversal())
+
+  print("\n노드 30 삭제")
+  rbt.delete(30)
+  print("중위 순회:", rbt.inorder_traversal())
+
+  print("\n노드 50 삭제")
+  rbt.delete(50)
+  print("중위 순회:", rbt.inorder_traversal())
+
+  print("\n트리 구조 출력:")
+  rbt.print_tree()
+
+  # 정렬된 순서로 삽입 (일반 이진 탐색 트리는 연결 리스트가 됨)
+  print("\n=== 정렬된 입력 테스트 ===")
+  sorted_tree = RedBlackTree()
+  print("1부터 15까지 순서대로 삽입")
+  for value in range(1, 16):
+    sorted_tree.insert(value)
+  sorted_tree.print_tree()
+  print(f"레드-블랙 성질 만족: {sorted_tree.is_valid()}")
+
+  large_tree = RedBlackTree()
+  for value in range(100000):
+    large_tree.insert(value)
+  print(f"\n0~99999를 순서대로 삽입한 트리의 높이: {large_tree.height()}")
+  for value in range(0, 100000, 2):
+    large_tree.delete(value)
+  print(f"짝수를 모두 삭제한 뒤 높이: {large_tree.height()}, "
+        f"레드-블랙 성질 만족: {large_tree.is_valid()}")
+  print(f"99999 검색: {large_tree.search(99999)}, 50000 검색: {large_tree.search(50000)}")
+
+  # 트리 복사
+  print("\n트리 복사 테스트")
+  copied_tree = sorted_tree.copy()
+  copied_tree.insert(16)
+  print("원본 트리 중위 순회:", sorted_tree.inorder_traversal())
+  print("복사된 트리 중위 순회:", copied_tree.inorder_traversal())
+  print(f"복사된 트리 레드-블랙 성질 만족: {copied_tree.is_valid()}")
+
+  # 트리 전체 삭제
+  print("\n트리 전체 삭제")
+  sorted_tree.clear()
+  sorted_tree.print_tree()
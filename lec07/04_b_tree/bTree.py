@@ -0,0 +1,505 @@
+# bTree.py - B-Tree ordered set with array-backed nodes
+
+import random
+import time
+from bisect import bisect_left, bisect_right
+
+
+class BTreeNode:
+  """B-트리 노드 클래스
+
+  키와 자식을 노드마다 하나씩 만들지 않고 정렬된 리스트(연속 배열)에 모아 저장하므로
+  한 노드 안의 탐색은 bisect 한 번, 노드 사이 이동은 트리 높이만큼만 일어납니다.
+  """
+
+  def __init__(self, leaf=True):
+    self.keys = []       # 정렬된 키 배열
+    self.children = []   # 자식 노드 배열 (리프면 비어있음, 아니면 len(keys) + 1개)
+    self.leaf = leaf
+    self.size = 0        # 이 노드를 루트로 하는 서브트리의 키 개수 (rank/select용)
+
+
+class BTree:
+  """B-트리 클래스 (BinarySearchTree와 같은 인터페이스)
+
+  fan_out은 노드의 최대 자식 수(4 이상의 짝수)입니다. 최소 차수 t = fan_out // 2이며,
+  루트를 제외한 모든 노드는 t-1 ~ 2t-1개의 키를 가집니다.
+  노드마다 서브트리의 키 개수를 저장하여 rank/select를 O(fan_out * 높이)에 처리합니다.
+  삽입/삭제는 내려가면서 미리 분할/병합하는 한 번의 반복문으로 처리합니다.
+  """
+
+  def __init__(self, fan_out=64):
+    if fan_out < 4:
+      raise ValueError("fan_out must be at least 4")
+    if fan_out % 2:
+      # 최대 자식 수는 2t이므로 홀수면 fan_out - 1개까지만 쓰게 됨
+      raise ValueError("fan_out must be even")
+    self.fan_out = fan_out
+    self.t = fan_out // 2
+    self.max_keys = 2 * self.t - 1
+    self.root = BTreeNode()
+    self.count = 0
+
+  def __len__(self):
+    """저장된 키의 수"""
+    return self.count
+
+  @classmethod
+  def from_sorted(cls, values, fan_out=64):
+    """정렬된 값들로부터 아래에서 위로 B-트리를 O(n)에 생성"""
+    values = list(values)
+    for i in range(1, len(values)):
+      if not values[i - 1] < values[i]:
+        raise ValueError("values must be strictly increasing")
+
+    tree = cls(fan_out)
+    tree.count = len(values)
+
+    # 리프 층부터 만들고, 노드 사이의 구분 키를 위 층의 키로 올림
+    nodes, separators = tree._pack_level(values, None)
+    while len(nodes) > 1:
+      nodes, separators = tree._pack_level(separators, nodes)
+    tree.root = nodes[0]
+    return tree
+
+  def _pack_level(self, keys, children):
+    """한 층의 키(와 자식)를 최소 개수의 노드로 고르게 나누고 구분 키들을 반환"""
+    units = len(keys) + 1  # 노드 j가 u_j개를 맡으면 키 u_j - 1개 (+ 자식 u_j개)
+    count = max(1, -(-units // (self.max_keys + 1)))
+    base, extra = divmod(units, count)
+
+    nodes = []
+    separators = []
+    key_pos = child_pos = 0
+
+    for j in range(count):
+      share = base + (1 if j < extra else 0)
+      node = BTreeNode(leaf=children is None)
+      node.keys = keys[key_pos:key_pos + share - 1]
+      key_pos += share - 1
+      if children is not None:
+        node.children = children[child_pos:child_pos + share]
+        child_pos += share
+      node.size = len(node.keys) + sum(child.size for child in node.children)
+      nodes.append(node)
+
+      if j < count - 1:
+        separators.append(keys[key_pos])
+        key_pos += 1
+
+    return nodes, separators
+
+  def search(self, value):
+    """값이 트리에 있는지 확인"""
+    node = self.root
+    while True:
+      i = bisect_left(node.keys, value)
+      if i < len(node.keys) and node.keys[i] == value:
+        return True
+      if node.leaf:
+        return False
+      node = node.children[i]
+
+  def _split_child(self, parent, index):
+    """가득 찬 자식을 둘로 나누고 가운데 키를 부모로 올림"""
+    t = self.t
+    child = parent.children[index]
+    right = BTreeNode(leaf=child.leaf)
+
+    middle = child.keys[t - 1]
+    right.keys = child.keys[t:]
+    child.keys = child.keys[:t - 1]
+    if not child.leaf:
+      right.children = child.children[t:]
+      child.children = child.children[:t]
+    right.size = len(right.keys) + sum(node.size for node in right.children)
+    child.size -= right.size + 1
+
+    parent.keys.insert(index, middle)
+    parent.children.insert(index + 1, right)
+
+  def insert(self, value):
+    """값을 트리에 삽입"""
+    root = self.root
+    if len(root.keys) == self.max_keys:
+      # 루트가 가득 차면 새 루트를 만들고 분할 (트리 높이 1 증가)
+      new_root = BTreeNode(leaf=False)
+      new_root.children.append(root)
+      new_root.size = root.size
+      self._split_child(new_root, 0)
+      self.root = new_root
+
+    node = self.root
+    path = []  # 삽입에 성공하면 서브트리 키 개수를 1씩 늘릴 노드들
+    while True:
+      path.append(node)
+      i = bisect_left(node.keys, value)
+      if i < len(node.keys) and node.keys[i] == value:
+        return  # 중복 값은 삽입하지 않음
+
+      if node.leaf:
+        node.keys.insert(i, value)
+        for visited in path:
+          visited.size += 1
+        self.count += 1
+        return
+
+      # 내려가기 전에 가득 찬 자식을 미리 분할
+      if len(node.children[i].keys) == self.max_keys:
+        self._split_child(node, i)
+        if value == node.keys[i]:
+          return
+        if value > node.keys[i]:
+          i += 1
+      node = node.children[i]
+
+  def _merge_children(self, node, index):
+    """자식 index와 index + 1을 부모의 구분 키와 함께 하나로 병합"""
+    left = node.children[index]
+    right = node.children.pop(index + 1)
+    left.keys.append(node.keys.pop(index))
+    left.keys.extend(right.keys)
+    left.children.extend(right.children)
+    left.size += 1 + right.size
+
+    # 루트의 키가 모두 내려가면 트리 높이 1 감소
+    if node is self.root and not node.keys:
+      self.root = left
+    return left
+
+  def _ensure_child_keys(self, node, index):
+    """내려갈 자식이 최소 t개의 키를 갖도록 형제에게서 빌리거나 병합하고 자식 반환"""
+    t = self.t
+    child = node.children[index]
+    if len(child.keys) >= t:
+      return child
+
+    if index > 0 and len(node.children[index - 1].keys) >= t:
+      # 왼쪽 형제에게서 키 하나를 부모를 거쳐 빌려옴
+      sibling = node.children[index - 1]
+      child.keys.insert(0, node.keys[index - 1])
+      node.keys[index - 1] = sibling.keys.pop()
+      moved = 1
+      if not sibling.leaf:
+        child.children.insert(0, sibling.children.pop())
+        moved += child.children[0].size
+      child.size += moved
+      sibling.size -= moved
+      return child
+
+    if index < len(node.keys) and len(node.children[index + 1].keys) >= t:
+      # 오른쪽 형제에게서 키 하나를 부모를 거쳐 빌려옴
+      sibling = node.children[index + 1]
+      child.keys.append(node.keys[index])
+      node.keys[index] = sibling.keys.pop(0)
+      moved = 1
+      if not sibling.leaf:
+        child.children.append(sibling.children.pop(0))
+        moved += child.children[-1].size
+      child.size += moved
+      sibling.size -= moved
+      return child
+
+    # 양쪽 형제 모두 최소 개수면 병합
+    if index < len(node.keys):
+      return self._merge_children(node, index)
+    return self._merge_children(node, index - 1)
+
+  def delete(self, value):
+    """값을 트리에서 삭제"""
+    node = self.root
+    t = self.t
+    path = []  # 삭제에 성공하면 서브트리 키 개수를 1씩 줄일 노드들
+
+    while True:
+      path.append(node)
+      i = bisect_left(node.keys, value)
+      found = i < len(node.keys) and node.keys[i] == value
+
+      if node.leaf:
+        if found:
+          del node.keys[i]
+          for visited in path:
+            visited.size -= 1
+          self.count -= 1
+        return
+
+      if found:
+        left, right = node.children[i], node.children[i + 1]
+        if len(left.keys) >= t:
+          # 왼쪽 서브트리의 최댓값(predecessor)으로 대체하고 그것을 삭제하러 내려감
+          predecessor = left
+          while not predecessor.leaf:
+            predecessor = predecessor.children[-1]
+          value = node.keys[i] = predecessor.keys[-1]
+          node = left
+        elif len(right.keys) >= t:
+          # 오른쪽 서브트리의 최솟값(successor)으로 대체
+          successor = right
+          while not successor.leaf:
+            successor = successor.children[0]
+          value = node.keys[i] = successor.keys[0]
+          node = right
+        else:
+          # 둘 다 최소 개수면 병합한 노드에서 계속 삭제
+          node = self._merge_children(node, i)
+      else:
+        node = self._ensure_child_keys(node, i)
+
+  def _iterate(self, stack, high=None):
+    """(노드, 다음 키 위치) 스택에서 시작하는 중위 순회 생성기"""
+    while stack:
+      node, i = stack.pop()
+      if i >= len(node.keys):
+        continue
+
+      key = node.keys[i]
+      if high is not None and key >= high:
+        return
+      yield key
+
+      stack.append((node, i + 1))
+      if not node.leaf:
+        # 다음 키 전에 오른쪽 자식 서브트리의 가장 왼쪽부터 방문
+        child = node.children[i + 1]
+        while True:
+          stack.append((child, 0))
+          if child.leaf:
+            break
+          child = child.children[0]
+
+  def __iter__(self):
+    """중위 순회를 지연 생성 (리스트를 만들지 않고 하나씩 반환)"""
+    stack = []
+    node = self.root
+    while True:
+      stack.append((node, 0))
+      if node.leaf:
+        break
+      node = node.children[0]
+    return self._iterate(stack)
+
+  def range(self, low, high):
+    """low <= 값 < high 인 값들을 오름차순으로 지연 생성"""
+    stack = []
+    node = self.root
+    while True:
+      i = bisect_left(node.keys, low)
+      stack.append((node, i))
+      if node.leaf:
+        break
+      node = node.children[i]
+    return self._iterate(stack, high)
+
+  def floor(self, value):
+    """value 이하인 가장 큰 값 (없으면 None)"""
+    result = None
+    node = self.root
+    while True:
+      i = bisect_right(node.keys, value)
+      if i > 0:
+        result = node.keys[i - 1]
+        if result == value:
+          return result
+      if node.leaf:
+        return result
+      node = node.children[i]
+
+  def ceiling(self, value):
+    """value 이상인 가장 작은 값 (없으면 None)"""
+    result = None
+    node = self.root
+    while True:
+      i = bisect_left(node.keys, value)
+      if i < len(node.keys):
+        result = node.keys[i]
+        if result == value:
+          return result
+      if node.leaf:
+        return result
+      node = node.children[i]
+
+  def rank(self, value):
+    """value보다 작은 값의 개수"""
+    count = 0
+    node = self.root
+    while True:
+      i = bisect_left(node.keys, value)
+      count += i
+      if node.leaf:
+        return count
+      count += sum(child.size for child in node.children[:i])
+      if i < len(node.keys) and node.keys[i] == value:
+        return count + node.children[i].size
+      node = node.children[i]
+
+  def select(self, k):
+    """k번째로 작은 값 (0부터 시작, 범위를 벗어나면 None)"""
+    if not 0 <= k < self.count:
+      return None
+
+    node = self.root
+    while not node.leaf:
+      for i, child in enumerate(node.children):
+        if k < child.size:
+          node = child
+          break
+        k -= child.size
+        if k == 0:
+          return node.keys[i]
+        k -= 1
+    return node.keys[k]
+
+  def height(self):
+    """트리의 높이 (노드 층 수)"""
+    height = 1
+    node = self.root
+    while not node.leaf:
+      node = node.children[0]
+      height += 1
+    return height
+
+  def inorder_traversal(self):
+    """중위 순회 (오름차순)"""
+    return list(self)
+
+  def preorder_traversal(self):
+    """전위 순회 (노드의 키들을 자식들보다 먼저 방문)"""
+    result = []
+    stack = [self.root]
+    while stack:
+      node = stack.pop()
+      result.extend(node.keys)
+      stack.extend(reversed(node.children))
+    return result
+
+  def postorder_traversal(self):
+    """후위 순회 (자식들을 모두 방문한 뒤 노드의 키들을 방문)"""
+    result = []
+    stack = [self.root]
+    while stack:
+      node = stack.pop()
+      result.extend(reversed(node.keys))
+      stack.extend(node.children)
+    result.reverse()
+    return result
+
+  def print_tree(self, prefix="", is_last=True):
+    """트리를 시각적으로 출력 (높이가 O(log n)이므로 재귀 사용)"""
+    if self.root.keys:
+      self._print_tree_recursive(self.root, prefix, is_last)
+    else:
+      print("(빈 트리)")
+
+  def _print_tree_recursive(self, node, prefix, is_last):
+    """트리 출력 재귀 헬퍼 함수"""
+    print(prefix, end="")
+
+    if is_last:
+      print("└── ", end="")
+      new_prefix = prefix + "    "
+    else:
+      print("├── ", end="")
+      new_prefix = prefix + "│   "
+
+    print(node.keys)
+
+    for i, child in enumerate(node.children):
+      self._print_tree_recursive(child, new_prefix, i == len(node.children) - 1)
+
+  def clear(self):
+    """트리의 모든 키를 삭제"""
+    self.root = BTreeNode()
+    self.count = 0
+
+  def copy(self):
+    """트리를 복사하여 새로운 BTree 객체 반환"""
+    new_tree = BTree(self.fan_out)
+    new_tree.count = self.count
+    new_tree.root = BTreeNode(self.root.leaf)
+    stack = [(self.root, new_tree.root)]
+
+    while stack:
+      node, new_node = stack.pop()
+      new_node.keys = node.keys[:]
+      new_node.size = node.size
+      for child in node.children:
+        new_child = BTreeNode(child.leaf)
+        new_node.children.append(new_child)
+        stack.append((child, new_child))
+
+    return new_tree
+
+
+# 사용 예시
+if __name__ == "__main__":
+  btree = BTree(fan_out=4)
+
+  # 노드 삽입
+  print("키 삽입 (fan_out=4): 50, 30, 70, 20, 40, 60, 80, 10, 25, 35, 45")
+  values = [50, 30, 70, 20, 40, 60, 80, 10, 25, 35, 45]
+  for value in values:
+    btree.insert(value)
+
+  btree.print_tree()
+  print("중위 순회 (오름차순):", btree.inorder_traversal())
+  print("전위 순회:", btree.preorder_traversal())
+  print("후위 순회:", btree.postorder_traversal())
+
+  # 키 삭제
+  for value in (20, 30, 50):
+    print(f"\n키 {value} 삭제")
+    btree.delete(value)
+    print("중위 순회:", btree.inorder_traversal())
+  btree.print_tree()
+
+  # 범위 검색
+  print("\n=== 범위 검색 테스트 ===")
+  print("range(25, 70):", list(btree.range(25, 70)))
+  print("floor(44):", btree.floor(44), "/ ceiling(44):", btree.ceiling(44))
+  print("키 40 검색:", btree.search(40), "/ 키 41 검색:", btree.search(41))
+  print("rank(45):", btree.rank(45), "/ select(2):", btree.select(2),
+        "/ select(100):", btree.select(100))
+
+  # 정렬된 입력으로 일괄 생성
+  print("\n=== 일괄 생성 테스트 ===")
+  bulk = BTree.from_sorted(range(1, 30), fan_out=4)
+  bulk.print_tree()
+
+  # 트리 복사
+  print("\n트리 복사 테스트")
+  copied_tree = btree.copy()
+  copied_tree.insert(99)
+  print("원본 트리 중위 순회:", btree.inorder_traversal())
+  print("복사된 트리 중위 순회:", copied_tree.inorder_traversal())
+
+  # 큰 트리에서 삽입/검색 시간
+  print("\n=== 큰 트리 테스트 (1000000개, fan_out=64) ===")
+  keys = list(range(0, 2000000, 2))
+  start = time.perf_counter()
+  large_tree = BTree.from_sorted(keys)
+  print(f"from_sorted: {time.perf_counter() - start:.2f} s, 높이 {large_tree.height()}")
+
+  random.seed(42)
+  queries = [random.randrange(2000000) for _ in range(100000)]
+  start = time.perf_counter()
+  hits = sum(large_tree.search(key) for key in queries)
+  print(f"검색 100000회: {time.perf_counter() - start:.2f} s, 찾은 키 {hits}개")
+
+  start = time.perf_counter()
+  ranks = [large_tree.rank(key) for key in queries[:10000]]
+  selected = [large_tree.select(rank) for rank in ranks]
+  print(f"rank + select 10000회: {time.perf_counter() - start:.2f} s, "
+        f"rank(1000001) = {large_tree.rank(1000001)}, "
+        f"select(rank(q)) == ceiling(q): "
+        f"{selected == [large_tree.ceiling(key) for key in queries[:10000]]}")
+
+  start = time.perf_counter()
+  window = list(large_tree.range(500000, 500020))
+  print(f"range(500000, 500020): {window[:5]}... ({len(window)}개, "
+        f"{(time.perf_counter() - start) * 1e6:.0f} us)")
+
+  # 트리 전체 삭제
+  print("\n트리 전체 삭제")
+  btree.clear()
+  btree.print_tree()
@@ -1,5 +1,18 @@
 # hashTableSC.py - Hash Table with Separate Chaining
 
+try:
+  import numpy as np  # 선택 사항: 일괄 검색의 해시 계산을 벡터화
+except ImportError:
+  np = None
+
+
+def _home_indices(keys, size):
+  """키 배치의 버킷 번호(key % size)를 한 번에 계산"""
+  if np is not None:
+    return (np.asarray(keys, dtype=np.int64) % size).tolist()
+  return [key % size for key in keys]
+
+
 class HashNode:
   """해시 테이블 노드 클래스 (연결 리스트의 노드)"""
 
@@ -12,68 +25,211 @@ class HashNode:
 class HashTableSC:
   """Separate Chaining 방식의 해시 테이블 클래스"""
 
-  def __init__(self, size=7):
-    """해시 테이블 초기화"""
+  def __init__(self, size=7, incremental=False, migrate_batch=8, max_load_factor=None):
+    """해시 테이블 초기화
+
+    incremental=True이면 resize()가 한 번에 재해시하지 않고 이전 테이블을
+    유지한 채, 매 연산마다 migrate_batch개의 버킷씩 새 테이블로 옮깁니다.
+    max_load_factor를 지정하면 로드 팩터가 이를 넘을 때 크기를 2배로 조정합니다.
+    """
     self.size = size
+    self.count = 0  # 저장된 아이템 수 (두 테이블 합계)
     self.table = [None] * size
 
+    # 점진적 크기 조정 상태
+    self.incremental = incremental
+    self.migrate_batch = migrate_batch
+    self.max_load_factor = max_load_factor
+    self._old_table = None   # 옮기는 중인 이전 테이블
+    self._migrate_index = 0  # 다음에 옮길 이전 테이블 버킷
+
   def _hash_function(self, key):
     """해시 함수 (간단한 modulo 연산)"""
     return key % self.size
 
+  def _find_node(self, key):
+    """키에 해당하는 노드 검색 (아직 옮기지 않은 이전 테이블 버킷 포함)"""
+    current = self.table[self._hash_function(key)]
+    while current is not None:
+      if current.key == key:
+        return current
+      current = current.next
+
+    if self._old_table is not None:
+      index = key % len(self._old_table)
+      if index >= self._migrate_index:
+        current = self._old_table[index]
+        while current is not None:
+          if current.key == key:
+            return current
+          current = current.next
+
+    return None
+
+  def is_resizing(self):
+    """점진적 크기 조정이 진행 중인지 확인"""
+    return self._old_table is not None
+
+  def _migrate_step(self, batch=None):
+    """이전 테이블의 버킷을 최대 batch개 새 테이블로 옮김 (노드를 그대로 재연결)"""
+    if self._old_table is None:
+      return
+
+    old_table = self._old_table
+    end = min(self._migrate_index + (batch or self.migrate_batch), len(old_table))
+
+    for i in range(self._migrate_index, end):
+      current = old_table[i]
+      old_table[i] = None
+      while current is not None:
+        next_node = current.next
+        index = self._hash_function(current.key)
+        current.next = self.table[index]
+        self.table[index] = current
+        current = next_node
+
+    self._migrate_index = end
+    if end >= len(old_table):
+      # 모두 옮겼으면 이전 테이블 해제
+      self._old_table = None
+
+  def _finish_migration(self):
+    """남은 버킷을 모두 옮겨 점진적 크기 조정 완료"""
+    if self._old_table is not None:
+      self._migrate_step(len(self._old_table))
+
   def insert(self, key, value):
     """키-값 쌍을 해시 테이블에 삽입"""
-    index = self._hash_function(key)
-    current = self.table[index]
+    self._migrate_step()
 
     # 기존 키가 있는지 확인 (업데이트)
-    while current is not None:
-      if current.key == key:
-        current.value = value
-        return
-      current = current.next
+    node = self._find_node(key)
+    if node is not None:
+      node.value = value
+      return
 
     # 새 노드를 리스트 앞에 삽입
+    index = self._hash_function(key)
     new_node = HashNode(key, value)
     new_node.next = self.table[index]
     self.table[index] = new_node
+    self.count += 1
+
+    # 로드 팩터가 최대값을 넘으면 크기를 2배로 증가
+    max_load_factor = self.max_load_factor
+    if max_load_factor is not None and self.get_load_factor() > max_load_factor:
+      self.resize(self.size * 2)
+
+  def _link_items(self, items):
+    """크기 조정 없이 현재 테이블에 키-값 쌍들을 연결"""
+    table, size = self.table, self.size
+    for key, value in items:
+      index = key % size
+      current = table[index]
+
+      # 기존 키가 있는지 확인 (업데이트)
+      while current is not None and current.key != key:
+        current = current.next
+      if current is not None:
+        current.value = value
+        continue
+
+      # 새 노드를 리스트 앞에 삽입
+      new_node = HashNode(key, value)
+      new_node.next = table[index]
+      table[index] = new_node
+      self.count += 1
+
+  def bulk_insert(self, items):
+    """여러 키-값 쌍을 한 번에 삽입 (최종 아이템 수에 맞춰 미리 크기 조정)"""
+    items = list(items)
+    self._finish_migration()
+
+    # 모두 삽입해도 로드 팩터가 최대값(없으면 1)을 넘지 않는 크기로 한 번만 조정
+    max_load_factor = self.max_load_factor or 1.0
+    needed_size = int((self.count + len(items)) / max_load_factor) + 1
+    if needed_size > self.size:
+      self.resize(needed_size)
+      self._finish_migration()
+
+    self._link_items(items)
+
+  @classmethod
+  def from_items(cls, items, **kwargs):
+    """키-값 쌍들로부터 해시 테이블 생성 (테이블 할당 1회, size는 최소 크기)"""
+    items = list(items)
+    min_size = kwargs.pop('size', 7)
+    max_load_factor = kwargs.get('max_load_factor') or 1.0
+    size = max(min_size, int(len(items) / max_load_factor) + 1)
+    hash_table = cls(size, **kwargs)
+    hash_table._link_items(items)
+    return hash_table
 
   def search(self, key):
     """키에 해당하는 값을 검색"""
-    index = self._hash_function(key)
-    current = self.table[index]
+    self._migrate_step()
 
-    while current is not None:
-      if current.key == key:
-        return current.value
-      current = current.next
+    node = self._find_node(key)
+    return node.value if node is not None else None  # 키를 찾지 못하면 None
 
-    return None  # 키를 찾지 못함
+  def search_many(self, keys):
+    """정수 키 배치(list, array, numpy 배열)를 한 번에 검색하여 값 리스트 반환"""
+    if self._old_table is not None:
+      # 점진적 크기 조정 중에는 두 테이블을 모두 봐야 하므로 하나씩 검색
+      return [self.search(key) for key in keys]
+
+    table = self.table
+    results = []
+
+    for key, index in zip(keys, _home_indices(keys, self.size)):
+      current = table[index]
+      while current is not None and current.key != key:
+        current = current.next
+      results.append(current.value if current is not None else None)
+
+    return results
 
   def delete(self, key):
     """키를 해시 테이블에서 삭제"""
-    index = self._hash_function(key)
-    current = self.table[index]
+    self._migrate_step()
+
+    if self._delete_from(self.table, self._hash_function(key), key):
+      return True  # 삭제 성공
+
+    if self._old_table is not None:
+      index = key % len(self._old_table)
+      if index >= self._migrate_index:
+        if self._delete_from(self._old_table, index, key):
+          return True
+
+    return False  # 키를 찾지 못함
+
+  def _delete_from(self, table, index, key):
+    """주어진 테이블의 버킷 체인에서 키를 제거"""
+    current = table[index]
     prev = None
 
     while current is not None:
       if current.key == key:
         if prev is None:
           # 첫 번째 노드 삭제
-          self.table[index] = current.next
+          table[index] = current.next
         else:
           # 중간 또는 마지막 노드 삭제
           prev.next = current.next
-        return True  # 삭제 성공
+        self.count -= 1
+        return True
 
       prev = current
       current = current.next
 
-    return False  # 키를 찾지 못함
+    return False
 
   def print_table(self):
     """해시 테이블 내용을 출력"""
     print("해시 테이블 내용:")
+    if self._old_table is not None:
+      print(f"(점진적 크기 조정 중: 이전 테이블 {self._migrate_index}/{len(self._old_table)} 버킷 이동)")
 
     for i in range(self.size):
       print(f"버킷 {i}: ", end="")
@@ -89,10 +245,10 @@ class HashTableSC:
         print(" -> ".join(chain))
 
   def get_all_items(self):
-    """모든 키-값 쌍을 리스트로 반환"""
+    """모든 키-값 쌍을 리스트로 반환 (옮기는 중인 아이템 포함)"""
     items = []
-    for i in range(self.size):
-      current = self.table[i]
+    buckets = self.table if self._old_table is None else self.table + self._old_table
+    for current in buckets:
       while current is not None:
         items.append((current.key, current.value))
         current = current.next
@@ -100,11 +256,23 @@ class HashTableSC:
 
   def resize(self, new_size):
     """해시 테이블 크기 조정"""
+    # 이전 조정이 끝나지 않았으면 먼저 마무리
+    self._finish_migration()
+
+    if self.incremental:
+      # 새 테이블만 할당하고 버킷은 이후 연산마다 조금씩 옮김
+      self._old_table = self.table
+      self._migrate_index = 0
+      self.size = new_size
+      self.table = [None] * new_size
+      return
+
     # 기존 모든 아이템을 저장
     old_items = self.get_all_items()
 
     # 새로운 크기로 테이블 초기화
     self.size = new_size
+    self.count = 0
     self.table = [None] * new_size
 
     # 모든 아이템을 새 테이블에 재삽입
@@ -113,8 +281,7 @@ class HashTableSC:
 
   def get_load_factor(self):
     """로드 팩터 계산"""
-    item_count = len(self.get_all_items())
-    return item_count / self.size
+    return self.count / self.size
 
   def get_statistics(self):
     """해시 테이블 통계 정보 반환"""
@@ -220,3 +387,69 @@ if __name__ == "__main__":
       print(f"{key}: {value:.2f}")
     else:
       print(f"{key}: {value}")
+
+  # 점진적 크기 조정 테스트
+  print("\n=== 점진적 크기 조정 테스트 ===")
+  incremental_table = HashTableSC(7, incremental=True, migrate_batch=2)
+  for key, value in items_to_insert:
+    incremental_table.insert(key, value)
+  print("해시 테이블 크기를 7에서 13으로 점진적으로 조정")
+  incremental_table.resize(13)
+  incremental_table.print_table()
+
+  print("\n검색 연산마다 버킷 2개씩 이동")
+  print(f"키 31 검색 결과: {incremental_table.search(31)}")
+  print(f"키 17 검색 결과: {incremental_table.search(17)}")
+  incremental_table.print_table()
+
+  # 연산당 최대 지연 시간 비교 (자동 크기 조정)
+  print("\n=== 삽입 지연 시간 비교 (200000개 삽입, max_load_factor=1.0) ===")
+  import gc
+  import time
+  from array import array
+  gc.disable()  # GC 일시 정지가 크기 조정 비용을 가리지 않도록 함
+  for incremental in (False, True):
+    table = HashTableSC(7, incremental=incremental, max_load_factor=1.0)
+    latencies = []
+    for key in range(200000):
+      start = time.perf_counter()
+      table.insert(key * 7919, key)
+      latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"incremental={incremental}: "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f} us, "
+          f"최대 {latencies[-1] * 1e3:.2f} ms")
+  gc.enable()
+
+  # 일괄 삽입 / 일괄 검색 테스트
+  print("\n=== 일괄 삽입 / 일괄 검색 테스트 (100000개) ===")
+  keys = array('q', (key * 7919 for key in range(100000)))
+  start = time.perf_counter()
+  bulk_table = HashTableSC.from_items((key, key // 7919) for key in keys)
+  print(f"from_items: {time.perf_counter() - start:.2f} s, 크기 {bulk_table.size}")
+
+  start = time.perf_counter()
+  one_by_one = HashTableSC(max_load_factor=1.0)
+  for key in keys:
+    one_by_one.insert(key, key // 7919)
+  print(f"insert 반복: {time.perf_counter() - start:.2f} s, 크기 {one_by_one.size}")
+
+  start = time.perf_counter()
+  values = bulk_table.search_many(keys)
+  print(f"search_many: {time.perf_counter() - start:.2f} s "
+        f"(numpy 사용: {np is not None}), 마지막 값 {values[-1]}")
+
+  start = time.perf_counter()
+  values = [bulk_table.search(key) for key in keys]
+  print(f"search 반복: {time.perf_counter() - start:.2f} s, 마지막 값 {values[-1]}")
+
+  # numpy 배열로 일괄 검색 (해시 계산 벡터화 경로)
+  if np is not None:
+    np_keys = np.array(keys, dtype=np.int64)
+    np_keys[::2] += 1  # 절반은 없는 키
+    np_values = bulk_table.search_many(np_keys)
+    expected = [bulk_table.search(int(key)) for key in np_keys]
+    print(f"search_many(numpy 배열): 결과 일치 {np_values == expected}, "
+          f"찾은 개수 {sum(value is not None for value in np_values)}")
+  else:
+    print("numpy가 없어 numpy 배열 일괄 검색은 건너뜀")
@@ -1,5 +1,18 @@
 # hashTableLP.py - Hash Table with Linear Probing
 
+try:
+  import numpy as np  # 선택 사항: 일괄 검색의 해시 계산을 벡터화
+except ImportError:
+  np = None
+
+
+def _home_indices(keys, size):
+  """키 배치의 시작 슬롯(key % size)을 한 번에 계산"""
+  if np is not None:
+    return (np.asarray(keys, dtype=np.int64) % size).tolist()
+  return [key % size for key in keys]
+
+
 class HashItem:
   """해시 테이블 항목 클래스"""
 
@@ -13,19 +26,110 @@ class HashItem:
 class HashTableLP:
   """Linear Probing 방식의 해시 테이블 클래스"""
 
-  def __init__(self, size=7):
-    """해시 테이블 초기화"""
+  def __init__(self, size=7, incremental=False, migrate_batch=8):
+    """해시 테이블 초기화
+
+    incremental=True이면 크기 조정 시 한 번에 재해시하지 않고 이전 테이블을
+    유지한 채, 매 연산마다 migrate_batch개의 슬롯씩 새 테이블로 옮깁니다.
+    """
     self.size = size
     self.count = 0  # 사용된 항목 수
     self.table = [HashItem() for _ in range(size)]
 
+    # 점진적 크기 조정 상태
+    self.incremental = incremental
+    self.migrate_batch = migrate_batch
+    self._old_table = None   # 옮기는 중인 이전 테이블
+    self._old_count = 0      # 이전 테이블에 남은 항목 수
+    self._migrate_index = 0  # 다음에 옮길 이전 테이블 슬롯
+
+    # 점진적 크기 조정에서 쓰는 공유 슬롯 (직접 수정하지 않음)
+    self._empty_item = HashItem()
+    self._tombstone = HashItem()
+    self._tombstone.is_occupied = True
+    self._tombstone.is_deleted = True
+
   def _hash_function(self, key):
     """해시 함수 (간단한 modulo 연산)"""
     return key % self.size
 
   def get_load_factor(self):
-    """로드 팩터 계산"""
-    return self.count / self.size
+    """로드 팩터 계산 (옮기는 중인 항목 포함)"""
+    return (self.count + self._old_count) / self.size
+
+  def is_resizing(self):
+    """점진적 크기 조정이 진행 중인지 확인"""
+    return self._old_table is not None
+
+  def _start_incremental_resize(self, new_size):
+    """점진적 크기 조정 시작 (새 테이블만 할당하고 이전 테이블은 유지)"""
+    # 이전 조정이 끝나지 않았으면 먼저 마무리
+    self._finish_migration()
+
+    self._old_table = self.table
+    self._old_count = self.count
+    self._migrate_index = 0
+
+    # 빈 슬롯은 하나의 공유 객체로 채워 빠르게 할당 (_store에서 교체)
+    self.size = new_size
+    self.count = 0
+    self.table = [self._empty_item] * new_size
+
+  def _migrate_step(self, batch=None):
+    """이전 테이블의 슬롯을 최대 batch개 새 테이블로 옮김"""
+    if self._old_table is None:
+      return
+
+    old_table = self._old_table
+    end = min(self._migrate_index + (batch or self.migrate_batch), len(old_table))
+
+    for i in range(self._migrate_index, end):
+      item = old_table[i]
+      if not item.is_occupied:
+        old_table[i] = self._empty_item
+        continue
+
+      if not item.is_deleted:
+        # 항목 객체를 그대로 새 테이블로 이동 (키는 새 테이블에 없음이 보장됨)
+        index = self._hash_function(item.key)
+        while self.table[index].is_occupied and not self.table[index].is_deleted:
+          index = (index + 1) % self.size
+        self.table[index] = item
+        self.count += 1
+        self._old_count -= 1
+
+      # 옮긴 슬롯은 공유 삭제 표시로 교체 (이전 테이블의 탐사 체인은 유지)
+      old_table[i] = self._tombstone
+
+    self._migrate_index = end
+    if end >= len(old_table):
+      # 모두 옮겼으면 이전 테이블 해제 (남은 슬롯은 공유 객체뿐이라 해제 비용이 작음)
+      self._old_table = None
+      self._old_count = 0
+
+  def _finish_migration(self):
+    """남은 슬롯을 모두 옮겨 점진적 크기 조정 완료"""
+    if self._old_table is not None:
+      self._migrate_step(len(self._old_table))
+
+  def _find_item(self, table, key):
+    """주어진 테이블에서 키에 해당하는 항목 검색 (없으면 None)"""
+    size = len(table)
+    index = key % size
+    original_index = index
+
+    while table[index].is_occupied:
+      if not table[index].is_deleted and table[index].key == key:
+        return table[index]
+
+      # 다음 슬롯으로 이동
+      index = (index + 1) % size
+
+      # 한 바퀴 돌았으면 종료
+      if index == original_index:
+        break
+
+    return None
 
   def _resize(self, new_size):
     """해시 테이블 크기 조정"""
@@ -45,25 +149,35 @@ class HashTableLP:
 
   def insert(self, key, value):
     """키-값 쌍을 해시 테이블에 삽입"""
+    self._migrate_step()
+
     # 로드 팩터가 0.7을 초과하면 크기를 2배로 증가
     if self.get_load_factor() > 0.7:
-      self._resize(self.size * 2)
+      if self.incremental:
+        self._start_incremental_resize(self.size * 2)
+      else:
+        self._resize(self.size * 2)
 
+    # 아직 옮기지 않은 키는 이전 테이블에서 바로 업데이트
+    if self._old_table is not None:
+      item = self._find_item(self._old_table, key)
+      if item is not None:
+        item.value = value
+        return
+
+    self._store(key, value)
+
+  def _store(self, key, value):
+    """현재 테이블에 키-값 쌍 저장 (크기 조정 없이 선형 탐사)"""
     index = self._hash_function(key)
     original_index = index
+    first_deleted = None  # 처음 만난 삭제된 슬롯 (재사용 후보)
 
-    while True:
-      if not self.table[index].is_occupied or self.table[index].is_deleted:
-        # 빈 슬롯 또는 삭제된 슬롯 발견
-        if not self.table[index].is_occupied:
-          self.count += 1
-
-        self.table[index].key = key
-        self.table[index].value = value
-        self.table[index].is_occupied = True
-        self.table[index].is_deleted = False
-        return
-      elif self.table[index].key == key and not self.table[index].is_deleted:
+    while self.table[index].is_occupied:
+      if self.table[index].is_deleted:
+        if first_deleted is None:
+          first_deleted = index
+      elif self.table[index].key == key:
         # 기존 키 업데이트
         self.table[index].value = value
         return
@@ -71,47 +185,105 @@ class HashTableLP:
       # 다음 슬롯으로 이동 (선형 탐사)
       index = (index + 1) % self.size
 
-      # 테이블이 가득 참 (이론적으로는 발생하지 않아야 함)
+      # 한 바퀴 돌았으면 종료
       if index == original_index:
-        print("해시 테이블이 가득 참")
-        return
+        break
+
+    # 키가 없음이 확인된 뒤에 삭제된 슬롯 또는 빈 슬롯에 저장
+    if first_deleted is not None:
+      index = first_deleted
+    elif self.table[index].is_occupied:
+      # 테이블이 가득 참 (이론적으로는 발생하지 않아야 함)
+      print("해시 테이블이 가득 참")
+      return
+
+    # 빈 슬롯은 공유 객체일 수 있으므로 새 항목으로 교체
+    self.table[index] = HashItem()
+    self.table[index].key = key
+    self.table[index].value = value
+    self.table[index].is_occupied = True
+    self.count += 1
+
+  def bulk_insert(self, items):
+    """여러 키-값 쌍을 한 번에 삽입 (최종 항목 수에 맞춰 미리 크기 조정)"""
+    items = list(items)
+    self._finish_migration()
+
+    # 모두 삽입해도 로드 팩터가 0.7을 넘지 않는 크기로 한 번만 조정
+    needed_size = int((self.count + len(items)) / 0.7) + 1
+    if needed_size > self.size:
+      self._resize(needed_size)
+
+    for key, value in items:
+      self._store(key, value)
+
+  @classmethod
+  def from_items(cls, items, **kwargs):
+    """키-값 쌍들로부터 해시 테이블 생성 (테이블 할당 1회, size는 최소 크기)"""
+    items = list(items)
+    min_size = kwargs.pop('size', 7)
+    hash_table = cls(1, **kwargs)
+
+    # 빈 슬롯은 공유 객체로 채우고 (_store에서 교체) 최종 크기로 한 번만 할당
+    hash_table.size = max(min_size, int(len(items) / 0.7) + 1)
+    hash_table.table = [hash_table._empty_item] * hash_table.size
+    for key, value in items:
+      hash_table._store(key, value)
+    return hash_table
 
   def search(self, key):
     """키에 해당하는 값을 검색"""
-    index = self._hash_function(key)
-    original_index = index
+    self._migrate_step()
 
-    while self.table[index].is_occupied:
-      if not self.table[index].is_deleted and self.table[index].key == key:
-        return self.table[index].value
+    item = self._find_item(self.table, key)
+    if item is None and self._old_table is not None:
+      item = self._find_item(self._old_table, key)
 
-      # 다음 슬롯으로 이동
-      index = (index + 1) % self.size
+    return item.value if item is not None else None  # 키를 찾지 못하면 None
 
-      # 한 바퀴 돌았으면 종료
-      if index == original_index:
-        break
+  def search_many(self, keys):
+    """정수 키 배치(list, array, numpy 배열)를 한 번에 검색하여 값 리스트 반환"""
+    if self._old_table is not None:
+      # 점진적 크기 조정 중에는 두 테이블을 모두 봐야 하므로 하나씩 검색
+      return [self.search(key) for key in keys]
 
-    return None  # 키를 찾지 못함
+    table, size = self.table, self.size
+    results = []
 
-  def delete(self, key):
-    """키를 해시 테이블에서 삭제"""
-    index = self._hash_function(key)
-    original_index = index
+    for key, index in zip(keys, _home_indices(keys, size)):
+      value = None
+      original_index = index
 
-    while self.table[index].is_occupied:
-      if not self.table[index].is_deleted and self.table[index].key == key:
-        # Lazy deletion: 삭제 표시만 함
-        self.table[index].is_deleted = True
-        self.count -= 1
-        return True
+      while table[index].is_occupied:
+        item = table[index]
+        if not item.is_deleted and item.key == key:
+          value = item.value
+          break
+        index = (index + 1) % size
+        if index == original_index:
+          break
 
-      # 다음 슬롯으로 이동
-      index = (index + 1) % self.size
+      results.append(value)
 
-      # 한 바퀴 돌았으면 종료
-      if index == original_index:
-        break
+    return results
+
+  def delete(self, key):
+    """키를 해시 테이블에서 삭제"""
+    self._migrate_step()
+
+    item = self._find_item(self.table, key)
+    if item is not None:
+      # Lazy deletion: 삭제 표시만 함
+      item.is_deleted = True
+      self.count -= 1
+      return True
+
+    if self._old_table is not None:
+      item = self._find_item(self._old_table, key)
+      if item is not None:
+        item.is_deleted = True
+        self._old_count -= 1
+        return True
 
     return False  # 키를 찾지 못함
 
@@ -119,6 +291,9 @@ class HashTableLP:
     """해시 테이블 내용을 출력"""
     print(
         f"해시 테이블 내용 (크기: {self.size}, 사용된 항목: {self.count}, 로드 팩터: {self.get_load_factor():.2f}):")
+    if self._old_table is not None:
+      print(f"(점진적 크기 조정 중: 이전 테이블 {self._migrate_index}/{len(self._old_table)} 슬롯 이동, "
+            f"남은 항목 {self._old_count}개)")
 
     for i in range(self.size):
       print(f"슬롯 {i:2d}: ", end="")
@@ -132,6 +307,7 @@ class HashTableLP:
 
   def cleanup(self):
     """테이블 정리 (삭제된 항목들을 실제로 제거)"""
+    self._finish_migration()
     self._resize(self.size)
 
   def get_statistics(self):
@@ -174,16 +350,20 @@ class HashTableLP:
         print(f"{key}: {value}")
 
   def get_all_items(self):
-    """모든 키-값 쌍을 리스트로 반환"""
+    """모든 키-값 쌍을 리스트로 반환 (옮기는 중인 항목 포함)"""
     items = []
     for item in self.table:
       if item.is_occupied and not item.is_deleted:
         items.append((item.key, item.value))
+    if self._old_table is not None:
+      for item in self._old_table:
+        if item.is_occupied and not item.is_deleted:
+          items.append((item.key, item.value))
     return items
 
   def is_empty(self):
     """해시 테이블이 비어있는지 확인"""
-    return self.count == 0
+    return self.count + self._old_count == 0
 
   def contains_key(self, key):
     """키가 존재하는지 확인"""
@@ -265,3 +445,67 @@ if __name__ == "__main__":
   print(f"키 35가 존재하는가? {hash_table.contains_key(35)}")
   print(f"키 99가 존재하는가? {hash_table.contains_key(99)}")
   print(f"모든 항목: {hash_table.get_all_items()}")
+
+  # 점진적 크기 조정 테스트
+  print("\n=== 점진적 크기 조정 테스트 ===")
+  incremental_table = HashTableLP(7, incremental=True, migrate_batch=2)
+  for key, value in items_to_insert:
+    incremental_table.insert(key, value)
+  incremental_table.print_table()
+
+  print("\n연산마다 슬롯 2개씩 이동")
+  print(f"키 31 검색 결과: {incremental_table.search(31)}")
+  print(f"키 17 검색 결과: {incremental_table.search(17)}")
+  incremental_table.print_table()
+
+  # 연산당 최대 지연 시간 비교
+  print("\n=== 삽입 지연 시간 비교 (200000개 삽입) ===")
+  import gc
+  import time
+  from array import array
+  gc.disable()  # GC 일시 정지가 크기 조정 비용을 가리지 않도록 함
+  for incremental in (False, True):
+    table = HashTableLP(7, incremental=incremental)
+    latencies = []
+    for key in range(200000):
+      start = time.perf_counter()
+      table.insert(key * 7919, key)
+      latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"incremental={incremental}: "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f} us, "
+          f"최대 {latencies[-1] * 1e3:.2f} ms")
+  gc.enable()
+
+  # 일괄 삽입 / 일괄 검색 테스트
+  print("\n=== 일괄 삽입 / 일괄 검색 테스트 (100000개) ===")
+  keys = array('q', (key * 7919 for key in range(100000)))
+  start = time.perf_counter()
+  bulk_table = HashTableLP.from_items((key, key // 7919) for key in keys)
+  print(f"from_items: {time.perf_counter() - start:.2f} s, 크기 {bulk_table.size}")
+
+  start = time.perf_counter()
+  one_by_one = HashTableLP()
+  for key in keys:
+    one_by_one.insert(key, key // 7919)
+  print(f"insert 반복: {time.perf_counter() - start:.2f} s, 크기 {one_by_one.size}")
+
+  start = time.perf_counter()
+  values = bulk_table.search_many(keys)
+  print(f"search_many: {time.perf_counter() - start:.2f} s "
+        f"(numpy 사용: {np is not None}), 마지막 값 {values[-1]}")
+
+  start = time.perf_counter()
+  values = [bulk_table.search(key) for key in keys]
+  print(f"search 반복: {time.perf_counter() - start:.2f} s, 마지막 값 {values[-1]}")
+
+  # numpy 배열로 일괄 검색 (해시 계산 벡터화 경로)
+  if np is not None:
+    np_keys = np.array(keys, dtype=np.int64)
+    np_keys[::2] += 1  # 절반은 없는 키
+    np_values = bulk_table.search_many(np_keys)
+    expected = [bulk_table.search(int(key)) for key in np_keys]
+    print(f"search_many(numpy 배열): 결과 일치 {np_values == expected}, "
+          f"찾은 개수 {sum(value is not None for value in np_values)}")
+  else:
+    print("numpy가 없어 numpy 배열 일괄 검색은 건너뜀")
@@ -0,0 +1,198 @@
+# mappedHashTableLP.py - Memory-mapped persistent Hash Table with Linear Probing
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+
+from hashTableLP import HashTableLP
+
+# 파일 헤더: 매직, 슬롯 수, 항목 수, 값 종류, 값 영역 시작 위치 (little-endian)
+FILE_HEADER = struct.Struct('<4sqqqq')
+FILE_MAGIC = b'HLP1'
+
+# 슬롯 레코드: 상태(0: 빈 슬롯, 1: 사용 중), 키, 값(정수 또는 값 영역 오프셋)
+SLOT_RECORD = struct.Struct('<bxxxxxxxqq')
+BLOB_LENGTH = struct.Struct('<q')
+
+# 값 종류
+VALUE_INT = 0   # 값이 64비트 정수이면 슬롯에 직접 저장
+VALUE_BLOB = 1  # 그 밖의 값은 pickle로 직렬화하여 값 영역에 저장
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def save_table(hash_table, path):
+  """HashTableLP를 고정 레이아웃 이진 파일로 저장 (삭제 표시 없이 다시 배치)"""
+  items = hash_table.get_all_items()
+  size = max(hash_table.size, int(len(items) / 0.7) + 1)
+
+  # 정수 값만 있으면 슬롯에 직접, 아니면 값 영역에 저장
+  if all(type(value) is int and INT64_MIN <= value <= INT64_MAX for _, value in items):
+    value_kind = VALUE_INT
+  else:
+    value_kind = VALUE_BLOB
+
+  # 선형 탐사로 슬롯 위치 결정 (HashTableLP와 같은 key % size 해시 함수)
+  slots = [None] * size
+  for item in items:
+    index = item[0] % size
+    while slots[index] is not None:
+      index = (index + 1) % size
+    slots[index] = item
+
+  blob_offset = FILE_HEADER.size + SLOT_RECORD.size * size
+  blobs = []
+  blob_size = 0
+
+  with open(path, 'wb') as file:
+    file.write(FILE_HEADER.pack(FILE_MAGIC, size, len(items), value_kind, blob_offset))
+
+    records = bytearray(SLOT_RECORD.size * size)
+    for index, item in enumerate(slots):
+      if item is None:
+        continue
+      key, value = item
+      if value_kind == VALUE_BLOB:
+        data = pickle.dumps(value)
+        blobs.append(BLOB_LENGTH.pack(len(data)))
+        blobs.append(data)
+        value = blob_offset + blob_size
+        blob_size += BLOB_LENGTH.size + len(data)
+      SLOT_RECORD.pack_into(records, index * SLOT_RECORD.size, 1, key, value)
+
+    file.write(records)
+    file.write(b''.join(blobs))
+
+
+class MappedHashTableLP:
+  """save_table()로 저장한 파일을 mmap하여 읽기 전용으로 검색하는 해시 테이블 클래스
+
+  파일 전체를 읽어 들이지 않고 필요한 페이지만 운영체제가 읽어 오므로
+  열기는 O(1)이며, 여러 프로세스가 같은 페이지 캐시를 공유합니다.
+  값 영역은 pickle을 사용하므로 신뢰할 수 있는 파일만 열어야 합니다.
+  """
+
+  def __init__(self, path):
+    """파일을 열고 읽기 전용으로 매핑"""
+    with open(path, 'rb') as file:
+      self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    header = FILE_HEADER.unpack_from(self._map, 0)
+    magic, self.size, self.count, self.value_kind, self.blob_offset = header
+    if magic != FILE_MAGIC:
+      self._map.close()
+      raise ValueError(f"Not a hash table file: {path}")
+
+  def close(self):
+    """매핑 해제"""
+    self._map.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+
+  def _find_slot(self, key):
+    """키가 저장된 슬롯의 값 필드 반환 (없으면 None)"""
+    mapped, size = self._map, self.size
+    index = key % size
+    original_index = index
+
+    while True:
+      state, slot_key, value = SLOT_RECORD.unpack_from(
+          mapped, FILE_HEADER.size + index * SLOT_RECORD.size)
+      if state == 0:
+        return None  # 빈 슬롯을 만나면 키가 없음
+      if slot_key == key:
+        return value
+
+      # 다음 슬롯으로 이동 (선형 탐사)
+      index = (index + 1) % size
+      if index == original_index:
+        return None
+
+  def _load_value(self, value):
+    """값 필드를 실제 값으로 변환"""
+    if self.value_kind == VALUE_INT:
+      return value
+    (length,) = BLOB_LENGTH.unpack_from(self._map, value)
+    start = value + BLOB_LENGTH.size
+    return pickle.loads(self._map[start:start + length])
+
+  def search(self, key):
+    """키에 해당하는 값을 검색"""
+    value = self._find_slot(key)
+    return self._load_value(value) if value is not None else None
+
+  def contains_key(self, key):
+    """키가 존재하는지 확인 (값이 None이어도 정확히 판별)"""
+    return self._find_slot(key) is not None
+
+  def get_load_factor(self):
+    """로드 팩터 계산"""
+    return self.count / self.size
+
+  def get_all_items(self):
+    """모든 키-값 쌍을 리스트로 반환"""
+    items = []
+    for state, key, value in SLOT_RECORD.iter_unpack(
+        self._map[FILE_HEADER.size:self.blob_offset]):
+      if state:
+        items.append((key, self._load_value(value)))
+    return items
+
+  def is_empty(self):
+    """해시 테이블이 비어있는지 확인"""
+    return self.count == 0
+
+
+# 사용 예시
+if __name__ == "__main__":
+  print("=== 메모리 매핑 해시 테이블 (Linear Probing) 테스트 ===\n")
+
+  hash_table = HashTableLP(7)
+  items_to_insert = [(10, 100), (22, 220), (31, 310), (4, 40),
+                     (15, 150), (28, 280), (17, 170)]
+  for key, value in items_to_insert:
+    hash_table.insert(key, value)
+  hash_table.delete(22)
+
+  with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "table.hlp")
+    save_table(hash_table, path)
+    print(f"저장한 파일 크기: {os.path.getsize(path)} bytes")
+
+    with MappedHashTableLP(path) as mapped:
+      print(f"크기: {mapped.size}, 항목 수: {mapped.count}, "
+            f"로드 팩터: {mapped.get_load_factor():.2f}")
+      print(f"키 31 검색 결과: {mapped.search(31)}")
+      print(f"키 22가 존재하는가? {mapped.contains_key(22)}")
+      print(f"모든 항목: {mapped.get_all_items()}")
+
+    # 정수가 아닌 값은 값 영역에 저장
+    print("\n=== 정수가 아닌 값 테스트 ===")
+    words = HashTableLP(7)
+    for key, word in enumerate(["apple", "banana", "cherry", None]):
+      words.insert(key, word)
+    save_table(words, path)
+    with MappedHashTableLP(path) as mapped:
+      print(f"키 1 검색 결과: {mapped.search(1)}")
+      print(f"키 3 (값 None)이 존재하는가? {mapped.contains_key(3)}")
+
+    # 시작 시간 비교: 원본 데이터로 다시 만들기 vs 파일 매핑
+    print("\n=== 시작 시간 비교 (200000개) ===")
+    source = [(key * 7919, key) for key in range(200000)]
+
+    start = time.perf_counter()
+    rebuilt = HashTableLP.from_items(source)
+    print(f"원본 데이터로 생성: {time.perf_counter() - start:.3f} s")
+
+    save_table(rebuilt, path)
+    start = time.perf_counter()
+    with MappedHashTableLP(path) as mapped:
+      print(f"파일 매핑으로 열기: {time.perf_counter() - start:.6f} s")
+      print(f"키 {7919 * 12345} 검색 결과: {mapped.search(7919 * 12345)}")
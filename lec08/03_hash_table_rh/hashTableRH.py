@@ -0,0 +1,246 @@
+# hashTableRH.py - Hash Table with Robin Hood Hashing
+
+import random
+from array import array
+
+# Fibonacci hashing 상수 (2^64 / 황금비)
+FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+MASK_64 = (1 << 64) - 1
+
+
+class HashTableRH:
+  """Robin Hood 방식의 개방 주소법 해시 테이블 클래스
+
+  슬롯마다 객체를 만들지 않고 키/값/해시/탐사 거리를 병렬 배열에 저장합니다.
+  - keys, values: 파이썬 리스트 (임의의 hashable 키와 값)
+  - hashes: 키의 hash() 값 (array 'q', 재해시 없이 크기 조정)
+  - distances: 탐사 거리 + 1 (array 'l', 0이면 빈 슬롯)
+  """
+
+  def __init__(self, size=8, max_load_factor=0.9):
+    """해시 테이블 초기화 (크기는 2의 거듭제곱으로 올림)"""
+    if not 0 < max_load_factor < 1:
+      # 1 이상이면 테이블이 가득 차 _place가 빈 슬롯을 찾지 못함
+      raise ValueError("max_load_factor must be between 0 and 1 (exclusive)")
+    self.bits = max(1, (size - 1).bit_length())
+    self.size = 1 << self.bits
+    self.count = 0
+    self.max_load_factor = max_load_factor
+    self._allocate(self.size)
+
+  def _allocate(self, size):
+    """빈 슬롯 배열 할당"""
+    self.keys = [None] * size
+    self.values = [None] * size
+    self.hashes = array('q', [0]) * size
+    self.distances = array('l', [0]) * size
+
+  def _home_index(self, key_hash):
+    """해시 함수 (Fibonacci hashing: 곱셈 후 상위 비트 사용)"""
+    return ((key_hash * FIBONACCI_MULTIPLIER) & MASK_64) >> (64 - self.bits)
+
+  def get_load_factor(self):
+    """로드 팩터 계산"""
+    return self.count / self.size
+
+  def _place(self, key, value, key_hash):
+    """새 키를 Robin Hood 규칙으로 배치 (키가 없다는 것이 보장될 때 사용)"""
+    keys, values = self.keys, self.values
+    hashes, distances = self.hashes, self.distances
+    mask = self.size - 1
+    index = self._home_index(key_hash)
+    distance = 1
+
+    while True:
+      if distances[index] == 0:
+        # 빈 슬롯 발견
+        keys[index], values[index] = key, value
+        hashes[index], distances[index] = key_hash, distance
+        return
+
+      # 기존 항목이 시작 위치에 더 가까우면(덜 가난하면) 자리를 빼앗음
+      if distances[index] < distance:
+        keys[index], key = key, keys[index]
+        values[index], value = value, values[index]
+        hashes[index], key_hash = key_hash, hashes[index]
+        distances[index], distance = distance, distances[index]
+
+      index = (index + 1) & mask
+      distance += 1
+
+  def _find_index(self, key):
+    """키가 저장된 슬롯 인덱스 반환 (없으면 -1)"""
+    key_hash = hash(key)
+    keys, hashes, distances = self.keys, self.hashes, self.distances
+    mask = self.size - 1
+    index = self._home_index(key_hash)
+    distance = 1
+
+    # Robin Hood 불변식: 탐사 거리가 현재 거리보다 짧은 항목을 만나면 키가 없음
+    while distances[index] >= distance:
+      if hashes[index] == key_hash and keys[index] == key:
+        return index
+      index = (index + 1) & mask
+      distance += 1
+
+    return -1
+
+  def _resize(self, new_size):
+    """해시 테이블 크기 조정 (저장된 해시를 재사용하여 바로 배치)"""
+    old_keys, old_values = self.keys, self.values
+    old_hashes, old_distances = self.hashes, self.distances
+
+    self.bits = max(1, (new_size - 1).bit_length())
+    self.size = 1 << self.bits
+    self._allocate(self.size)
+
+    for i in range(len(old_keys)):
+      if old_distances[i]:
+        self._place(old_keys[i], old_values[i], old_hashes[i])
+
+  def insert(self, key, value):
+    """키-값 쌍을 해시 테이블에 삽입"""
+    index = self._find_index(key)
+    if index != -1:
+      # 기존 키 업데이트
+      self.values[index] = value
+      return
+
+    # 로드 팩터가 최대값을 넘거나 빈 슬롯이 없으면 크기를 2배로 증가
+    if ((self.count + 1) / self.size > self.max_load_factor or
+        self.count == self.size):
+      self._resize(self.size * 2)
+
+    self._place(key, value, hash(key))
+    self.count += 1
+
+  def search(self, key):
+    """키에 해당하는 값을 검색"""
+    index = self._find_index(key)
+    return self.values[index] if index != -1 else None
+
+  def delete(self, key):
+    """키를 해시 테이블에서 삭제 (backward-shift deletion, tombstone 없음)"""
+    index = self._find_index(key)
+    if index == -1:
+      return False  # 키를 찾지 못함
+
+    keys, values = self.keys, self.values
+    hashes, distances = self.hashes, self.distances
+    mask = self.size - 1
+    next_index = (index + 1) & mask
+
+    # 뒤따르는 항목들을 시작 위치에 닿을 때까지 한 칸씩 앞으로 당김
+    while distances[next_index] > 1:
+      keys[index], values[index] = keys[next_index], values[next_index]
+      hashes[index] = hashes[next_index]
+      distances[index] = distances[next_index] - 1
+      index = next_index
+      next_index = (next_index + 1) & mask
+
+    keys[index] = values[index] = None
+    hashes[index] = distances[index] = 0
+    self.count -= 1
+    return True
+
+  def print_table(self):
+    """해시 테이블 내용을 출력"""
+    print(f"해시 테이블 내용 (크기: {self.size}, 사용된 항목: {self.count}, "
+          f"로드 팩터: {self.get_load_factor():.2f}):")
+
+    for i in range(self.size):
+      print(f"슬롯 {i:2d}: ", end="")
+
+      if self.distances[i] == 0:
+        print("(비어있음)")
+      else:
+        print(f"[{self.keys[i]}:{self.values[i]}] (탐사 거리 {self.distances[i] - 1})")
+
+  def get_statistics(self):
+    """충돌 통계 계산"""
+    probes = 0
+    max_probes = 0
+
+    for distance in self.distances:
+      if distance:
+        probes += distance - 1
+        max_probes = max(max_probes, distance - 1)
+
+    return {
+        "총 항목 수": self.count,
+        "총 프로브 수": probes,
+        "평균 프로브 수": probes / self.count if self.count > 0 else 0,
+        "최대 프로브 수": max_probes,
+        "로드 팩터": self.get_load_factor()
+    }
+
+  def print_statistics(self):
+    """충돌 통계 출력"""
+    stats = self.get_statistics()
+    print("\n=== 충돌 통계 ===")
+    for key, value in stats.items():
+      if isinstance(value, float):
+        print(f"{key}: {value:.2f}")
+      else:
+        print(f"{key}: {value}")
+
+  def get_all_items(self):
+    """모든 키-값 쌍을 리스트로 반환"""
+    return [(self.keys[i], self.values[i])
+            for i in range(self.size) if self.distances[i]]
+
+  def is_empty(self):
+    """해시 테이블이 비어있는지 확인"""
+    return self.count == 0
+
+  def contains_key(self, key):
+    """키가 존재하는지 확인 (값이 None이어도 정확히 판별)"""
+    return self._find_index(key) != -1
+
+
+# 사용 예시
+if __name__ == "__main__":
+  # 크기 8인 해시 테이블 생성
+  hash_table = HashTableRH(8)
+
+  print("=== 해시 테이블 (Robin Hood Hashing) 테스트 ===\n")
+
+  # 데이터 삽입 (정수 키)
+  print("데이터 삽입: (10,100), (22,220), (31,310), (4,40), (15,150), (28,280), (17,170)")
+  items_to_insert = [(10, 100), (22, 220), (31, 310), (4, 40),
+                     (15, 150), (28, 280), (17, 170)]
+
+  for key, value in items_to_insert:
+    hash_table.insert(key, value)
+
+  hash_table.print_table()
+  hash_table.print_statistics()
+
+  # 검색 테스트
+  print("\n=== 검색 테스트 ===")
+  print(f"키 22 검색 결과: {hash_table.search(22)}")
+  print(f"키 99 검색 결과: {hash_table.search(99)}")
+
+  # 삭제 테스트 (tombstone 없이 뒤 항목을 당겨옴)
+  print("\n=== 삭제 테스트 ===")
+  print(f"키 22 삭제: {hash_table.delete(22)}")
+  print(f"키 99 삭제: {hash_table.delete(99)}")
+  hash_table.print_table()
+
+  # 문자열 등 임의의 hashable 키
+  print("\n=== 임의의 키 테스트 ===")
+  words = HashTableRH(4)
+  for word in ["apple", "banana", "cherry", "date", "elderberry", "fig", "grape"]:
+    words.insert(word, len(word))
+  words.insert(("tuple", 1), "tuple key")
+  words.print_table()
+  print(f"'cherry' 검색 결과: {words.search('cherry')}")
+  print(f"('tuple', 1) 검색 결과: {words.search(('tuple', 1))}")
+
+  # 높은 로드 팩터에서의 탐사 거리
+  print("\n=== 높은 로드 팩터 테스트 (무작위 키 15000개 삽입) ===")
+  random.seed(42)
+  large_table = HashTableRH(16, max_load_factor=0.95)
+  for key in random.sample(range(10 ** 9), 15000):
+    large_table.insert(key, key)
+  large_table.print_statistics()
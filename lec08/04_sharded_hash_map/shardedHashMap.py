@@ -0,0 +1,220 @@
+# shardedHashMap.py - Concurrent Sharded Hash Map built from HashTableSC
+
+import os
+import sys
+import threading
+import time
+
+# HashTableSC를 재사용하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '01_hash_table_sc'))
+from hashTableSC import HashTableSC  # noqa: E402
+
+# Fibonacci hashing 상수 (2^64 / 황금비)
+FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+MASK_64 = (1 << 64) - 1
+
+
+class ShardedHashMap:
+  """여러 개의 HashTableSC 세그먼트로 나눈 스레드 안전 해시 맵 클래스
+
+  키 공간을 num_shards개의 독립된 세그먼트로 나누고 세그먼트마다 잠금을 둡니다.
+  서로 다른 세그먼트에 접근하는 스레드는 서로를 기다리지 않습니다.
+  """
+
+  def __init__(self, num_shards=16, shard_size=7, max_load_factor=1.0):
+    """해시 맵 초기화 (세그먼트 수는 2의 거듭제곱으로 올림)"""
+    if num_shards < 1:
+      raise ValueError("num_shards must be at least 1")
+    # 세그먼트가 하나면 0비트 (_shard_index가 항상 0을 반환)
+    self.bits = (num_shards - 1).bit_length()
+    self.num_shards = 1 << self.bits
+    self.shards = [HashTableSC(shard_size, incremental=True,
+                               max_load_factor=max_load_factor)
+                   for _ in range(self.num_shards)]
+    self.locks = [threading.Lock() for _ in range(self.num_shards)]
+
+  def _shard_index(self, key):
+    """세그먼트 선택 (세그먼트 안의 key % size와 겹치지 않도록 상위 비트 사용)"""
+    return ((key * FIBONACCI_MULTIPLIER) & MASK_64) >> (64 - self.bits)
+
+  def insert(self, key, value):
+    """키-값 쌍을 해시 맵에 삽입"""
+    index = self._shard_index(key)
+    with self.locks[index]:
+      self.shards[index].insert(key, value)
+
+  def search(self, key):
+    """키에 해당하는 값을 검색"""
+    index = self._shard_index(key)
+    with self.locks[index]:
+      return self.shards[index].search(key)
+
+  def delete(self, key):
+    """키를 해시 맵에서 삭제"""
+    index = self._shard_index(key)
+    with self.locks[index]:
+      return self.shards[index].delete(key)
+
+  def contains_key(self, key):
+    """키가 존재하는지 확인"""
+    return self.search(key) is not None
+
+  def _group_by_shard(self, keys):
+    """키들을 세그먼트별로 묶음: {세그먼트 번호: [(원래 위치, 키), ...]}"""
+    groups = {}
+    for position, key in enumerate(keys):
+      groups.setdefault(self._shard_index(key), []).append((position, key))
+    return groups
+
+  def get_many(self, keys):
+    """여러 키를 한 번에 검색 (세그먼트마다 잠금을 한 번만 획득)"""
+    keys = list(keys)
+    results = [None] * len(keys)
+
+    # 세그먼트 번호 순서로 하나씩 잠그므로 교착 상태가 생기지 않음
+    for index, group in sorted(self._group_by_shard(keys).items()):
+      shard = self.shards[index]
+      with self.locks[index]:
+        for position, key in group:
+          results[position] = shard.search(key)
+
+    return results
+
+  def put_many(self, items):
+    """여러 키-값 쌍을 한 번에 삽입 (세그먼트마다 잠금을 한 번만 획득)"""
+    items = list(items)
+    groups = self._group_by_shard(key for key, _ in items)
+
+    for index, group in sorted(groups.items()):
+      shard = self.shards[index]
+      with self.locks[index]:
+        for position, key in group:
+          shard.insert(key, items[position][1])
+
+  def get_all_items(self):
+    """모든 키-값 쌍을 리스트로 반환 (세그먼트별 스냅샷)"""
+    items = []
+    for index, shard in enumerate(self.shards):
+      with self.locks[index]:
+        items.extend(shard.get_all_items())
+    return items
+
+  def size(self):
+    """저장된 항목 수"""
+    total = 0
+    for index, shard in enumerate(self.shards):
+      with self.locks[index]:
+        total += shard.count
+    return total
+
+  def is_empty(self):
+    """해시 맵이 비어있는지 확인"""
+    return self.size() == 0
+
+  def get_statistics(self):
+    """세그먼트 분포 통계 계산"""
+    counts = []
+    for index, shard in enumerate(self.shards):
+      with self.locks[index]:
+        counts.append(shard.count)
+
+    total = sum(counts)
+    return {
+        "세그먼트 수": self.num_shards,
+        "총 항목 수": total,
+        "최소 세그먼트 항목 수": min(counts),
+        "최대 세그먼트 항목 수": max(counts),
+        "평균 세그먼트 항목 수": total / self.num_shards
+    }
+
+  def print_statistics(self):
+    """세그먼트 분포 통계 출력"""
+    stats = self.get_statistics()
+    print("\n=== 세그먼트 통계 ===")
+    for key, value in stats.items():
+      if isinstance(value, float):
+        print(f"{key}: {value:.2f}")
+      else:
+        print(f"{key}: {value}")
+
+
+class LockedHashTable:
+  """비교용: 하나의 전역 잠금으로 HashTableSC 전체를 보호하는 클래스"""
+
+  def __init__(self, size=7, max_load_factor=1.0):
+    self.table = HashTableSC(size, incremental=True, max_load_factor=max_load_factor)
+    self.lock = threading.Lock()
+
+  def insert(self, key, value):
+    with self.lock:
+      self.table.insert(key, value)
+
+  def search(self, key):
+    with self.lock:
+      return self.table.search(key)
+
+
+def run_workers(table, num_threads, operations):
+  """여러 스레드가 삽입/검색을 섞어 수행하고 걸린 시간을 반환"""
+
+  def worker(thread_id):
+    base = thread_id * operations
+    for i in range(operations):
+      key = (base + i) * 7919
+      table.insert(key, i)
+      table.search(key)
+
+  threads = [threading.Thread(target=worker, args=(t,)) for t in range(num_threads)]
+  start = time.perf_counter()
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  return time.perf_counter() - start
+
+
+# 사용 예시
+if __name__ == "__main__":
+  # 세그먼트 4개인 해시 맵 생성
+  sharded_map = ShardedHashMap(num_shards=4)
+
+  print("=== 세그먼트 해시 맵 (Sharded HashTableSC) 테스트 ===\n")
+
+  # 데이터 삽입
+  print("데이터 삽입: (10,100), (22,220), (31,310), (4,40), (15,150), (28,280), (17,170)")
+  items_to_insert = [(10, 100), (22, 220), (31, 310), (4, 40),
+                     (15, 150), (28, 280), (17, 170)]
+
+  for key, value in items_to_insert:
+    sharded_map.insert(key, value)
+
+  for index, shard in enumerate(sharded_map.shards):
+    print(f"\n세그먼트 {index}:")
+    shard.print_table()
+
+  # 검색/삭제 테스트
+  print("\n=== 검색/삭제 테스트 ===")
+  print(f"키 22 검색 결과: {sharded_map.search(22)}")
+  print(f"키 99 검색 결과: {sharded_map.search(99)}")
+  print(f"키 22 삭제: {sharded_map.delete(22)}")
+  print(f"키 22가 존재하는가? {sharded_map.contains_key(22)}")
+
+  # 일괄 처리 테스트
+  print("\n=== 일괄 처리 테스트 ===")
+  sharded_map.put_many([(100 + i, i * i) for i in range(10)])
+  print(f"get_many([100, 105, 109, 999]): {sharded_map.get_many([100, 105, 109, 999])}")
+  print(f"저장된 항목 수: {sharded_map.size()}")
+
+  # 여러 스레드 동시 접근 테스트
+  print("\n=== 스레드 동시 접근 테스트 (스레드 4개 x 20000회 삽입/검색) ===")
+  num_threads, operations = 4, 20000
+
+  concurrent_map = ShardedHashMap(num_shards=16)
+  elapsed = run_workers(concurrent_map, num_threads, operations)
+  print(f"세그먼트 잠금 16개: {elapsed:.2f} s, 항목 수 {concurrent_map.size()}")
+  concurrent_map.print_statistics()
+
+  locked_table = LockedHashTable()
+  elapsed = run_workers(locked_table, num_threads, operations)
+  print(f"\n전역 잠금 1개: {elapsed:.2f} s, 항목 수 {locked_table.table.count}")
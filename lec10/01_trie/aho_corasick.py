@@ -0,0 +1,266 @@
+# aho_corasick.py
+
+import random
+import time
+from array import array
+from bisect import bisect_left
+
+from trie import Trie
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick 다중 패턴 검색 오토마톤
+
+    Trie에 저장된 모든 단어를 텍스트에서 한 번의 선형 스캔으로 찾습니다.
+    - goto: Trie 간선 (상태별 간선을 하나의 정렬된 배열 구간에 저장, 이진 탐색)
+    - fail: 현재 문자열의 가장 긴 진접미사(proper suffix)에 해당하는 상태
+    - output: fail 링크를 따라가며 만나는 가장 가까운 단어 끝 상태
+
+    시간 복잡도:
+    - 생성: O(M log K) where M is total length of patterns, K is alphabet size
+    - 검색: O(n log K + z) where n is text length, z is number of matches
+    공간 복잡도: O(M)
+    """
+
+    ROOT = 0
+    NONE = -1
+
+    def __init__(self, trie):
+        """
+        Trie에서 오토마톤 생성
+
+        Args:
+            trie (Trie): 찾을 단어들이 저장된 Trie
+        """
+        # 등장하는 문자만으로 조밀한 코드 부여
+        chars = set()
+        stack = [trie.root]
+        while stack:
+            node = stack.pop()
+            chars.update(node.children)
+            stack.extend(node.children.values())
+        self.codes = {char: code for code, char in enumerate(sorted(chars))}
+
+        self.edge_start = array('l')   # 상태 s의 간선은 [edge_start[s], edge_start[s + 1])
+        self.edge_codes = array('l')
+        self.edge_targets = array('l')
+        self.fail = array('l', [self.ROOT])
+        self.output = array('l', [self.NONE])
+        self.words = [None]             # 상태별 단어 (단어 끝이 아니면 None)
+        self.values = [0]
+
+        # 너비 우선으로 상태 번호를 매기고 간선과 실패 링크 구성
+        queue = [(trie.root, "")]
+        for state, (node, word) in enumerate(queue):
+            self.edge_start.append(len(self.edge_codes))
+            for char in sorted(node.children):
+                child = node.children[char]
+                target = len(queue)
+                queue.append((child, word + char))
+                self.edge_codes.append(self.codes[char])
+                self.edge_targets.append(target)
+
+                self.words.append(word + char if child.has_value else None)
+                self.values.append(child.value if child.has_value else 0)
+
+                # 실패 링크: 부모의 실패 링크를 따라가며 같은 문자로 이동할 수 있는 상태
+                fail = self.ROOT
+                if state != self.ROOT:
+                    fail = self.fail[state]
+                    while True:
+                        next_state = self._goto(fail, self.codes[char])
+                        if next_state != self.NONE:
+                            fail = next_state
+                            break
+                        if fail == self.ROOT:
+                            break
+                        fail = self.fail[fail]
+                self.fail.append(fail)
+
+                # 출력 링크: 실패 링크가 단어 끝이면 그 상태, 아니면 그 상태의 출력 링크
+                if self.words[fail] is not None:
+                    self.output.append(fail)
+                else:
+                    self.output.append(self.output[fail])
+        self.edge_start.append(len(self.edge_codes))
+
+        # 루트 전이는 가장 자주 쓰이므로 문자별로 바로 찾을 수 있게 저장
+        self.root_goto = [self._goto(self.ROOT, code)
+                          for code in range(len(self.codes))]
+
+        self.reset()
+
+    def _goto(self, state, code):
+        """
+        Trie 간선을 따라 이동
+
+        Args:
+            state (int): 현재 상태
+            code (int): 문자 코드
+
+        Returns:
+            int: 다음 상태 (간선이 없으면 -1)
+        """
+        low, high = self.edge_start[state], self.edge_start[state + 1]
+        index = bisect_left(self.edge_codes, code, low, high)
+        if index < high and self.edge_codes[index] == code:
+            return self.edge_targets[index]
+        return self.NONE
+
+    def reset(self):
+        """스트림 상태 초기화 (새 텍스트를 검색하기 전에 호출)"""
+        self.state = self.ROOT
+        self.offset = 0
+
+    def feed(self, chunk):
+        """
+        텍스트 조각을 이어서 검색 (조각 경계에 걸친 단어도 찾음)
+
+        Args:
+            chunk (str): 이어지는 텍스트 조각
+
+        Returns:
+            list: (시작 위치, 단어, 값) 튜플의 리스트 (위치는 스트림 전체 기준)
+        """
+        matches = []
+        codes = self.codes
+        fail, output, words, values = self.fail, self.output, self.words, self.values
+        root_goto = self.root_goto
+        state = self.state
+        end = self.offset
+
+        for char in chunk:
+            end += 1
+            code = codes.get(char)
+            if code is None:
+                # 어떤 단어에도 없는 문자이므로 루트로 돌아감
+                state = self.ROOT
+                continue
+
+            while True:
+                if state == self.ROOT:
+                    state = root_goto[code]
+                    if state == self.NONE:
+                        state = self.ROOT
+                    break
+                next_state = self._goto(state, code)
+                if next_state != self.NONE:
+                    state = next_state
+                    break
+                state = fail[state]
+
+            # 현재 상태와 출력 링크로 이어진 상태들이 모두 여기서 끝나는 단어
+            match = state if words[state] is not None else output[state]
+            while match != self.NONE:
+                word = words[match]
+                matches.append((end - len(word), word, values[match]))
+                match = output[match]
+
+        self.state = state
+        self.offset = end
+        return matches
+
+    def find_all(self, text):
+        """
+        텍스트 전체에서 모든 단어의 등장 위치 찾기
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            list: (시작 위치, 단어, 값) 튜플의 리스트
+        """
+        self.reset()
+        matches = self.feed(text)
+        self.reset()
+        return matches
+
+    def state_count(self):
+        """
+        상태 개수 반환
+
+        Returns:
+            int: 상태 개수
+        """
+        return len(self.fail)
+
+
+def naive_find_all(trie, text):
+    """
+    단어마다 텍스트 전체를 검색하는 단순 방법 (비교용)
+
+    Args:
+        trie (Trie): 찾을 단어들이 저장된 Trie
+        text (str): 검색할 텍스트
+
+    Returns:
+        list: (시작 위치, 단어, 값) 튜플의 리스트
+    """
+    matches = []
+    for word, value in trie.get_all_words():
+        position = text.find(word)
+        while position != -1:
+            matches.append((position, word, value))
+            position = text.find(word, position + 1)
+    return matches
+
+
+def test_aho_corasick():
+    """테스트 함수"""
+    print("=== Aho-Corasick 다중 패턴 검색 테스트 ===\n")
+
+    trie = Trie()
+    words = ["he", "she", "his", "hers", "error", "err", "timeout"]
+    for value, word in enumerate(words):
+        trie.insert(word, value)
+
+    automaton = AhoCorasick(trie)
+    print(f"상태 개수: {automaton.state_count()}")
+
+    text = "ushers said his error was a timeout"
+    print(f"텍스트: {text}")
+    for start, word, value in automaton.find_all(text):
+        print(f"  위치 {start}: {word} (값: {value})")
+    print()
+
+    # 조각으로 나누어 들어오는 스트림 (경계에 걸친 단어도 찾음)
+    print("=== 스트리밍 검색 테스트 ===")
+    chunks = ["ush", "ers said his er", "ror was a time", "out"]
+    automaton.reset()
+    for chunk in chunks:
+        matches = automaton.feed(chunk)
+        print(f"조각 '{chunk}': {[(start, word) for start, word, _ in matches]}")
+    print()
+
+    # 많은 키워드로 로그 검색
+    print("=== 성능 비교 (키워드 5000개, 로그 200000자) ===")
+    random.seed(42)
+    keywords = Trie()
+    for i in range(5000):
+        length = random.randint(4, 8)
+        keywords.insert("".join(random.choice("abcdefgh") for _ in range(length)), i)
+    log = "".join(random.choice("abcdefgh ") for _ in range(200000))
+
+    start = time.perf_counter()
+    large_automaton = AhoCorasick(keywords)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = large_automaton.find_all(log)
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slow = naive_find_all(keywords, log)
+    naive_time = time.perf_counter() - start
+
+    print(f"오토마톤 생성: {build_time * 1000:.1f} ms ({large_automaton.state_count()}개 상태)")
+    print(f"Aho-Corasick 검색: {scan_time * 1000:.1f} ms, 찾은 개수: {len(fast)}")
+    print(f"키워드별 검색: {naive_time * 1000:.1f} ms, 찾은 개수: {len(slow)}")
+    print(f"결과가 같은가: {sorted(fast) == sorted(slow)}")
+
+    print("\n테스트 완료")
+
+
+if __name__ == "__main__":
+    test_aho_corasick()
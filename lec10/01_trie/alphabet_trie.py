@@ -0,0 +1,484 @@
+# alphabet_trie.py
+
+import sys
+from array import array
+from bisect import bisect_left
+
+from trie import Trie
+from double_array_trie import trie_memory_bytes
+
+
+class Alphabet:
+    """
+    문자 -> 조밀한 정수 코드 매핑
+
+    처음 등장한 순서대로 0, 1, 2, ... 코드를 부여하므로 한글처럼 코드 포인트가 큰 문자도
+    작은 정수로 표현됩니다. 문자(str의 한 글자) 또는 한 바이트(길이 1인 bytes)를 다룹니다.
+    """
+
+    def __init__(self, symbols=()):
+        """
+        Alphabet 초기화
+
+        Args:
+            symbols (iterable): 미리 등록할 문자들 (정렬된 순서로 코드 부여)
+        """
+        self.codes = {}
+        self.symbols = []
+        for symbol in sorted(set(symbols)):
+            self.add(symbol)
+
+    def add(self, symbol):
+        """
+        문자를 등록하고 코드 반환 (이미 있으면 기존 코드)
+
+        Args:
+            symbol (str | bytes): 등록할 문자
+
+        Returns:
+            int: 문자 코드
+        """
+        code = self.codes.get(symbol)
+        if code is None:
+            code = len(self.symbols)
+            self.codes[symbol] = code
+            self.symbols.append(symbol)
+        return code
+
+    def encode(self, symbols, add=False):
+        """
+        문자열을 코드 리스트로 변환
+
+        Args:
+            symbols (iterable): 문자들
+            add (bool): 처음 보는 문자를 등록할지 여부
+
+        Returns:
+            list: 코드 리스트 (add=False이고 모르는 문자가 있으면 None)
+        """
+        if add:
+            return [self.add(symbol) for symbol in symbols]
+
+        codes = []
+        for symbol in symbols:
+            code = self.codes.get(symbol)
+            if code is None:
+                return None
+            codes.append(code)
+        return codes
+
+    def __len__(self):
+        return len(self.symbols)
+
+
+class AlphabetTrieNode:
+    """
+    Alphabet Trie 노드 클래스
+
+    딕셔너리 대신 정렬된 코드 배열과 같은 순서의 자식 리스트를 사용 (이진 탐색으로 찾음)
+    - codes: 자식 문자 코드의 정렬된 배열 (자식이 없으면 None)
+    - children: codes와 같은 순서의 자식 노드 리스트 (자식이 없으면 None)
+    - has_value: 값이 저장되어 있는지 확인
+    - value: 실제 저장할 값
+    """
+
+    __slots__ = ("codes", "children", "has_value", "value")
+
+    def __init__(self):
+        self.codes = None
+        self.children = None
+        self.has_value = False
+        self.value = 0
+
+    def get_child(self, code):
+        """
+        코드에 해당하는 자식 노드 반환
+
+        Args:
+            code (int): 문자 코드
+
+        Returns:
+            AlphabetTrieNode: 자식 노드 (없으면 None)
+        """
+        codes = self.codes
+        if codes is None:
+            return None
+        index = bisect_left(codes, code)
+        if index < len(codes) and codes[index] == code:
+            return self.children[index]
+        return None
+
+    def add_child(self, code):
+        """
+        코드에 해당하는 자식 노드를 만들어 정렬 순서에 맞게 추가
+
+        Args:
+            code (int): 문자 코드
+
+        Returns:
+            AlphabetTrieNode: 새 자식 노드
+        """
+        child = AlphabetTrieNode()
+        if self.codes is None:
+            self.codes = array('I', [code])
+            self.children = [child]
+        else:
+            index = bisect_left(self.codes, code)
+            self.codes.insert(index, code)
+            self.children.insert(index, child)
+        return child
+
+    def remove_child(self, code):
+        """
+        코드에 해당하는 자식 노드 제거
+
+        Args:
+            code (int): 문자 코드
+        """
+        index = bisect_left(self.codes, code)
+        del self.codes[index]
+        del self.children[index]
+        if not self.children:
+            self.codes = None
+            self.children = None
+
+
+class AlphabetTrie:
+    """
+    임의의 유니코드 문자열 또는 바이트열을 키로 사용하는 Trie
+
+    문자를 Alphabet으로 조밀한 정수 코드로 바꾸고, 노드마다 딕셔너리 대신
+    정렬된 코드 배열에 자식을 저장하여 한글, 대소문자 혼합 키에서도 메모리를 아낍니다.
+    한 Trie에는 str 키와 bytes 키 중 한 종류만 저장할 수 있습니다.
+
+    시간 복잡도:
+    - 삽입/삭제: O(m * K) where m is the length of the word, K is number of children
+    - 검색: O(m log K)
+    공간 복잡도: O(N * M) where N is number of words, M is average length
+    """
+
+    def __init__(self, alphabet=None):
+        """
+        Alphabet Trie 초기화
+
+        Args:
+            alphabet (Alphabet): 사용할 문자 매핑 (None이면 새로 생성)
+        """
+        self.root = AlphabetTrieNode()
+        self.alphabet = alphabet if alphabet is not None else Alphabet()
+        self.empty_key = None  # 첫 삽입에서 "" 또는 b""로 정해짐
+        self.count = 0
+
+    def _symbols(self, key):
+        """
+        키를 문자들의 시퀀스로 변환 (bytes는 길이 1인 bytes들로 나눔)
+
+        Args:
+            key (str | bytes): 변환할 키
+
+        Returns:
+            sequence: 문자 시퀀스 (키 종류가 맞지 않으면 None)
+        """
+        if self.empty_key is not None and type(key) is not type(self.empty_key):
+            return None
+        if isinstance(key, str):
+            return key
+        if isinstance(key, bytes):
+            return [key[i:i + 1] for i in range(len(key))]
+        return None
+
+    def insert(self, word, value):
+        """
+        Alphabet Trie에 단어와 값을 삽입
+
+        Args:
+            word (str | bytes): 삽입할 단어 (비어있지 않은 문자열 또는 바이트열)
+            value (int): 저장할 값
+
+        Returns:
+            bool: 성공하면 True, 실패하면 False
+        """
+        if not word:
+            return False
+        symbols = self._symbols(word)
+        if symbols is None:
+            return False
+
+        if self.empty_key is None:
+            self.empty_key = word[:0]
+
+        current = self.root
+        for code in self.alphabet.encode(symbols, add=True):
+            child = current.get_child(code)
+            if child is None:
+                child = current.add_child(code)
+            current = child
+
+        if not current.has_value:
+            self.count += 1
+        current.has_value = True
+        current.value = value
+        return True
+
+    def _find_node(self, word):
+        """
+        word 경로의 마지막 노드 찾기
+
+        Args:
+            word (str | bytes): 찾을 문자열
+
+        Returns:
+            AlphabetTrieNode: 해당 노드 (없으면 None)
+        """
+        symbols = self._symbols(word)
+        if symbols is None:
+            return None
+        codes = self.alphabet.encode(symbols)
+        if codes is None:
+            return None  # 한 번도 등장하지 않은 문자
+
+        current = self.root
+        for code in codes:
+            current = current.get_child(code)
+            if current is None:
+                return None
+        return current
+
+    def search(self, word):
+        """
+        Alphabet Trie에서 단어 검색
+
+        Args:
+            word (str | bytes): 검색할 단어
+
+        Returns:
+            int: 값이 있으면 해당 값, 없으면 -1
+        """
+        if not word:
+            return -1
+
+        node = self._find_node(word)
+        if node is not None and node.has_value:
+            return node.value
+        return -1
+
+    def starts_with(self, prefix):
+        """
+        주어진 prefix로 시작하는 단어들이 있는지 확인
+
+        Args:
+            prefix (str | bytes): 검색할 접두사
+
+        Returns:
+            bool: 존재하면 True, 없으면 False
+        """
+        if not prefix:
+            return True
+        return self._find_node(prefix) is not None
+
+    def delete(self, word):
+        """
+        Alphabet Trie에서 단어 삭제 (필요 없어진 노드도 제거)
+
+        Args:
+            word (str | bytes): 삭제할 단어
+
+        Returns:
+            bool: 성공하면 True, 실패하면 False
+        """
+        if not word:
+            return False
+        symbols = self._symbols(word)
+        if symbols is None:
+            return False
+        codes = self.alphabet.encode(symbols)
+        if codes is None:
+            return False
+
+        path = []  # (부모 노드, 자식 코드)
+        current = self.root
+        for code in codes:
+            child = current.get_child(code)
+            if child is None:
+                return False
+            path.append((current, code))
+            current = child
+
+        if not current.has_value:
+            return False
+
+        current.has_value = False
+        current.value = 0
+        self.count -= 1
+
+        # 값도 자식도 없는 노드를 아래에서부터 제거
+        for parent, code in reversed(path):
+            if current.has_value or current.children is not None:
+                break
+            parent.remove_child(code)
+            current = parent
+
+        return True
+
+    def _collect(self, node, prefix, results):
+        """
+        주어진 노드 이하의 모든 단어를 사전 순으로 수집 (반복문)
+
+        Args:
+            node (AlphabetTrieNode): 시작 노드
+            prefix (str | bytes): 시작 노드까지의 문자열
+            results (list): 결과를 저장할 리스트
+        """
+        symbols = self.alphabet.symbols
+        stack = [(node, prefix)]
+
+        while stack:
+            node, word = stack.pop()
+            if node.has_value:
+                results.append((word, node.value))
+            if node.children is None:
+                continue
+
+            # 코드는 등장 순서로 부여되므로 문자 기준으로 정렬해서 방문
+            entries = sorted(zip(node.codes, node.children),
+                             key=lambda entry: symbols[entry[0]], reverse=True)
+            for code, child in entries:
+                stack.append((child, word + symbols[code]))
+
+    def get_all_words(self):
+        """
+        Alphabet Trie의 모든 단어와 값을 반환
+
+        Returns:
+            list: (단어, 값) 튜플의 리스트
+        """
+        results = []
+        if self.empty_key is not None:
+            self._collect(self.root, self.empty_key, results)
+        return results
+
+    def get_words_with_prefix(self, prefix):
+        """
+        주어진 접두사로 시작하는 모든 단어와 값을 반환
+
+        Args:
+            prefix (str | bytes): 검색할 접두사
+
+        Returns:
+            list: (단어, 값) 튜플의 리스트
+        """
+        if not prefix:
+            return self.get_all_words()
+
+        results = []
+        node = self._find_node(prefix)
+        if node is not None:
+            self._collect(node, prefix, results)
+        return results
+
+    def size(self):
+        """
+        Alphabet Trie에 저장된 단어의 개수 반환
+
+        Returns:
+            int: 저장된 단어의 개수
+        """
+        return self.count
+
+    def is_empty(self):
+        """
+        Alphabet Trie가 비어있는지 확인
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return self.count == 0
+
+    def memory_bytes(self):
+        """
+        노드 객체와 자식 배열/리스트가 차지하는 대략적인 바이트 수
+
+        Returns:
+            int: 바이트 수
+        """
+        total = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            total += sys.getsizeof(node)
+            if node.children is not None:
+                total += sys.getsizeof(node.codes) + sys.getsizeof(node.children)
+                stack.extend(node.children)
+        return total
+
+
+def test_alphabet_trie():
+    """테스트 함수"""
+    print("=== Alphabet Trie (유니코드 키) 테스트 ===\n")
+
+    trie = AlphabetTrie()
+    test_words = [
+        ("사과", 10), ("사과나무", 20), ("사람", 5), ("바나나", 15),
+        ("Apple", 30), ("apple", 35), ("iPhone 15", 40), ("iPad", 45)
+    ]
+
+    print("=== 단어 삽입 테스트 ===")
+    for word, value in test_words:
+        success = trie.insert(word, value)
+        print(f"삽입: {word} (값: {value}) - {'성공' if success else '실패'}")
+    print(f"문자 집합 크기: {len(trie.alphabet)}")
+    print()
+
+    print("=== 검색 테스트 ===")
+    for word in ["사과", "사과나", "Apple", "APPLE", "iPhone 15", "포도"]:
+        result = trie.search(word)
+        if result != -1:
+            print(f"검색: {word} -> 찾음, 값: {result}")
+        else:
+            print(f"검색: {word} -> 없음")
+    print()
+
+    print("=== 접두사 검색 테스트 ===")
+    for prefix in ["사", "사과", "i", "A", "포"]:
+        words = trie.get_words_with_prefix(prefix)
+        word_strs = [f"{word}({value})" for word, value in words]
+        print(f"'{prefix}'로 시작하는 단어들: {', '.join(word_strs) if words else '없음'}")
+    print()
+
+    print("=== 삭제 테스트 ===")
+    for word in ["사과", "iPad"]:
+        trie.delete(word)
+        print(f"'{word}' 삭제 후 검색: {trie.search(word)}")
+    print(f"남은 단어들: {trie.get_all_words()}")
+    print()
+
+    print("=== 바이트열 키 테스트 ===")
+    byte_trie = AlphabetTrie()
+    for value, word in enumerate(["한글".encode("utf-8"), b"\x00\xff", b"abc"]):
+        byte_trie.insert(word, value)
+    print(f"모든 키: {byte_trie.get_all_words()}")
+    print(f"str 키 삽입 (종류가 다름): {byte_trie.insert('abc', 9)}")
+    print()
+
+    # 같은 단어 집합에서 메모리 비교 (Trie는 소문자만 허용하므로 소문자 단어 사용)
+    print("=== 메모리 비교 (사전 순 단어 20000개) ===")
+    words = []
+    for first in "abcdefghijklmnopqrst":
+        for second in "abcdefghijklmnopqrstuvwxy":
+            for third in "abcdefghijklmnopqrstuvwxyz":
+                if len(words) < 20000:
+                    words.append(first + second + third + "ing")
+    plain = Trie()
+    compact = AlphabetTrie()
+    for value, word in enumerate(words):
+        plain.insert(word, value)
+        compact.insert(word, value)
+    print(f"Trie (딕셔너리 자식): 약 {trie_memory_bytes(plain) / 1e6:.2f} MB")
+    print(f"Alphabet Trie (정렬된 배열 자식): 약 {compact.memory_bytes() / 1e6:.2f} MB")
+    print(f"모든 단어와 값이 같은가: {compact.get_all_words() == plain.get_all_words()}")
+
+    print("\n테스트 완료")
+
+
+if __name__ == "__main__":
+    test_alphabet_trie()
@@ -0,0 +1,362 @@
+# double_array_trie.py
+
+import random
+import sys
+from array import array
+
+from trie import Trie
+
+
+class DoubleArrayTrie:
+    """
+    Double-Array Trie (읽기 전용) 구현
+
+    완성된 Trie를 고정(freeze)하여 노드 객체와 딕셔너리 없이 정수 배열만으로 표현합니다.
+    - base[s] + code(c) = t 이고 check[t] == s 이면 상태 s에서 문자 c로 t에 전이
+    - values[t], terminal[t]: 상태 t에서 끝나는 단어의 값과 존재 여부
+
+    시간 복잡도:
+    - 검색/접두사 확인: O(m) where m is the length of the word (전이마다 배열 접근 2번)
+    - 생성: O(N * K) where N is number of nodes, K is alphabet size
+    공간 복잡도: O(N) - 상태당 정수 몇 개
+    """
+
+    ROOT = 0
+    EMPTY = -1
+    MAX_PROBES = 32  # 노드 하나를 배치할 때 확인하는 최대 빈 칸 수
+
+    def __init__(self, alphabet, base, check, values, terminal):
+        """
+        Double-Array Trie 초기화 (from_trie()로 생성)
+
+        Args:
+            alphabet (str): 정렬된 문자 집합 (문자 코드는 위치 + 1)
+            base (array): 상태별 자식 배치 시작 위치
+            check (array): 상태별 부모 상태 (EMPTY면 빈 칸)
+            values (array): 상태별 값
+            terminal (bytearray): 상태별 단어 끝 여부
+        """
+        self.alphabet = alphabet
+        self.codes = {char: code for code, char in enumerate(alphabet, 1)}
+        self.base = base
+        self.check = check
+        self.values = values
+        self.terminal = terminal
+
+    @classmethod
+    def from_trie(cls, trie):
+        """
+        Trie를 Double-Array Trie로 변환
+
+        Args:
+            trie (Trie): 변환할 Trie
+
+        Returns:
+            DoubleArrayTrie: 고정된 Trie
+        """
+        # 1. 등장하는 문자만으로 조밀한 코드 부여 (정렬 순서 유지)
+        chars = set()
+        stack = [trie.root]
+        while stack:
+            node = stack.pop()
+            chars.update(node.children)
+            stack.extend(node.children.values())
+        alphabet = "".join(sorted(chars))
+        codes = {char: code for code, char in enumerate(alphabet, 1)}
+
+        base = array('l', [0])
+        check = array('l', [cls.ROOT])  # 루트 칸은 사용 중으로 표시
+        values = array('q', [0])
+        terminal = bytearray(1)
+
+        # 빈 칸들의 이중 연결 리스트 (사용 중인 칸을 건너뛰며 빈 칸만 탐색)
+        next_free = array('l', [-1])
+        prev_free = array('l', [-1])
+        free = [-1, -1]  # [첫 빈 칸, 마지막 빈 칸]
+
+        def ensure(size):
+            """배열을 size칸 이상으로 확장하고 새 칸들을 빈 칸 리스트 끝에 연결"""
+            for position in range(len(check), size):
+                base.append(0)
+                check.append(cls.EMPTY)
+                values.append(0)
+                terminal.append(0)
+                next_free.append(-1)
+                prev_free.append(free[1])
+                if free[1] >= 0:
+                    next_free[free[1]] = position
+                else:
+                    free[0] = position
+                free[1] = position
+
+        def occupy(position, parent):
+            """빈 칸을 사용 중으로 표시하고 빈 칸 리스트에서 제거"""
+            check[position] = parent
+            before, after = prev_free[position], next_free[position]
+            if before >= 0:
+                next_free[before] = after
+            else:
+                free[0] = after
+            if after >= 0:
+                prev_free[after] = before
+            else:
+                free[1] = before
+
+        # 2. 너비 우선으로 노드마다 자식들이 모두 빈 칸에 들어가는 base를 찾음
+        queue = [(trie.root, cls.ROOT)]
+        for node, state in queue:
+            if node.has_value:
+                terminal[state] = 1
+                values[state] = node.value
+            if not node.children:
+                continue
+
+            child_codes = sorted(codes[char] for char in node.children)
+            first_code = child_codes[0]
+
+            position = free[0]
+            for _ in range(cls.MAX_PROBES):
+                if position < 0:
+                    break
+                offset = position - first_code
+                if offset >= 1:
+                    ensure(offset + child_codes[-1] + 1)
+                    if all(check[offset + code] == cls.EMPTY for code in child_codes):
+                        break
+                position = next_free[position]
+            else:
+                position = -1
+
+            if position < 0:
+                # 앞쪽 빈 칸에 맞지 않으면 배열 끝에 새로 배치 (탐색 시간 제한)
+                offset = max(1, len(check) - first_code)
+                ensure(offset + child_codes[-1] + 1)
+
+            base[state] = offset
+            for code in child_codes:
+                occupy(offset + code, state)
+
+            for char, child in node.children.items():
+                queue.append((child, offset + codes[char]))
+
+        return cls(alphabet, base, check, values, terminal)
+
+    def _transition(self, state, char):
+        """
+        상태 전이
+
+        Args:
+            state (int): 현재 상태
+            char (str): 입력 문자
+
+        Returns:
+            int: 다음 상태 (전이가 없으면 -1)
+        """
+        code = self.codes.get(char)
+        if code is None:
+            return -1
+        target = self.base[state] + code
+        owned = target < len(self.check) and self.check[target] == state
+        if owned and target != self.ROOT:
+            return target
+        return -1
+
+    def _walk(self, word):
+        """
+        루트에서 word를 따라 이동한 상태 반환
+
+        Args:
+            word (str): 입력 문자열
+
+        Returns:
+            int: 도착 상태 (경로가 없으면 -1)
+        """
+        state = self.ROOT
+        for char in word:
+            state = self._transition(state, char)
+            if state < 0:
+                return -1
+        return state
+
+    def search(self, word):
+        """
+        단어 검색
+
+        Args:
+            word (str): 검색할 단어
+
+        Returns:
+            int: 값이 있으면 해당 값, 없으면 -1
+        """
+        if not word:
+            return -1
+        state = self._walk(word)
+        if state < 0 or not self.terminal[state]:
+            return -1
+        return self.values[state]
+
+    def starts_with(self, prefix):
+        """
+        주어진 prefix로 시작하는 단어들이 있는지 확인
+
+        Args:
+            prefix (str): 검색할 접두사
+
+        Returns:
+            bool: 존재하면 True, 없으면 False
+        """
+        return self._walk(prefix) >= 0
+
+    def get_words_with_prefix(self, prefix):
+        """
+        주어진 접두사로 시작하는 모든 단어와 값을 사전 순으로 반환
+
+        Args:
+            prefix (str): 검색할 접두사
+
+        Returns:
+            list: (단어, 값) 튜플의 리스트
+        """
+        state = self._walk(prefix)
+        if state < 0:
+            return []
+
+        results = []
+        base, check, alphabet = self.base, self.check, self.alphabet
+        size = len(check)
+        stack = [(state, prefix)]
+
+        while stack:
+            state, word = stack.pop()
+            if self.terminal[state]:
+                results.append((word, self.values[state]))
+
+            # 사전 순으로 방문하도록 큰 코드부터 스택에 넣음
+            offset = base[state]
+            for code in range(len(alphabet), 0, -1):
+                target = offset + code
+                if 0 < target < size and check[target] == state:
+                    stack.append((target, word + alphabet[code - 1]))
+
+        return results
+
+    def get_all_words(self):
+        """
+        모든 단어와 값을 반환
+
+        Returns:
+            list: (단어, 값) 튜플의 리스트
+        """
+        return self.get_words_with_prefix("")
+
+    def size(self):
+        """
+        저장된 단어의 개수 반환
+
+        Returns:
+            int: 저장된 단어의 개수
+        """
+        return sum(self.terminal)
+
+    def memory_bytes(self):
+        """
+        배열들이 차지하는 바이트 수
+
+        Returns:
+            int: 바이트 수
+        """
+        return (self.base.itemsize * len(self.base)
+                + self.check.itemsize * len(self.check)
+                + self.values.itemsize * len(self.values)
+                + len(self.terminal))
+
+
+def freeze(trie):
+    """
+    Trie를 읽기 전용 Double-Array Trie로 고정
+
+    Args:
+        trie (Trie): 변환할 Trie
+
+    Returns:
+        DoubleArrayTrie: 고정된 Trie
+    """
+    return DoubleArrayTrie.from_trie(trie)
+
+
+def trie_memory_bytes(trie):
+    """
+    Trie의 노드 객체와 딕셔너리가 차지하는 대략적인 바이트 수
+
+    Args:
+        trie (Trie): 측정할 Trie
+
+    Returns:
+        int: 바이트 수
+    """
+    total = 0
+    stack = [trie.root]
+    while stack:
+        node = stack.pop()
+        total += (sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+                  + sys.getsizeof(node.children))
+        stack.extend(node.children.values())
+    return total
+
+
+def test_double_array_trie():
+    """테스트 함수"""
+    print("=== Double-Array Trie 테스트 ===\n")
+
+    trie = Trie()
+    test_words = [
+        ("apple", 10), ("app", 5), ("application", 20),
+        ("apply", 8), ("banana", 15), ("band", 12), ("bandana", 18)
+    ]
+    for word, value in test_words:
+        trie.insert(word, value)
+
+    frozen = freeze(trie)
+    print(f"문자 집합: {frozen.alphabet}")
+    print(f"배열 길이: {len(frozen.check)}, 저장된 단어 수: {frozen.size()}")
+    print()
+
+    print("=== 검색 테스트 ===")
+    for word in ["apple", "app", "application", "appl", "banana", "cat"]:
+        result = frozen.search(word)
+        if result != -1:
+            print(f"검색: {word} -> 찾음, 값: {result}")
+        else:
+            print(f"검색: {word} -> 없음")
+    print()
+
+    print("=== 접두사 검색 테스트 ===")
+    for prefix in ["app", "ban", "cat", "a"]:
+        exists = frozen.starts_with(prefix)
+        print(f"접두사: {prefix} -> {'존재함' if exists else '존재하지 않음'}")
+        if exists:
+            word_strs = [f"{word}({value})"
+                         for word, value in frozen.get_words_with_prefix(prefix)]
+            print(f"  관련 단어들: {', '.join(word_strs)}")
+    print()
+
+    # 큰 사전에서 메모리 비교
+    print("=== 메모리 비교 (무작위 단어 50000개) ===")
+    random.seed(42)
+    large_trie = Trie()
+    for i in range(50000):
+        word = "".join(random.choice("abcdefghijklmnopqrstuvwxyz")
+                       for _ in range(random.randint(3, 12)))
+        large_trie.insert(word, i)
+
+    large_frozen = freeze(large_trie)
+    print(f"Trie (노드 객체 + 딕셔너리): 약 {trie_memory_bytes(large_trie) / 1e6:.1f} MB")
+    print(f"Double-Array Trie (배열): {large_frozen.memory_bytes() / 1e6:.1f} MB")
+    same = large_frozen.get_all_words() == large_trie.get_all_words()
+    print(f"모든 단어와 값이 같은가: {same}")
+
+    print("\n테스트 완료")
+
+
+if __name__ == "__main__":
+    test_double_array_trie()
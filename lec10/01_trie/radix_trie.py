@@ -0,0 +1,442 @@
+# radix_trie.py
+
+from trie import Trie
+
+
+class RadixTrieNode:
+    """
+    Radix Trie 노드 클래스
+
+    자식이 하나뿐인 노드들의 연속(체인)을 하나의 간선으로 합친 구조
+    - label: 부모에서 이 노드로 오는 간선의 문자열 (키의 부분 문자열)
+    - children: 간선 첫 문자 -> RadixTrieNode 매핑
+    - has_value: 값이 저장되어 있는지 확인
+    - value: 실제 저장할 값
+    """
+
+    def __init__(self, label=""):
+        self.label = label
+        self.children = {}
+        self.has_value = False
+        self.value = 0
+
+
+class RadixTrie:
+    """
+    Radix (Patricia) Trie 데이터 구조 구현
+
+    분기가 없는 긴 접미사를 노드 하나로 압축하므로 노드 수가 저장된 단어 수의
+    2배 이하로 줄고, URL이나 파일 경로 같은 긴 키에서 포인터 추적이 줄어듭니다.
+
+    시간 복잡도:
+    - 삽입/검색/삭제: O(m) where m is the length of the word
+    공간 복잡도: O(N) nodes where N is number of words (간선 문자열 제외)
+    """
+
+    def __init__(self):
+        """Radix Trie 초기화"""
+        self.root = RadixTrieNode()
+
+    @staticmethod
+    def _common_prefix_length(a, b, start):
+        """
+        a와 b[start:]의 공통 접두사 길이
+
+        Args:
+            a (str): 간선 문자열
+            b (str): 키
+            start (int): 키에서 비교를 시작할 위치
+
+        Returns:
+            int: 공통 접두사 길이
+        """
+        length = 0
+        limit = min(len(a), len(b) - start)
+        while length < limit and a[length] == b[start + length]:
+            length += 1
+        return length
+
+    def insert(self, word, value):
+        """
+        Radix Trie에 단어와 값을 삽입
+
+        Args:
+            word (str): 삽입할 단어 (비어있지 않은 문자열)
+            value (int): 저장할 값
+
+        Returns:
+            bool: 성공하면 True, 실패하면 False
+        """
+        if not word or not isinstance(word, str):
+            return False
+
+        current = self.root
+        index = 0
+
+        while index < len(word):
+            child = current.children.get(word[index])
+
+            if child is None:
+                # 남은 문자열 전체를 간선 하나로 추가
+                child = RadixTrieNode(word[index:])
+                current.children[word[index]] = child
+                current = child
+                index = len(word)
+                break
+
+            common = self._common_prefix_length(child.label, word, index)
+
+            if common < len(child.label):
+                # 간선 중간에서 갈라지므로 간선을 둘로 분할
+                middle = RadixTrieNode(child.label[:common])
+                child.label = child.label[common:]
+                middle.children[child.label[0]] = child
+                current.children[word[index]] = middle
+                child = middle
+
+            current = child
+            index += common
+
+        current.has_value = True
+        current.value = value
+        return True
+
+    def _find_node(self, word):
+        """
+        word와 정확히 일치하는 노드 찾기
+
+        Args:
+            word (str): 찾을 문자열
+
+        Returns:
+            RadixTrieNode: 해당 노드 (없으면 None)
+        """
+        current = self.root
+        index = 0
+
+        while index < len(word):
+            child = current.children.get(word[index])
+            if child is None or not word.startswith(child.label, index):
+                return None
+            current = child
+            index += len(child.label)
+
+        return current
+
+    def search(self, word):
+        """
+        Radix Trie에서 단어 검색
+
+        Args:
+            word (str): 검색할 단어
+
+        Returns:
+            int: 값이 있으면 해당 값, 없으면 -1
+        """
+        if not word:
+            return -1
+
+        node = self._find_node(word)
+        if node is not None and node.has_value:
+            return node.value
+        return -1
+
+    def _find_prefix(self, prefix):
+        """
+        prefix로 시작하는 단어들을 모두 담고 있는 가장 높은 노드 찾기
+
+        Args:
+            prefix (str): 접두사
+
+        Returns:
+            tuple: (노드, 그 노드까지의 문자열) 또는 (None, None)
+        """
+        current = self.root
+        index = 0
+
+        while index < len(prefix):
+            child = current.children.get(prefix[index])
+            if child is None:
+                return None, None
+
+            common = self._common_prefix_length(child.label, prefix, index)
+            if index + common == len(prefix):
+                # prefix가 간선 중간(또는 끝)에서 끝남
+                return child, prefix[:index] + child.label
+            if common < len(child.label):
+                return None, None
+
+            current = child
+            index += common
+
+        return current, prefix
+
+    def starts_with(self, prefix):
+        """
+        주어진 prefix로 시작하는 단어들이 있는지 확인
+
+        Args:
+            prefix (str): 검색할 접두사
+
+        Returns:
+            bool: 존재하면 True, 없으면 False
+        """
+        if not prefix:
+            return True
+        node, _ = self._find_prefix(prefix)
+        return node is not None
+
+    def delete(self, word):
+        """
+        Radix Trie에서 단어 삭제 (필요하면 노드를 제거하거나 다시 합침)
+
+        Args:
+            word (str): 삭제할 단어
+
+        Returns:
+            bool: 성공하면 True, 실패하면 False
+        """
+        if not word:
+            return False
+
+        # 경로 기록: (부모, 자식)
+        path = []
+        current = self.root
+        index = 0
+
+        while index < len(word):
+            child = current.children.get(word[index])
+            if child is None or not word.startswith(child.label, index):
+                return False
+            path.append((current, child))
+            current = child
+            index += len(child.label)
+
+        if not current.has_value:
+            return False
+
+        current.has_value = False
+        current.value = 0
+
+        parent, node = path[-1]
+        if not node.children:
+            # 자식이 없으면 노드 제거
+            del parent.children[node.label[0]]
+            # 부모가 값도 없고 자식이 하나만 남으면 합치기
+            single_child = len(parent.children) == 1
+            if parent is not self.root and not parent.has_value and single_child:
+                self._merge_with_child(parent)
+        elif len(node.children) == 1:
+            self._merge_with_child(node)
+
+        return True
+
+    def _merge_with_child(self, node):
+        """
+        값이 없고 자식이 하나뿐인 노드를 자식과 합침
+
+        Args:
+            node (RadixTrieNode): 합칠 노드
+        """
+        (child,) = node.children.values()
+        node.label += child.label
+        node.children = child.children
+        node.has_value = child.has_value
+        node.value = child.value
+
+    def _collect(self, node, prefix, results):
+        """
+        주어진 노드 이하의 모든 단어를 사전 순으로 수집 (반복문)
+
+        Args:
+            node (RadixTrieNode): 시작 노드
+            prefix (str): 시작 노드까지의 문자열
+            results (list): 결과를 저장할 리스트
+        """
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if node.has_value:
+                results.append((word, node.value))
+            for char in sorted(node.children, reverse=True):
+                child = node.children[char]
+                stack.append((child, word + child.label))
+
+    def get_all_words(self):
+        """
+        Radix Trie의 모든 단어와 값을 반환
+
+        Returns:
+            list: (단어, 값) 튜플의 리스트
+        """
+        results = []
+        self._collect(self.root, "", results)
+        return results
+
+    def get_words_with_prefix(self, prefix):
+        """
+        주어진 접두사로 시작하는 모든 단어와 값을 반환
+
+        Args:
+            prefix (str): 검색할 접두사
+
+        Returns:
+            list: (단어, 값) 튜플의 리스트
+        """
+        if not prefix:
+            return self.get_all_words()
+
+        results = []
+        node, word = self._find_prefix(prefix)
+        if node is not None:
+            self._collect(node, word, results)
+        return results
+
+    def print_trie(self, node=None, depth=0):
+        """
+        Radix Trie 구조를 시각적으로 출력 (디버깅용)
+
+        Args:
+            node (RadixTrieNode): 출력할 노드 (None이면 루트부터)
+            depth (int): 현재 깊이
+        """
+        if node is None:
+            node = self.root
+
+        indent = "  " * depth
+        label = f"'{node.label}'" if depth > 0 else "ROOT"
+        print(f"{indent}{label}:", end="")
+        print(f" [값: {node.value}]" if node.has_value else "")
+
+        for char in sorted(node.children):
+            self.print_trie(node.children[char], depth + 1)
+
+    def node_count(self):
+        """
+        노드 개수 반환 (루트 포함)
+
+        Returns:
+            int: 노드 개수
+        """
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children.values())
+        return count
+
+    def size(self):
+        """
+        Radix Trie에 저장된 단어의 개수 반환
+
+        Returns:
+            int: 저장된 단어의 개수
+        """
+        return len(self.get_all_words())
+
+    def is_empty(self):
+        """
+        Radix Trie가 비어있는지 확인
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return not self.root.children
+
+
+def trie_node_count(trie):
+    """
+    Trie의 노드 개수 반환 (루트 포함)
+
+    Args:
+        trie (Trie): 측정할 Trie
+
+    Returns:
+        int: 노드 개수
+    """
+    count = 0
+    stack = [trie.root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children.values())
+    return count
+
+
+def test_radix_trie():
+    """테스트 함수"""
+    print("=== Radix Trie 데이터 구조 테스트 ===\n")
+
+    radix = RadixTrie()
+    test_words = [
+        ("apple", 10), ("app", 5), ("application", 20),
+        ("apply", 8), ("banana", 15), ("band", 12), ("bandana", 18)
+    ]
+    for word, value in test_words:
+        radix.insert(word, value)
+
+    print("=== Radix Trie 구조 출력 ===")
+    radix.print_trie()
+    print()
+
+    print("=== 검색 테스트 ===")
+    for word in ["apple", "app", "application", "appl", "banana", "cat"]:
+        result = radix.search(word)
+        if result != -1:
+            print(f"검색: {word} -> 찾음, 값: {result}")
+        else:
+            print(f"검색: {word} -> 없음")
+    print()
+
+    print("=== 접두사 검색 테스트 ===")
+    for prefix in ["app", "appli", "ban", "cat"]:
+        words = radix.get_words_with_prefix(prefix)
+        word_strs = [f"{word}({value})" for word, value in words]
+        print(f"'{prefix}'로 시작하는 단어들: {', '.join(word_strs) if words else '없음'}")
+    print()
+
+    print("=== 삭제 테스트 (노드 합치기) ===")
+    for word in ["app", "band"]:
+        radix.delete(word)
+        print(f"'{word}' 삭제 후 검색: {radix.search(word)}")
+    radix.print_trie()
+    print()
+
+    # URL/파일 경로 같은 긴 키
+    print("=== 긴 키 테스트 (URL, 파일 경로) ===")
+    paths = [
+        "https://example.com/products/keyboards/mechanical",
+        "https://example.com/products/keyboards/membrane",
+        "https://example.com/products/mice/wireless",
+        "https://example.com/support/contact",
+        "/usr/local/lib/python3.11/site-packages/numpy/__init__.py",
+        "/usr/local/lib/python3.11/site-packages/pandas/__init__.py",
+    ]
+    path_trie = RadixTrie()
+    for value, path in enumerate(paths):
+        path_trie.insert(path, value)
+    path_trie.print_trie()
+    prefix = "https://example.com/products/k"
+    print(f"'{prefix}'로 시작: "
+          f"{[word for word, _ in path_trie.get_words_with_prefix(prefix)]}")
+    print()
+
+    # 노드 수 비교 (Trie는 소문자만 허용하므로 소문자 키 사용)
+    print("=== 노드 수 비교 ===")
+    words = [path.replace("/", "").replace(":", "").replace(".", "").replace("_", "")
+             for path in paths]
+    words = [word for word in words if word.isalpha()]
+    plain = Trie()
+    compressed = RadixTrie()
+    for value, word in enumerate(words):
+        plain.insert(word, value)
+        compressed.insert(word, value)
+    print(f"Trie 노드 수: {trie_node_count(plain)}")
+    print(f"Radix Trie 노드 수: {compressed.node_count()}")
+
+    print("\n테스트 완료")
+
+
+if __name__ == "__main__":
+    test_radix_trie()
@@ -1,5 +1,10 @@
 # trie.py
 
+import heapq
+import random
+import time
+
+
 class TrieNode:
     """
     Trie 노드 클래스
@@ -8,12 +13,14 @@ class TrieNode:
     - children: a-z를 위한 딕셔너리
     - has_value: 값이 저장되어 있는지 확인
     - value: 실제 저장할 값 (빈도수, 점수 등)
+    - max_score: 이 노드 이하에 저장된 값 중 최댓값 (없으면 None, top-k 검색용)
     """
     
     def __init__(self):
         self.children = {}  # 문자 -> TrieNode 매핑
         self.has_value = False
         self.value = 0
+        self.max_score = None
 
 
 class Trie:
@@ -46,18 +53,43 @@ class Trie:
             return False
         
         current = self.root
+        path = [current]
         
         for char in word:
             if char not in current.children:
                 current.children[char] = TrieNode()
             current = current.children[char]
+            path.append(current)
         
         # 단어의 끝에서 값 저장
         current.has_value = True
         current.value = value
         
+        # 아래에서부터 서브트리 최댓값 갱신 (바뀌지 않는 노드에서 멈춤)
+        for node in reversed(path):
+            max_score = self._subtree_max(node)
+            if max_score == node.max_score:
+                break
+            node.max_score = max_score
+        
         return True
     
+    def _subtree_max(self, node):
+        """
+        노드 자신의 값과 자식들의 max_score로 서브트리 최댓값 계산
+        
+        Args:
+            node (TrieNode): 계산할 노드
+            
+        Returns:
+            int: 서브트리의 최댓값 (값이 없으면 None)
+        """
+        scores = [child.max_score for child in node.children.values()
+                  if child.max_score is not None]
+        if node.has_value:
+            scores.append(node.value)
+        return max(scores) if scores else None
+    
     def search(self, word):
         """
         Trie에서 단어 검색
@@ -141,6 +173,7 @@ class Trie:
             # 값을 제거
             node.has_value = False
             node.value = 0
+            node.max_score = self._subtree_max(node)
             
             # 자식이 없다면 이 노드는 삭제 가능
             return not self._has_children(node)
@@ -154,6 +187,10 @@ class Trie:
         if should_delete_child:
             # 자식 노드 삭제
             del node.children[char]
+        
+        node.max_score = self._subtree_max(node)
+        
+        if should_delete_child:
             
             # 현재 노드도 삭제 가능한지 확인
             # (값이 없고 다른 자식도 없다면 삭제 가능)
@@ -237,6 +274,51 @@ class Trie:
         
         return results
     
+    def top_k_with_prefix(self, prefix, k):
+        """
+        주어진 접두사로 시작하는 단어 중 값이 큰 상위 k개를 반환
+        
+        노드마다 저장된 서브트리 최댓값(max_score)을 우선순위로 사용하는 최선 우선 탐색으로,
+        모든 단어를 수집하지 않고 값이 큰 경로만 따라갑니다.
+        
+        Args:
+            prefix (str): 검색할 접두사
+            k (int): 반환할 단어의 최대 개수
+            
+        Returns:
+            list: (단어, 값) 튜플의 리스트 (값 내림차순, 같으면 사전순)
+        """
+        results = []
+        if k <= 0:
+            return results
+        
+        current = self.root
+        for char in prefix:
+            if char not in current.children:
+                return results  # 접두사가 존재하지 않음
+            current = current.children[char]
+        
+        if current.max_score is None:
+            return results
+        
+        # (-점수, 문자열, 종류, 노드): 종류 0은 완성된 단어, 1은 아직 펼치지 않은 서브트리
+        # 서브트리의 문자열은 그 아래 모든 단어보다 사전순으로 앞서므로 동점이면 사전순이 유지됨
+        heap = [(-current.max_score, prefix, 1, current)]
+        
+        while heap and len(results) < k:
+            score, word, kind, node = heapq.heappop(heap)
+            if kind == 0:
+                results.append((word, -score))
+                continue
+            
+            if node.has_value:
+                heapq.heappush(heap, (-node.value, word, 0, None))
+            for char, child in node.children.items():
+                if child.max_score is not None:
+                    heapq.heappush(heap, (-child.max_score, word + char, 1, child))
+        
+        return results
+    
     def print_trie(self, node=None, prefix="", depth=0):
         """
         Trie 구조를 시각적으로 출력 (디버깅용)
@@ -438,14 +520,36 @@ def demo_autocomplete():
     user_inputs = ["ca", "car", "do"]
     
     for user_input in user_inputs:
-        suggestions = dictionary.get_words_with_prefix(user_input)
-        # 빈도수로 정렬
-        suggestions.sort(key=lambda x: x[1], reverse=True)
+        # 빈도수 상위 5개만
+        suggestions = dictionary.top_k_with_prefix(user_input, 5)
         
         print(f"'{user_input}' 입력 시 추천 단어:")
-        for word, freq in suggestions[:5]:  # 상위 5개만
+        for word, freq in suggestions:
             print(f"  {word} (빈도: {freq})")
         print()
+    
+    # 큰 사전에서 전체 수집 후 정렬과 top-k 검색 비교
+    print("=== 상위 10개 추천 성능 비교 (무작위 단어 100000개) ===")
+    random.seed(42)
+    large_dictionary = Trie()
+    for _ in range(100000):
+        word = "".join(random.choice("abcdefghijklmnopqrstuvwxyz")
+                       for _ in range(random.randint(3, 12)))
+        large_dictionary.insert(word, random.randint(1, 1000000))
+    
+    start = time.perf_counter()
+    suggestions = large_dictionary.get_words_with_prefix("a")
+    suggestions.sort(key=lambda x: (-x[1], x[0]))
+    collect_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    top_suggestions = large_dictionary.top_k_with_prefix("a", 10)
+    top_k_time = time.perf_counter() - start
+    
+    print(f"'a'로 시작하는 단어 수: {len(suggestions)}")
+    print(f"전체 수집 후 정렬: {collect_time * 1000:.2f} ms")
+    print(f"top_k_with_prefix: {top_k_time * 1000:.3f} ms")
+    print(f"결과가 같은가: {top_suggestions == suggestions[:10]}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,543 @@
+# radix_tst.py
+
+from tst import TST
+
+
+class RadixTSTNode:
+    """
+    Radix TST 노드 클래스
+
+    middle 방향으로 분기 없이 이어지는 문자 체인을 노드 하나로 합친 구조:
+    - label: 현재 노드의 문자열 (첫 문자로 left/right 비교)
+    - has_value: 값 존재 여부 (label 전체를 지난 위치에서 단어가 끝남)
+    - value: 저장할 값
+    - left: 첫 문자가 현재 label의 첫 문자보다 작은 노드
+    - middle: label 다음 문자열로 이동
+    - right: 첫 문자가 현재 label의 첫 문자보다 큰 노드
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.has_value = False
+        self.value = 0
+        self.left = None
+        self.middle = None
+        self.right = None
+
+
+class RadixTST:
+    """
+    Radix (경로 압축) TST 데이터 구조 구현
+
+    TST와 같은 인터페이스를 제공하지만, 형제(left/right)가 없는 middle 체인을
+    label 문자열 하나로 압축하므로 URL이나 파일 경로처럼 긴 키에서
+    노드 수와 포인터 추적이 크게 줄어듭니다.
+
+    시간 복잡도:
+    - 평균 삽입/검색/삭제: O(m + log n) where m is the length of the word
+    공간 복잡도: O(n) nodes where n is the number of words (label 문자열 제외)
+    """
+
+    def __init__(self):
+        """Radix TST 초기화"""
+        self.root = None
+
+    @staticmethod
+    def _common_prefix_length(label, word, index):
+        """
+        label과 word[index:]의 공통 접두사 길이
+
+        Args:
+            label (str): 노드의 문자열
+            word (str): 비교할 단어
+            index (int): 단어에서 비교를 시작할 위치
+
+        Returns:
+            int: 공통 접두사 길이
+        """
+        length = 0
+        limit = min(len(label), len(word) - index)
+        while length < limit and label[length] == word[index + length]:
+            length += 1
+        return length
+
+    def _insert(self, node, word, value, index):
+        """
+        Radix TST에 단어와 값을 삽입 (재귀적 구현)
+
+        Args:
+            node (RadixTSTNode): 현재 노드
+            word (str): 삽입할 단어
+            value (int): 저장할 값
+            index (int): 현재 문자 인덱스
+
+        Returns:
+            RadixTSTNode: 삽입 후 현재 노드
+        """
+        if node is None:
+            # 남은 문자열 전체를 노드 하나로 추가
+            node = RadixTSTNode(word[index:])
+            node.has_value = True
+            node.value = value
+            return node
+
+        current_char = word[index]
+
+        if current_char < node.label[0]:
+            node.left = self._insert(node.left, word, value, index)
+        elif current_char > node.label[0]:
+            node.right = self._insert(node.right, word, value, index)
+        else:  # 첫 문자가 같음
+            common = self._common_prefix_length(node.label, word, index)
+
+            if common < len(node.label):
+                # label 중간에서 갈라지므로 노드를 둘로 분할
+                child = RadixTSTNode(node.label[common:])
+                child.has_value = node.has_value
+                child.value = node.value
+                child.middle = node.middle
+                node.label = node.label[:common]
+                node.has_value = False
+                node.value = 0
+                node.middle = child
+
+            if index + common == len(word):
+                # 단어의 끝에 도달
+                node.has_value = True
+                node.value = value
+            else:
+                node.middle = self._insert(node.middle, word, value, index + common)
+
+        return node
+
+    def insert(self, word, value):
+        """
+        Radix TST에 단어와 값을 삽입
+
+        Args:
+            word (str): 삽입할 단어
+            value (int): 저장할 값
+
+        Returns:
+            bool: 성공하면 True, 실패하면 False
+        """
+        if not word:
+            return False
+
+        self.root = self._insert(self.root, word, value, 0)
+        return True
+
+    def _search(self, node, word, index):
+        """
+        Radix TST에서 단어 검색 (재귀적 구현)
+
+        Args:
+            node (RadixTSTNode): 현재 노드
+            word (str): 검색할 단어
+            index (int): 현재 문자 인덱스
+
+        Returns:
+            int: 값이 있으면 해당 값, 없으면 -1
+        """
+        if node is None:
+            return -1
+
+        current_char = word[index]
+
+        if current_char < node.label[0]:
+            return self._search(node.left, word, index)
+        elif current_char > node.label[0]:
+            return self._search(node.right, word, index)
+        else:  # 첫 문자가 같음
+            if not word.startswith(node.label, index):
+                return -1
+
+            next_index = index + len(node.label)
+            if next_index == len(word):
+                # 단어의 끝에 도달
+                return node.value if node.has_value else -1
+            else:
+                return self._search(node.middle, word, next_index)
+
+    def search(self, word):
+        """
+        Radix TST에서 단어 검색
+
+        Args:
+            word (str): 검색할 단어
+
+        Returns:
+            int: 값이 있으면 해당 값, 없으면 -1
+        """
+        if not word:
+            return -1
+
+        return self._search(self.root, word, 0)
+
+    def _get_node_by_prefix(self, node, prefix, index):
+        """
+        prefix가 끝나는 노드를 찾아 반환 (재귀적 구현)
+
+        Args:
+            node (RadixTSTNode): 현재 노드
+            prefix (str): 찾을 접두사
+            index (int): 현재 문자 인덱스
+
+        Returns:
+            tuple: (노드, 노드의 label까지 포함한 문자열) 또는 (None, None)
+        """
+        if node is None:
+            return None, None
+
+        current_char = prefix[index]
+
+        if current_char < node.label[0]:
+            return self._get_node_by_prefix(node.left, prefix, index)
+        elif current_char > node.label[0]:
+            return self._get_node_by_prefix(node.right, prefix, index)
+        else:  # 첫 문자가 같음
+            common = self._common_prefix_length(node.label, prefix, index)
+
+            if index + common == len(prefix):
+                # prefix가 label 중간(또는 끝)에서 끝남
+                return node, prefix[:index] + node.label
+            if common < len(node.label):
+                return None, None
+
+            return self._get_node_by_prefix(node.middle, prefix, index + common)
+
+    def starts_with(self, prefix):
+        """
+        주어진 prefix로 시작하는 단어들이 있는지 확인
+
+        Args:
+            prefix (str): 검색할 접두사
+
+        Returns:
+            bool: 존재하면 True, 없으면 False
+        """
+        if not prefix:
+            return True
+
+        node, _ = self._get_node_by_prefix(self.root, prefix, 0)
+        return node is not None
+
+    def _get_all_words_helper(self, node, prefix, results):
+        """
+        주어진 노드 이하의 모든 단어를 사전순으로 수집하는 헬퍼 함수
+
+        Args:
+            node (RadixTSTNode): 현재 노드
+            prefix (str): 현재까지의 접두사
+            results (list): 결과를 저장할 리스트
+        """
+        if node is None:
+            return
+
+        # 왼쪽 서브트리 탐색 (첫 문자가 더 작은 노드들)
+        self._get_all_words_helper(node.left, prefix, results)
+
+        current_word = prefix + node.label
+
+        if node.has_value:
+            results.append((current_word, node.value))
+
+        # 가운데 서브트리 탐색 (다음 문자열들)
+        self._get_all_words_helper(node.middle, current_word, results)
+
+        # 오른쪽 서브트리 탐색 (첫 문자가 더 큰 노드들)
+        self._get_all_words_helper(node.right, prefix, results)
+
+    def get_all_words(self):
+        """
+        Radix TST의 모든 단어와 값을 사전순으로 반환
+
+        Returns:
+            list: (단어, 값) 튜플의 리스트
+        """
+        results = []
+        self._get_all_words_helper(self.root, "", results)
+        return results
+
+    def get_words_with_prefix(self, prefix):
+        """
+        주어진 접두사로 시작하는 모든 단어와 값을 반환
+
+        Args:
+            prefix (str): 검색할 접두사
+
+        Returns:
+            list: (단어, 값) 튜플의 리스트
+        """
+        if not prefix:
+            return self.get_all_words()
+
+        results = []
+        prefix_node, word = self._get_node_by_prefix(self.root, prefix, 0)
+
+        if prefix_node is None:
+            return results  # 접두사가 존재하지 않음
+
+        if prefix_node.has_value:
+            results.append((word, prefix_node.value))
+
+        self._get_all_words_helper(prefix_node.middle, word, results)
+        return results
+
+    def _remove_node(self, node):
+        """
+        값도 middle도 없는 노드를 left/right 형제 트리에서 제거
+
+        Args:
+            node (RadixTSTNode): 제거할 노드
+
+        Returns:
+            RadixTSTNode: 노드 자리를 대신할 노드 (없으면 None)
+        """
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+
+        # 형제가 양쪽에 모두 있으면 오른쪽 서브트리의 최소 노드로 대체
+        parent = node
+        successor = node.right
+        while successor.left is not None:
+            parent = successor
+            successor = successor.left
+
+        if parent is not node:
+            parent.left = successor.right
+            successor.right = node.right
+        successor.left = node.left
+        return successor
+
+    def _compact(self, node):
+        """
+        삭제 후 압축 상태 복원 (빈 노드 제거, 형제 없는 middle 노드 합치기)
+
+        Args:
+            node (RadixTSTNode): 확인할 노드
+
+        Returns:
+            RadixTSTNode: 정리된 노드 (None이면 노드 삭제됨)
+        """
+        if node.has_value:
+            return node
+
+        if node.middle is None:
+            return self._remove_node(node)
+
+        child = node.middle
+        if child.left is None and child.right is None:
+            # 값이 없는 노드와 형제 없는 middle 노드를 하나로 합침
+            node.label += child.label
+            node.has_value = child.has_value
+            node.value = child.value
+            node.middle = child.middle
+
+        return node
+
+    def _delete_helper(self, node, word, index):
+        """
+        삭제 헬퍼 함수 (재귀적 구현)
+
+        Args:
+            node (RadixTSTNode): 현재 노드
+            word (str): 삭제할 단어
+            index (int): 현재 문자 인덱스
+
+        Returns:
+            RadixTSTNode: 삭제 후 현재 노드 (None이면 노드 삭제됨)
+        """
+        if node is None:
+            return None
+
+        current_char = word[index]
+
+        if current_char < node.label[0]:
+            node.left = self._delete_helper(node.left, word, index)
+        elif current_char > node.label[0]:
+            node.right = self._delete_helper(node.right, word, index)
+        else:  # 첫 문자가 같음
+            if not word.startswith(node.label, index):
+                return node  # 삭제할 단어가 없음
+
+            next_index = index + len(node.label)
+            if next_index == len(word):
+                node.has_value = False
+                node.value = 0
+            else:
+                node.middle = self._delete_helper(node.middle, word, next_index)
+
+            return self._compact(node)
+
+        return node
+
+    def delete(self, word):
+        """
+        Radix TST에서 단어 삭제
+
+        Args:
+            word (str): 삭제할 단어
+
+        Returns:
+            bool: 성공하면 True, 실패하면 False
+        """
+        if not word:
+            return False
+
+        self.root = self._delete_helper(self.root, word, 0)
+        return True
+
+    def _print_tst_detailed(self, node, prefix="", depth=0):
+        """
+        Radix TST 상세 구조 출력
+
+        Args:
+            node (RadixTSTNode): 현재 노드
+            prefix (str): 현재까지의 접두사
+            depth (int): 현재 깊이
+        """
+        if node is None:
+            return
+
+        indent = "  " * depth
+        value_info = ""
+        if node.has_value:
+            value_info = f" [단어완성: {prefix + node.label}, 값: {node.value}]"
+        print(f"{indent}'{node.label}'{value_info}")
+
+        if node.left is not None:
+            print(f"{indent}  L:")
+            self._print_tst_detailed(node.left, prefix, depth + 2)
+
+        if node.middle is not None:
+            print(f"{indent}  M:")
+            self._print_tst_detailed(node.middle, prefix + node.label, depth + 2)
+
+        if node.right is not None:
+            print(f"{indent}  R:")
+            self._print_tst_detailed(node.right, prefix, depth + 2)
+
+    def print_tst_detailed(self):
+        """Radix TST 상세 구조를 시각적으로 출력"""
+        print("=== Radix TST 상세 구조 ===")
+        if self.root is None:
+            print("(빈 트리)")
+        else:
+            self._print_tst_detailed(self.root)
+        print()
+
+    def node_count(self):
+        """
+        노드 개수 반환
+
+        Returns:
+            int: 노드 개수
+        """
+        return count_nodes(self.root)
+
+    def size(self):
+        """
+        Radix TST에 저장된 단어의 개수 반환
+
+        Returns:
+            int: 저장된 단어의 개수
+        """
+        return len(self.get_all_words())
+
+    def is_empty(self):
+        """
+        Radix TST가 비어있는지 확인
+
+        Returns:
+            bool: 비어있으면 True, 아니면 False
+        """
+        return self.root is None
+
+
+def count_nodes(root):
+    """
+    TST 또는 Radix TST의 노드 개수 반환
+
+    Args:
+        root (TSTNode | RadixTSTNode): 루트 노드
+
+    Returns:
+        int: 노드 개수
+    """
+    count = 0
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        count += 1
+        for child in (node.left, node.middle, node.right):
+            if child is not None:
+                stack.append(child)
+    return count
+
+
+def test_radix_tst():
+    """테스트 함수"""
+    print("=== Radix TST 테스트 ===\n")
+
+    radix = RadixTST()
+    test_words = [
+        ("apple", 10), ("app", 5), ("application", 20),
+        ("apply", 8), ("banana", 15), ("band", 12), ("bandana", 18),
+        ("cat", 25), ("car", 30), ("card", 35)
+    ]
+    for word, value in test_words:
+        radix.insert(word, value)
+
+    radix.print_tst_detailed()
+
+    print("=== 검색 테스트 ===")
+    for word in ["apple", "app", "application", "appl", "banana", "dog", "car"]:
+        result = radix.search(word)
+        if result != -1:
+            print(f"검색: {word} -> 찾음, 값: {result}")
+        else:
+            print(f"검색: {word} -> 없음")
+    print()
+
+    print("=== 접두사 검색 테스트 ===")
+    for prefix in ["app", "appli", "ban", "ca", "xyz"]:
+        words = radix.get_words_with_prefix(prefix)
+        word_strs = [f"{word}({value})" for word, value in words]
+        print(f"'{prefix}'로 시작하는 단어들: {', '.join(word_strs) if words else '없음'}")
+    print()
+
+    print("=== 삭제 테스트 (노드 합치기) ===")
+    for word in ["app", "banana", "card"]:
+        radix.delete(word)
+        print(f"'{word}' 삭제 후 검색: {radix.search(word)}")
+    radix.print_tst_detailed()
+
+    # URL/파일 경로처럼 긴 키에서 노드 수 비교
+    print("=== 노드 수 비교 (URL, 파일 경로) ===")
+    paths = [
+        "https://example.com/products/keyboards/mechanical",
+        "https://example.com/products/keyboards/membrane",
+        "https://example.com/products/mice/wireless",
+        "https://example.com/support/contact",
+        "/usr/local/lib/python3.11/site-packages/numpy/__init__.py",
+        "/usr/local/lib/python3.11/site-packages/pandas/__init__.py",
+    ]
+    plain = TST()
+    compressed = RadixTST()
+    for value, path in enumerate(paths):
+        plain.insert(path, value)
+        compressed.insert(path, value)
+
+    print(f"TST 노드 수: {count_nodes(plain.root)}")
+    print(f"Radix TST 노드 수: {compressed.node_count()}")
+    same = compressed.get_all_words() == plain.get_sorted_words()
+    print(f"모든 단어와 값이 같은가: {same}")
+
+    print("\n테스트 완료")
+
+
+if __name__ == "__main__":
+    test_radix_tst()
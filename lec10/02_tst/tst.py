@@ -1,5 +1,10 @@
 # tst.py
 
+import heapq
+import random
+import time
+
+
 class TSTNode:
     """
     TST (Ternary Search Tree) 노드 클래스
@@ -11,6 +16,7 @@ class TSTNode:
     - left: 현재 문자보다 작은 문자
     - middle: 다음 문자로 이동
     - right: 현재 문자보다 큰 문자
+    - max_score: left/middle/right를 포함한 서브트리에 저장된 값 중 최댓값 (없으면 None)
     """
     
     def __init__(self, data):
@@ -20,6 +26,7 @@ class TSTNode:
         self.left = None
         self.middle = None
         self.right = None
+        self.max_score = None
 
 
 class TST:
@@ -74,8 +81,25 @@ class TST:
                 # 다음 문자로 이동
                 node.middle = self._insert(node.middle, word, value, index + 1)
         
+        node.max_score = self._subtree_max(node)
         return node
     
+    def _subtree_max(self, node):
+        """
+        노드 자신의 값과 세 자식의 max_score로 서브트리 최댓값 계산
+        
+        Args:
+            node (TSTNode): 계산할 노드
+            
+        Returns:
+            int: 서브트리의 최댓값 (값이 없으면 None)
+        """
+        scores = [child.max_score for child in (node.left, node.middle, node.right)
+                  if child is not None and child.max_score is not None]
+        if node.has_value:
+            scores.append(node.value)
+        return max(scores) if scores else None
+    
     def insert(self, word, value):
         """
         TST에 단어와 값을 삽입
@@ -288,6 +312,63 @@ class TST:
         
         return results
     
+    def top_k_with_prefix(self, prefix, k):
+        """
+        주어진 접두사로 시작하는 단어 중 값이 큰 상위 k개를 반환
+        
+        노드마다 저장된 서브트리 최댓값(max_score)을 우선순위로 사용하는 최선 우선 탐색으로,
+        모든 단어를 수집하지 않고 값이 큰 경로만 따라갑니다.
+        
+        Args:
+            prefix (str): 검색할 접두사
+            k (int): 반환할 단어의 최대 개수
+            
+        Returns:
+            list: (단어, 값) 튜플의 리스트 (값 내림차순, 같으면 사전순)
+        """
+        results = []
+        if k <= 0:
+            return results
+        
+        # (-점수, 문자열, 종류, 순번, 노드): 종류 0은 완성된 단어, 1은 펼치지 않은 서브트리
+        # 서브트리의 문자열은 노드 앞까지의 접두사이므로 그 아래 모든 단어보다 사전순으로 앞섬
+        heap = []
+        counter = 0
+        
+        if not prefix:
+            start = self.root
+        else:
+            prefix_node = self._get_node_by_prefix(self.root, prefix, 0)
+            if prefix_node is None:
+                return results  # 접두사가 존재하지 않음
+            if prefix_node.has_value:
+                heap.append((-prefix_node.value, prefix, 0, counter, None))
+                counter += 1
+            start = prefix_node.middle
+        
+        if start is not None and start.max_score is not None:
+            heapq.heappush(heap, (-start.max_score, prefix, 1, counter, start))
+            counter += 1
+        
+        while heap and len(results) < k:
+            score, word, kind, _, node = heapq.heappop(heap)
+            if kind == 0:
+                results.append((word, -score))
+                continue
+            
+            current_word = word + node.data
+            if node.has_value:
+                heapq.heappush(heap, (-node.value, current_word, 0, counter, None))
+                counter += 1
+            for child, child_prefix in ((node.left, word), (node.middle, current_word),
+                                        (node.right, word)):
+                if child is not None and child.max_score is not None:
+                    heapq.heappush(heap, (-child.max_score, child_prefix, 1,
+                                          counter, child))
+                    counter += 1
+        
+        return results
+    
     def _has_children(self, node):
         """
         노드가 자식을 가지고 있는지 확인
@@ -341,6 +422,7 @@ class TST:
                 if not node.has_value and not self._has_children(node):
                     return None
         
+        node.max_score = self._subtree_max(node)
         return node
     
     def delete(self, word):
@@ -644,13 +726,35 @@ def demo_auto_complete():
     user_inputs = ["pro", "cl", "ar", "st"]
     
     for user_input in user_inputs:
-        suggestions = tst.get_words_with_prefix(user_input)
-        # 빈도수로 정렬
-        suggestions.sort(key=lambda x: x[1], reverse=True)
+        # 빈도수 상위 5개만
+        suggestions = tst.top_k_with_prefix(user_input, 5)
         
         print(f"\n'{user_input}' 입력 시 추천 단어:")
-        for word, freq in suggestions[:5]:  # 상위 5개만
+        for word, freq in suggestions:
             print(f"  {word} (빈도: {freq})")
+    
+    # 큰 사전에서 전체 수집 후 정렬과 top-k 검색 비교
+    print("\n=== 상위 10개 추천 성능 비교 (무작위 단어 100000개) ===")
+    random.seed(42)
+    large_tst = TST()
+    for _ in range(100000):
+        word = "".join(random.choice("abcdefghijklmnopqrstuvwxyz")
+                       for _ in range(random.randint(3, 12)))
+        large_tst.insert(word, random.randint(1, 1000000))
+    
+    start = time.perf_counter()
+    suggestions = large_tst.get_words_with_prefix("a")
+    suggestions.sort(key=lambda x: (-x[1], x[0]))
+    collect_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    top_suggestions = large_tst.top_k_with_prefix("a", 10)
+    top_k_time = time.perf_counter() - start
+    
+    print(f"'a'로 시작하는 단어 수: {len(suggestions)}")
+    print(f"전체 수집 후 정렬: {collect_time * 1000:.2f} ms")
+    print(f"top_k_with_prefix: {top_k_time * 1000:.3f} ms")
+    print(f"결과가 같은가: {top_suggestions == suggestions[:10]}")
 
 
 def performance_comparison():
@@ -0,0 +1,726 @@
+# compiled_regex.py
+import time
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from regex import RegexMatcher
+
+# 일반적인 텍스트에서 자주 나오는 문자 순서 (뒤에 있거나 없는 문자일수록 드묾)
+COMMON_CHARS = " etaoinsrhldcumfpgwybvkxjqz"
+
+
+class LazyDFA:
+    """
+    Thompson NFA를 필요할 때마다 DFA로 변환하며 실행하는 클래스
+
+    NFA 상태 i는 "패턴의 i번째 항목을 매칭할 차례"를 뜻하고, len(items)가 수락 상태입니다.
+    DFA 상태는 NFA 상태들의 집합이며, 처음 보는 (DFA 상태, 문자) 조합에서만 전이를 계산해
+    캐시에 저장합니다. 캐시된 전이는 딕셔너리 조회 한 번이므로 문자당 메모리 할당이 없습니다.
+
+    시간 복잡도: O(n) (캐시 적중 시), 새 전이 계산은 O(m) where m is pattern length
+    공간 복잡도: O(MAX_STATES * 문자 종류)
+    """
+
+    MAX_STATES = 1024  # 캐시된 DFA 상태 수가 이를 넘으면 캐시를 비움
+
+    def __init__(self, items: List[Tuple[Optional[str], bool]], restart: bool):
+        """
+        Args:
+            items (List[Tuple[Optional[str], bool]]): (문자 또는 '.'이면 None, '*' 여부) 리스트
+            restart (bool): 매 위치에서 새 매칭을 시작할지 여부 (텍스트 중간 검색용)
+        """
+        self.items = items
+        self.accept = len(items)
+        self.restart = restart
+        self.start_set = self._closure([0])
+
+        self.sets: List[FrozenSet[int]] = []
+        self.ids: Dict[FrozenSet[int], int] = {}
+        self.transitions: List[Dict[str, int]] = []
+        self.accepting: List[bool] = []
+        self.dead: List[bool] = []
+        self.start = self._state_id(self.start_set)
+        self.scanned = 0  # 마지막 실행에서 읽은 마지막 위치
+
+    def _closure(self, positions) -> FrozenSet[int]:
+        """
+        ε-closure: 'x*' 항목은 0번 반복으로 건너뛸 수 있음
+
+        Args:
+            positions: NFA 상태들
+
+        Returns:
+            FrozenSet[int]: ε 전이로 도달 가능한 모든 NFA 상태
+        """
+        closed = set()
+        stack = list(positions)
+        while stack:
+            position = stack.pop()
+            if position in closed:
+                continue
+            closed.add(position)
+            if position < self.accept and self.items[position][1]:
+                stack.append(position + 1)
+        return frozenset(closed)
+
+    def _state_id(self, state_set: FrozenSet[int]) -> int:
+        """
+        NFA 상태 집합에 해당하는 DFA 상태 번호 (없으면 새로 등록)
+
+        Args:
+            state_set (FrozenSet[int]): NFA 상태 집합
+
+        Returns:
+            int: DFA 상태 번호
+        """
+        state = self.ids.get(state_set)
+        if state is None:
+            state = len(self.sets)
+            self.ids[state_set] = state
+            self.sets.append(state_set)
+            self.transitions.append({})
+            self.accepting.append(self.accept in state_set)
+            self.dead.append(not state_set)
+        return state
+
+    def _flush(self) -> None:
+        """캐시를 비우고 시작 상태만 다시 등록 (리스트는 제자리에서 비움)"""
+        self.sets.clear()
+        self.ids.clear()
+        self.transitions.clear()
+        self.accepting.clear()
+        self.dead.clear()
+        self.start = self._state_id(self.start_set)
+
+    def _step(self, state: int, char: str) -> int:
+        """
+        DFA 상태에서 문자 하나를 읽은 다음 상태를 계산하고 캐시에 저장
+
+        Args:
+            state (int): 현재 DFA 상태
+            char (str): 입력 문자
+
+        Returns:
+            int: 다음 DFA 상태
+        """
+        next_positions = []
+        for position in self.sets[state]:
+            if position == self.accept:
+                continue
+            item_char, is_star = self.items[position]
+            if item_char is None or item_char == char:
+                # 'x*'는 같은 상태에 머물고, 일반 문자는 다음 항목으로 이동
+                next_positions.append(position if is_star else position + 1)
+        if self.restart:
+            next_positions.append(0)
+
+        next_set = self._closure(next_positions)
+        if next_set not in self.ids and len(self.sets) >= self.MAX_STATES:
+            # 캐시가 가득 차면 비우고 새로 시작 (현재 상태 번호는 더 이상 쓰지 않음)
+            self._flush()
+            return self._state_id(next_set)
+
+        next_state = self._state_id(next_set)
+        self.transitions[state][char] = next_state
+        return next_state
+
+    def end(self, text: str, start: int, stop_on_accept: bool,
+            nonempty: bool = False) -> int:
+        """
+        text[start:]를 복사하지 않고 한 번만 읽으며 실행
+
+        Args:
+            text (str): 입력 텍스트
+            start (int): 읽기 시작할 위치
+            stop_on_accept (bool): 수락 상태에 처음 도달한 위치에서 멈출지 여부
+                                   (False면 텍스트 끝에서 수락 상태인지 확인)
+            nonempty (bool): 빈 매칭(문자를 하나도 읽지 않은 수락)을 무시할지 여부
+
+        Returns:
+            int: 매칭이 끝난 위치 (매칭되지 않으면 -1)
+        """
+        transitions, accepting, dead = self.transitions, self.accepting, self.dead
+        state = self.start
+        index = start
+
+        if stop_on_accept and not nonempty and accepting[state]:
+            self.scanned = index
+            return index
+
+        for char in islice(text, start, None):
+            index += 1
+            next_state = transitions[state].get(char)
+            if next_state is None:
+                next_state = self._step(state, char)
+            state = next_state
+
+            if dead[state]:
+                self.scanned = index
+                return -1
+            if stop_on_accept and accepting[state]:
+                self.scanned = index
+                return index
+
+        self.scanned = index
+        if accepting[state] and (index > start or not nonempty):
+            return index
+        return -1
+
+    def run(self, text: str, stop_on_accept: bool) -> bool:
+        """
+        텍스트를 처음부터 끝까지 한 번만 읽으며 실행
+
+        Args:
+            text (str): 입력 텍스트
+            stop_on_accept (bool): 수락 상태에 도달하면 바로 True를 반환할지 여부
+                                   (False면 텍스트 끝에서 수락 상태인지 확인)
+
+        Returns:
+            bool: 매칭되면 True, 아니면 False
+        """
+        return self.end(text, 0, stop_on_accept) >= 0
+
+    def accepting_positions(self, text: str, start: int) -> bytearray:
+        """
+        text를 뒤에서부터 start까지 한 번만 읽으며 각 위치에서의 수락 여부 기록
+        (뒤집은 패턴으로 만든 DFA에서 사용하면 "이 위치에서 매칭이 시작되는가"가 됨)
+
+        Args:
+            text (str): 입력 텍스트
+            start (int): 읽기를 멈출 위치
+
+        Returns:
+            bytearray: 길이 len(text) + 1, 수락 상태로 지나간 위치는 1
+        """
+        transitions, accepting, dead = self.transitions, self.accepting, self.dead
+        size = len(text)
+        positions = bytearray(size + 1)
+        state = self.start
+        positions[size] = accepting[state]
+
+        for index in range(size - 1, start - 1, -1):
+            char = text[index]
+            next_state = transitions[state].get(char)
+            if next_state is None:
+                next_state = self._step(state, char)
+            state = next_state
+
+            if dead[state]:
+                break
+            positions[index] = accepting[state]
+
+        return positions
+
+    def state_count(self) -> int:
+        """현재 캐시된 DFA 상태 수"""
+        return len(self.sets)
+
+
+class CompiledRegex:
+    """
+    RegexMatcher와 같은 문법('.', '*', '^', '$')을 NFA로 변환해 lazy DFA로 매칭하는 클래스
+
+    패턴을 한 번만 해석하고, 텍스트를 슬라이싱하거나 역추적하지 않으므로
+    'a*a*a*a*b' 같은 패턴에서도 텍스트 길이에 선형인 시간을 보장합니다.
+    '^'는 패턴 맨 앞, '$'는 패턴 맨 끝에서만 앵커이고 그 밖의 위치에서는 일반 문자입니다.
+
+    컴파일할 때 미리 계산하는 정보:
+    - literal_prefix: 패턴 맨 앞의 반복되지 않는 일반 문자열 (매칭 시작 위치 후보를 거름)
+    - required_literals: 매칭되는 문자열에 반드시 들어가는 일반 문자열들 (텍스트를 빠르게 거절)
+    - skip_literal, skip_offset: 매칭 시작 위치에서 항상 skip_offset만큼 떨어져 나타나는
+      가장 드문 일반 문자열 (str.find로 후보 위치까지 건너뜀, 없으면 None)
+    - min_length: 매칭되는 문자열의 최소 길이
+
+    match_anywhere, count_matches, find_match, replace_all 모두 먼저 후보 위치에서만
+    DFA를 실행하고, 후보들이 겹쳐 같은 문자를 다시 읽게 되면 텍스트를 한 번만 읽는
+    방식(중간 검색 DFA 또는 뒤집은 패턴의 DFA)으로 전환하므로 선형 시간을 유지합니다.
+
+    시간 복잡도: O(n) where n is text length (DFA 캐시가 채워진 뒤)
+    공간 복잡도: O(m) for the NFA + DFA 캐시
+    """
+
+    def __init__(self, pattern: str):
+        """
+        Args:
+            pattern (str): 정규식 패턴
+        """
+        self.pattern = pattern
+
+        body = pattern
+        self.anchored_start = body.startswith('^')
+        if self.anchored_start:
+            body = body[1:]
+        self.anchored_end = body.endswith('$')
+        if self.anchored_end:
+            body = body[:-1]
+
+        self.items = self._parse(body)
+
+        prefix = []
+        for char, is_star in self.items:
+            if char is None or is_star:
+                break
+            prefix.append(char)
+        self.literal_prefix = "".join(prefix)
+        self.min_length = sum(1 for _, is_star in self.items if not is_star)
+
+        # 반복되지 않는 일반 문자의 연속 구간과 시작 위치로부터의 거리 (앞에 '*'가 있으면 None)
+        # ('*'가 나오기 전까지는 항목 하나가 정확히 한 문자이므로 거리 = 항목 번호)
+        runs = []
+        run_start = None
+        run_fixed = no_star_before = True
+        for i, (char, is_star) in enumerate(self.items + [(None, False)]):
+            is_literal = char is not None and not is_star
+            if is_literal and run_start is None:
+                run_start, run_fixed = i, no_star_before
+            elif not is_literal and run_start is not None:
+                run = "".join(char for char, _ in self.items[run_start:i])
+                runs.append((run, run_start if run_fixed else None))
+                run_start = None
+            if is_star:
+                no_star_before = False
+        self.required_literals = tuple(run for run, _ in runs)
+
+        fixed_runs = [(run, run_offset) for run, run_offset in runs
+                      if run_offset is not None]
+        if fixed_runs:
+            self.skip_literal, self.skip_offset = max(
+                fixed_runs, key=lambda entry: (len(entry[0]), self._rarity(entry[0])))
+        else:
+            self.skip_literal, self.skip_offset = None, 0
+
+        self._anchored = LazyDFA(self.items, restart=False)
+        self._floating = LazyDFA(self.items, restart=True)
+        # 뒤집은 패턴: 뒤에서부터 읽어 각 위치에서 매칭이 시작될 수 있는지 계산
+        # ('$'가 있으면 매칭이 텍스트 끝에서 끝나야 하므로 끝에서만 시작)
+        self._reverse = LazyDFA(self.items[::-1], restart=not self.anchored_end)
+
+    @staticmethod
+    def _parse(body: str) -> List[Tuple[Optional[str], bool]]:
+        """
+        패턴을 (문자, '*' 여부) 항목 리스트로 변환 (RegexMatcher.match와 같은 규칙)
+
+        Args:
+            body (str): 앵커를 제외한 패턴
+
+        Returns:
+            List[Tuple[Optional[str], bool]]: 항목 리스트 ('.'은 None)
+        """
+        items = []
+        i = 0
+        while i < len(body):
+            char = None if body[i] == '.' else body[i]
+            if i + 1 < len(body) and body[i + 1] == '*':
+                items.append((char, True))
+                i += 2
+            else:
+                items.append((char, False))
+                i += 1
+        return items
+
+    def _rejects(self, text: str) -> bool:
+        """
+        미리 계산한 정보만으로 매칭이 불가능한 텍스트인지 확인
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            bool: 확실히 매칭되지 않으면 True
+        """
+        if len(text) < self.min_length:
+            return True
+        for literal in self.required_literals:
+            if literal not in text:
+                return True
+        return False
+
+    @staticmethod
+    def _rarity(literal: str) -> int:
+        """
+        문자열에서 가장 드문 문자의 순위 (클수록 드묾)
+
+        Args:
+            literal (str): 일반 문자열
+
+        Returns:
+            int: COMMON_CHARS에서의 위치 (없는 문자는 len(COMMON_CHARS))
+        """
+        rarity = 0
+        for char in literal:
+            rank = COMMON_CHARS.find(char.lower())
+            rarity = max(rarity, len(COMMON_CHARS) if rank == -1 else rank)
+        return rarity
+
+    def match(self, text: str) -> bool:
+        """
+        텍스트의 시작 부분이 패턴과 매칭되는지 확인 (RegexMatcher.match와 같은 의미)
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            bool: 매칭되면 True, 아니면 False
+        """
+        if not text.startswith(self.literal_prefix) or self._rejects(text):
+            return False
+        return self._anchored.run(text, stop_on_accept=not self.anchored_end)
+
+    def match_anywhere(self, text: str) -> bool:
+        """
+        텍스트의 어느 위치에서든 패턴 매칭 시도
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            bool: 매칭되면 True, 아니면 False
+        """
+        if self._rejects(text):
+            return False
+        if self.anchored_start:
+            return self.match(text)
+
+        stop_on_accept = not self.anchored_end
+        if self.skip_literal is None:
+            return self._floating.run(text, stop_on_accept)
+
+        # str.find로 후보 위치까지 건너뛰고 그 위치에서만 DFA 실행
+        position = self._next_candidate(text, 0)
+        while position != -1:
+            if self._anchored.end(text, position, stop_on_accept) >= 0:
+                return True
+            next_position = self._next_candidate(text, position + 1)
+            if next_position != -1 and next_position < self._anchored.scanned:
+                # 후보들이 겹쳐 같은 문자를 다시 읽게 되면 선형 시간을 위해 중간 검색 DFA로 전환
+                return self._floating.end(text, next_position, stop_on_accept) >= 0
+            position = next_position
+        return False
+
+    def _next_candidate(self, text: str, position: int) -> int:
+        """
+        position 이후에서 매칭이 시작될 수 있는 첫 위치 (skip_literal로 건너뜀)
+
+        Args:
+            text (str): 검색할 텍스트
+            position (int): 검색을 시작할 위치
+
+        Returns:
+            int: 시작 위치 후보 (없으면 -1)
+        """
+        if self.skip_literal is None:
+            return position if position <= len(text) else -1
+        found = text.find(self.skip_literal, position + self.skip_offset)
+        return found - self.skip_offset if found != -1 else -1
+
+    def _match_starts(self, text: str, start: int, nonempty: bool) -> bytearray:
+        """
+        start 이후 각 위치에서 매칭이 시작될 수 있는지 텍스트를 한 번만 읽어 계산
+
+        Args:
+            text (str): 검색할 텍스트
+            start (int): 계산을 시작할 위치
+            nonempty (bool): 빈 문자열이 아닌 매칭만 셀지 여부
+
+        Returns:
+            bytearray: 길이 len(text) + 1, 매칭이 시작될 수 있는 위치는 1
+        """
+        size = len(text)
+        if nonempty and self.min_length == 0 and not self.anchored_end:
+            # 모든 항목이 'x*'이면 한 문자라도 읽을 수 있는 위치가 곧 시작 위치
+            chars = {char for char, _ in self.items}
+            starts = bytearray(size + 1)
+            for index in range(start, size):
+                if None in chars or text[index] in chars:
+                    starts[index] = 1
+            return starts
+
+        starts = self._reverse.accepting_positions(text, start)
+        if nonempty:
+            starts[size] = 0  # 텍스트 끝에서 시작하는 매칭은 빈 문자열뿐
+        return starts
+
+    def _iter_matches(self, text: str, start: int = 0):
+        """
+        start 이후에서 겹치지 않는 (빈 문자열이 아닌) 가장 짧은 매칭들을 왼쪽부터 나열
+
+        Args:
+            text (str): 검색할 텍스트
+            start (int): 검색을 시작할 위치
+
+        Yields:
+            Tuple[int, int]: (시작 위치, 끝 위치)
+        """
+        if self._rejects(text):
+            return
+
+        stop_on_accept = not self.anchored_end
+        if self.anchored_start:
+            if start == 0 and text.startswith(self.literal_prefix):
+                end = self._anchored.end(text, 0, stop_on_accept, nonempty=True)
+                if end >= 0:
+                    yield (0, end)
+            return
+
+        # 후보 위치에서만 DFA를 실행하다가, 실패한 실행이 다음 후보를 넘어서까지 읽었으면
+        # 남은 텍스트의 시작 가능 위치를 한 번에 계산 (같은 문자를 반복해서 읽지 않음)
+        starts = None
+        position = self._next_candidate(text, start)
+        while position != -1:
+            if starts is not None:
+                position = starts.find(1, position)
+                if position == -1:
+                    return
+
+            end = self._anchored.end(text, position, stop_on_accept, nonempty=True)
+            if end >= 0:
+                yield (position, end)
+                position = self._next_candidate(text, end)
+                continue
+
+            next_position = self._next_candidate(text, position + 1)
+            overlapped = next_position != -1 and next_position < self._anchored.scanned
+            if starts is None and overlapped:
+                starts = self._match_starts(text, next_position, nonempty=True)
+            position = next_position
+
+    def count_matches(self, text: str) -> int:
+        """
+        텍스트에서 매칭이 시작되는 위치의 개수
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            int: 매칭 횟수
+        """
+        if self._rejects(text):
+            return 0
+
+        stop_on_accept = not self.anchored_end
+        if self.anchored_start:
+            if not text.startswith(self.literal_prefix):
+                return 0
+            return 1 if self._anchored.end(text, 0, stop_on_accept) >= 0 else 0
+
+        count = 0
+        position = self._next_candidate(text, 0)
+        while position != -1:
+            if self._anchored.end(text, position, stop_on_accept) >= 0:
+                count += 1
+            next_position = self._next_candidate(text, position + 1)
+            if next_position != -1 and next_position < self._anchored.scanned:
+                # 후보가 겹치면 나머지 위치는 뒤에서부터 한 번만 읽어 셈
+                starts = self._match_starts(text, next_position, nonempty=False)
+                return count + starts.count(1, next_position)
+            position = next_position
+        return count
+
+    def find_match(self, text: str, start: int = 0) -> Optional[Tuple[int, int]]:
+        """
+        가장 왼쪽에서 시작하는 가장 짧은 (빈 문자열이 아닌) 매칭 찾기
+
+        Args:
+            text (str): 검색할 텍스트
+            start (int): 검색을 시작할 위치
+
+        Returns:
+            Optional[Tuple[int, int]]: (시작 위치, 길이) 또는 None
+        """
+        for position, end in self._iter_matches(text, start):
+            return (position, end - position)
+        return None
+
+    def replace_first(self, text: str, replacement: str) -> str:
+        """
+        첫 번째 매칭되는 부분을 replacement로 교체
+
+        Args:
+            text (str): 원본 텍스트
+            replacement (str): 교체할 문자열
+
+        Returns:
+            str: 교체된 텍스트
+        """
+        match_info = self.find_match(text)
+        if match_info is None:
+            return text
+
+        pos, length = match_info
+        return text[:pos] + replacement + text[pos + length:]
+
+    def replace_all(self, text: str, replacement: str) -> str:
+        """
+        겹치지 않는 모든 매칭을 왼쪽부터 replacement로 교체 (텍스트를 한 번만 훑음)
+
+        Args:
+            text (str): 원본 텍스트
+            replacement (str): 교체할 문자열
+
+        Returns:
+            str: 교체된 텍스트
+        """
+        pieces = []
+        last = 0
+
+        for pos, end in self._iter_matches(text):
+            pieces.append(text[last:pos])
+            pieces.append(replacement)
+            last = end
+
+        pieces.append(text[last:])
+        return "".join(pieces)
+
+    def dfa_state_count(self) -> int:
+        """지금까지 만들어진 DFA 상태 수 (시작 위치 고정 + 중간 검색)"""
+        return self._anchored.state_count() + self._floating.state_count()
+
+
+@lru_cache(maxsize=256)
+def compile(pattern: str) -> CompiledRegex:
+    """
+    패턴을 컴파일 (최근에 사용한 패턴은 LRU 캐시에서 그대로 반환)
+
+    Args:
+        pattern (str): 정규식 패턴
+
+    Returns:
+        CompiledRegex: 컴파일된 패턴 객체
+    """
+    return CompiledRegex(pattern)
+
+
+def run_tests():
+    """테스트 케이스 실행"""
+    print("=== Lazy DFA 정규식 엔진 테스트 ===\n")
+
+    test_cases = [
+        ("abc", "abc", True), ("a.c", "abc", True), ("a.c", "ac", False),
+        ("a*", "", True), ("a*b", "aaab", True), (".*", "anything", True),
+        ("ca*t", "ct", True), ("ca*t", "caaaat", True), ("ab*c", "abbbbc", True),
+        ("^hello", "hello world", True), ("^hello", "say hello", False),
+        ("world$", "hello world", True), ("world$", "world peace", False),
+        ("a*b$", "xxaaab", True), ("^a.*z$", "abcz", True), ("^a.*z$", "abczz!", False),
+    ]
+
+    print("=== 기본 매칭 테스트 ===")
+    pass_count = 0
+    for pattern, text, expected in test_cases:
+        result = CompiledRegex(pattern).match_anywhere(text)
+        status = "PASS" if result == expected else "FAIL"
+        print(f"패턴: '{pattern:<8}', 텍스트: '{text:<12}' -> {str(result):<5} ({status})")
+        if result == expected:
+            pass_count += 1
+    print(f"\n테스트 결과: {pass_count}/{len(test_cases)} 통과\n")
+
+    # 역추적 방식이 지수 시간이 걸리는 패턴
+    print("=== 역추적 vs Lazy DFA 성능 비교 ===")
+    for count in [4, 6, 8]:
+        pattern = "a*" * count + "b"
+        text = "a" * 16
+
+        matcher = RegexMatcher()
+        start_time = time.perf_counter()
+        backtracking_result = matcher.match(pattern, text)
+        backtracking_time = (time.perf_counter() - start_time) * 1000
+
+        compiled = CompiledRegex(pattern)
+        start_time = time.perf_counter()
+        dfa_result = compiled.match(text)
+        dfa_time = (time.perf_counter() - start_time) * 1000
+
+        print(f"패턴: {pattern}, 텍스트: 'a' * {len(text)}")
+        print(f"  역추적: {backtracking_result}, {backtracking_time:.2f} ms "
+              f"(비교 횟수: {matcher.comparisons})")
+        print(f"  Lazy DFA: {dfa_result}, {dfa_time:.3f} ms "
+              f"(DFA 상태 수: {compiled.dfa_state_count()})")
+    print()
+
+    # 긴 텍스트에서도 문자당 한 번의 전이
+    print("=== 긴 텍스트 테스트 ===")
+    compiled = CompiledRegex(".*error.*timeout")
+    long_text = "x" * 1000000 + "error" + "y" * 1000 + "timeout"
+    start_time = time.perf_counter()
+    result = compiled.match_anywhere(long_text)
+    elapsed = (time.perf_counter() - start_time) * 1000
+    print(f"텍스트 길이: {len(long_text)}, 결과: {result}, 실행 시간: {elapsed:.1f} ms")
+
+    print()
+
+    # 컴파일된 패턴으로 치환과 매칭 횟수
+    print("=== 치환 / 매칭 횟수 테스트 ===")
+    pattern = compile("world")
+    original_text = "Hello world, world is beautiful"
+    print(f"원본: {original_text}")
+    print(f"첫 번째 치환: {pattern.replace_first(original_text, 'universe')}")
+    print(f"모든 치환: {pattern.replace_all(original_text, 'universe')}")
+    print(f"'abc' 매칭 횟수 (abcabcabc): {compile('abc').count_matches('abcabcabc')}")
+    print(f"'ERROR:.*' 정보: 접두사 '{compile('ERROR:.*').literal_prefix}', "
+          f"필수 문자열 {list(compile('ERROR:.*').required_literals)}")
+    print()
+
+    # 같은 패턴 몇 개를 많은 줄에 반복 적용
+    print("=== 반복 적용 성능 비교 (패턴 3개 x 로그 20000줄) ===")
+    log_lines = [f"{level}: request {i} took {i % 97} ms"
+                 for i, level in zip(range(20000),
+                                     ["INFO", "DEBUG", "ERROR", "WARN"] * 5000)]
+    patterns = ["^ERROR", "took 9.* ms", "request 1.*7 "]
+
+    start_time = time.perf_counter()
+    matcher = RegexMatcher()
+    slow_counts = [sum(1 for line in log_lines if matcher.match_anywhere(pattern, line))
+                   for pattern in patterns]
+    backtracking_time = (time.perf_counter() - start_time) * 1000
+
+    compile.cache_clear()
+    start_time = time.perf_counter()
+    fast_counts = [sum(1 for line in log_lines if compile(pattern).match_anywhere(line))
+                   for pattern in patterns]
+    compiled_time = (time.perf_counter() - start_time) * 1000
+
+    print(f"RegexMatcher.match_anywhere: {backtracking_time:.1f} ms, "
+          f"매칭 수: {slow_counts}")
+    print(f"compile(pattern).match_anywhere: {compiled_time:.1f} ms, "
+          f"매칭 수: {fast_counts}")
+    print(f"LRU 캐시: {compile.cache_info()}")
+    print()
+
+    # 매칭이 드문 큰 텍스트에서 일반 문자열로 후보 위치까지 건너뛰기
+    print("=== 건너뛰기 검색 테스트 (텍스트 5000000자, 매칭 3개) ===")
+    chunk = "INFO: request handled in 12 ms\n" * 50000
+    big_text = (chunk + "ERROR: disk full on /dev/sda1\n" +
+                chunk * 2 + "ERROR: disk full on /dev/sdb1\n")
+    big_text = big_text[:5000000 - 30] + "ERROR: disk full on /dev/sdc1\n"
+    pattern = "disk full on /dev/sd.1"
+
+    compiled = CompiledRegex(pattern)
+    print(f"패턴: {pattern}, 건너뛰기 문자열: '{compiled.skip_literal}' "
+          f"(시작 위치 + {compiled.skip_offset})")
+
+    start_time = time.perf_counter()
+    skip_count = compiled.count_matches(big_text)
+    skip_found = compiled.match_anywhere(big_text[1000:])
+    skip_time = (time.perf_counter() - start_time) * 1000
+
+    no_skip = CompiledRegex(pattern)
+    no_skip.skip_literal = None  # 비교용: 건너뛰기 끄기 (모든 위치를 DFA로 확인)
+    start_time = time.perf_counter()
+    scan_found = no_skip.match_anywhere(big_text[1000:])
+    scan_time = (time.perf_counter() - start_time) * 1000
+
+    print(f"건너뛰기 사용: {skip_time:.1f} ms (매칭 수: {skip_count}, 결과: {skip_found})")
+    print(f"모든 위치를 DFA로 확인: {scan_time:.1f} ms (결과: {scan_found})")
+
+    # 후보가 겹치는 최악의 입력에서도 선형 시간 유지
+    worst_text = "c" + "ab" * 200000
+    start_time = time.perf_counter()
+    result = CompiledRegex("ab.*c").match_anywhere(worst_text)
+    elapsed = (time.perf_counter() - start_time) * 1000
+    print(f"최악의 입력 (ab.*c, 'c' + 'ab' * 200000): {result}, {elapsed:.1f} ms")
+
+    print("\n테스트 완료")
+
+
+if __name__ == "__main__":
+    run_tests()
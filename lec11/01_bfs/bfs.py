@@ -6,8 +6,15 @@ BFS (Breadth-First Search) 알고리즘 구현
 공간 복잡도: O(V) - 큐와 방문 집합을 위한 공간
 """
 
+import os
+import sys
 from collections import deque, defaultdict
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Union
+
+# 공용 CSR 그래프 모듈을 import하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '09_csr_graph'))
+from csr_graph import CSRGraph, CSRGraphBuilder  # noqa: E402
 
 
 class Graph:
@@ -46,6 +53,18 @@ class Graph:
     """
     self.adj_list[src].append(dest)
 
+  def neighbors(self, vertex: int) -> List[int]:
+    """
+    인접 정점 반환 (CSRGraph와 동일한 인터페이스)
+
+    Args:
+        vertex: 정점
+
+    Returns:
+        인접 정점 리스트
+    """
+    return self.adj_list[vertex]
+
   def get_vertices(self) -> Set[int]:
     """
     그래프의 모든 정점 반환
@@ -71,12 +90,12 @@ class Graph:
     print()
 
 
-def bfs(graph: Graph, start_vertex: int) -> List[int]:
+def bfs(graph: Union[Graph, CSRGraph], start_vertex: int) -> List[int]:
   """
   BFS 알고리즘 구현
 
   Args:
-      graph: 탐색할 그래프
+      graph: 탐색할 그래프 (Graph 또는 CSRGraph)
       start_vertex: 시작 정점
 
   Returns:
@@ -110,7 +129,7 @@ def bfs(graph: Graph, start_vertex: int) -> List[int]:
 
     # 현재 정점의 모든 인접 정점을 확인
     # 정렬해서 일관된 순서로 탐색
-    neighbors = sorted(graph.adj_list[current_vertex])
+    neighbors = sorted(graph.neighbors(current_vertex))
     for neighbor in neighbors:
       # 인접 정점이 아직 탐색되지 않았다면
       if neighbor not in explored:
@@ -121,13 +140,13 @@ def bfs(graph: Graph, start_vertex: int) -> List[int]:
   return bfs_order
 
 
-def bfs_with_levels(graph: Graph, start_vertex: int) -> Dict[int, int]:
+def bfs_with_levels(graph: Union[Graph, CSRGraph], start_vertex: int) -> Dict[int, int]:
   """
   레벨 정보와 함께 BFS 실행
   각 정점까지의 최단 거리(레벨)를 계산
 
   Args:
-      graph: 탐색할 그래프
+      graph: 탐색할 그래프 (Graph 또는 CSRGraph)
       start_vertex: 시작 정점
 
   Returns:
@@ -155,7 +174,7 @@ def bfs_with_levels(graph: Graph, start_vertex: int) -> Dict[int, int]:
     print(f"Vertex {current_vertex} (level {current_level})")
 
     # 인접 정점들 처리
-    neighbors = sorted(graph.adj_list[current_vertex])
+    neighbors = sorted(graph.neighbors(current_vertex))
     for neighbor in neighbors:
       if neighbor not in explored:
         explored.add(neighbor)
@@ -165,12 +184,13 @@ def bfs_with_levels(graph: Graph, start_vertex: int) -> Dict[int, int]:
   return levels
 
 
-def bfs_shortest_path(graph: Graph, start: int, target: int) -> List[int]:
+def bfs_shortest_path(graph: Union[Graph, CSRGraph], start: int,
+                      target: int) -> List[int]:
   """
   BFS를 이용한 최단 경로 찾기 (무가중 그래프)
 
   Args:
-      graph: 탐색할 그래프
+      graph: 탐색할 그래프 (Graph 또는 CSRGraph)
       start: 시작 정점
       target: 목표 정점
 
@@ -194,7 +214,7 @@ def bfs_shortest_path(graph: Graph, start: int, target: int) -> List[int]:
   while queue:
     current_vertex = queue.popleft()
 
-    neighbors = graph.adj_list[current_vertex]
+    neighbors = graph.neighbors(current_vertex)
     for neighbor in neighbors:
       if neighbor not in explored:
         explored.add(neighbor)
@@ -253,6 +273,17 @@ def main():
   graph2.print_graph()
   bfs(graph2, 0)
 
+  print("\n=== BFS on CSR graph ===")
+
+  # 같은 간선을 CSR 그래프로 고정하여 탐색
+  builder = CSRGraphBuilder(5, directed=False)
+  builder.add_edges([(0, 1), (0, 4), (1, 2), (1, 3), (1, 4), (2, 3), (3, 4)])
+  csr_graph = builder.build()
+
+  csr_graph.print_graph()
+  bfs(csr_graph, 0)
+  print(f"Shortest path 0 -> 3: {bfs_shortest_path(csr_graph, 0, 3)}")
+
 
 if __name__ == "__main__":
   main()
@@ -6,8 +6,15 @@ DFS (Depth-First Search) 알고리즘 구현
 공간 복잡도: O(V) - 스택과 방문 집합을 위한 공간
 """
 
+import os
+import sys
 from collections import defaultdict
-from typing import List, Set
+from typing import List, Set, Union
+
+# 공용 CSR 그래프 모듈을 import하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '09_csr_graph'))
+from csr_graph import CSRGraph, CSRGraphBuilder  # noqa: E402
 
 
 class Graph:
@@ -46,6 +53,18 @@ class Graph:
     """
     self.adj_list[src].append(dest)
 
+  def neighbors(self, vertex: int) -> List[int]:
+    """
+    인접 정점 반환 (CSRGraph와 동일한 인터페이스)
+
+    Args:
+        vertex: 정점
+
+    Returns:
+        인접 정점 리스트
+    """
+    return self.adj_list[vertex]
+
   def get_vertices(self) -> Set[int]:
     """
     그래프의 모든 정점 반환
@@ -71,12 +90,12 @@ class Graph:
     print()
 
 
-def dfs_recursive(graph: Graph, start_vertex: int) -> List[int]:
+def dfs_recursive(graph: Union[Graph, CSRGraph], start_vertex: int) -> List[int]:
   """
   DFS 알고리즘 구현 (재귀적)
 
   Args:
-      graph: 탐색할 그래프
+      graph: 탐색할 그래프 (Graph 또는 CSRGraph)
       start_vertex: 시작 정점
 
   Returns:
@@ -105,7 +124,7 @@ def dfs_recursive(graph: Graph, start_vertex: int) -> List[int]:
 
     # 현재 정점의 모든 인접 정점에 대해 재귀 호출
     # 정렬해서 일관된 순서로 탐색
-    neighbors = sorted(graph.adj_list[vertex])
+    neighbors = sorted(graph.neighbors(vertex))
     for neighbor in neighbors:
       if neighbor not in explored:
         dfs_visit(neighbor)
@@ -120,12 +139,12 @@ def dfs_recursive(graph: Graph, start_vertex: int) -> List[int]:
   return dfs_order
 
 
-def dfs_iterative(graph: Graph, start_vertex: int) -> List[int]:
+def dfs_iterative(graph: Union[Graph, CSRGraph], start_vertex: int) -> List[int]:
   """
   DFS 알고리즘 구현 (반복적) - 스택 상태 시각화 포함
 
   Args:
-      graph: 탐색할 그래프
+      graph: 탐색할 그래프 (Graph 또는 CSRGraph)
       start_vertex: 시작 정점
 
   Returns:
@@ -163,7 +182,7 @@ def dfs_iterative(graph: Graph, start_vertex: int) -> List[int]:
 
       # 현재 정점의 모든 인접 정점을 스택에 추가 (역순으로)
       # 일관된 순서를 위해 정렬 후 역순으로 추가
-      neighbors = sorted(graph.adj_list[current_vertex], reverse=True)
+      neighbors = sorted(graph.neighbors(current_vertex), reverse=True)
       for neighbor in neighbors:
         if neighbor not in explored:
           stack.append(neighbor)
@@ -177,12 +196,12 @@ def dfs_iterative(graph: Graph, start_vertex: int) -> List[int]:
   return dfs_order
 
 
-def dfs_find_path(graph: Graph, start: int, target: int) -> List[int]:
+def dfs_find_path(graph: Union[Graph, CSRGraph], start: int, target: int) -> List[int]:
   """
   DFS를 이용한 경로 찾기
 
   Args:
-      graph: 탐색할 그래프
+      graph: 탐색할 그래프 (Graph 또는 CSRGraph)
       start: 시작 정점
       target: 목표 정점
 
@@ -213,7 +232,7 @@ def dfs_find_path(graph: Graph, start: int, target: int) -> List[int]:
     if vertex == target:
       return True
 
-    neighbors = graph.adj_list[vertex]
+    neighbors = graph.neighbors(vertex)
     for neighbor in neighbors:
       if neighbor not in explored:
         parent[neighbor] = vertex
@@ -282,6 +301,17 @@ def main():
   print("\n=== DFS Iterative (with stack visualization) ===")
   dfs_iterative(graph2, 0)
 
+  print("\n=== DFS on CSR graph ===")
+
+  # 같은 간선을 CSR 그래프로 고정하여 탐색
+  builder = CSRGraphBuilder(5, directed=False)
+  builder.add_edges([(0, 1), (0, 4), (1, 2), (1, 3), (1, 4), (2, 3), (3, 4)])
+  csr_graph = builder.build()
+
+  csr_graph.print_graph()
+  dfs_recursive(csr_graph, 0)
+  print(f"Path 0 -> 3: {dfs_find_path(csr_graph, 0, 3)}")
+
 
 if __name__ == "__main__":
   main()
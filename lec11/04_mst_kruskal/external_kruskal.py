@@ -0,0 +1,265 @@
+"""
+외부 메모리(External-memory) Kruskal MST 구현 - 스트리밍 간선 파일 기반
+메모리에 모두 올릴 수 없는 간선 파일(CSV 또는 이진)을 처리합니다.
+
+1. 간선을 chunk_size개씩 읽어 가중치 순으로 정렬한 뒤 임시 run 파일로 저장
+2. run 파일들을 k-way 병합(heapq.merge)하면서 가중치 오름차순으로 스트리밍
+3. 스트리밍되는 간선을 Union-Find에 넣어 MST 간선 선택
+
+시간 복잡도: O(E log E) - 외부 정렬이 지배적 (디스크 I/O는 O(E) * 병합 단계 수)
+공간 복잡도: O(V + chunk_size) - Union-Find 배열과 정렬 버퍼만 메모리에 유지
+"""
+
+import csv
+import heapq
+import os
+import struct
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from kruskal import DisjointSet, Edge, Graph, MST, kruskal_mst
+
+# 이진 간선 레코드: (가중치, 시작 정점, 도착 정점) - little-endian
+# 가중치를 맨 앞에 두어 run 파일을 튜플 그대로 병합할 수 있게 함
+EDGE_RECORD = struct.Struct('<dqq')
+
+# 한 번에 읽는 레코드 수 (파일 읽기 버퍼 크기)
+READ_BLOCK_RECORDS = 8192
+
+
+def read_csv_edges(path: str) -> Iterator[Tuple[int, int, float]]:
+  """
+  CSV 간선 파일 읽기 (한 줄에 "src,dest,weight")
+  빈 줄, '#'으로 시작하는 줄, 숫자가 아닌 헤더 줄은 건너뜁니다.
+
+  Args:
+      path: CSV 파일 경로
+
+  Returns:
+      (시작 정점, 도착 정점, 가중치) 이터레이터
+  """
+  with open(path, newline='') as file:
+    for row in csv.reader(file):
+      if not row or row[0].lstrip().startswith('#'):
+        continue
+      try:
+        src, dest = int(row[0]), int(row[1])
+      except ValueError:
+        continue  # 헤더 줄
+      weight = float(row[2])
+      yield src, dest, int(weight) if weight.is_integer() else weight
+
+
+def read_binary_edges(path: str) -> Iterator[Tuple[int, int, float]]:
+  """
+  이진 간선 파일 읽기 (EDGE_RECORD 레코드의 연속)
+
+  Args:
+      path: 이진 파일 경로
+
+  Returns:
+      (시작 정점, 도착 정점, 가중치) 이터레이터
+  """
+  for weight, src, dest in _read_records(path):
+    yield src, dest, weight
+
+
+def write_binary_edges(path: str, edges: Iterable[Tuple[int, int, float]]) -> int:
+  """
+  간선 스트림을 이진 간선 파일로 저장
+
+  Args:
+      path: 저장할 파일 경로
+      edges: (시작 정점, 도착 정점, 가중치) 이터러블
+
+  Returns:
+      저장한 간선 수
+  """
+  count = 0
+  with open(path, 'wb') as file:
+    for src, dest, weight in edges:
+      file.write(EDGE_RECORD.pack(weight, src, dest))
+      count += 1
+  return count
+
+
+def _read_records(path: str) -> Iterator[Tuple[float, int, int]]:
+  """
+  이진 레코드 파일을 블록 단위로 읽어 (가중치, 시작, 도착) 튜플로 반환
+
+  Args:
+      path: 이진 파일 경로
+
+  Returns:
+      레코드 이터레이터
+  """
+  block_size = EDGE_RECORD.size * READ_BLOCK_RECORDS
+  with open(path, 'rb') as file:
+    while True:
+      block = file.read(block_size)
+      if not block:
+        break
+      if len(block) % EDGE_RECORD.size:
+        raise ValueError(f"Truncated edge record in {path}")
+      yield from EDGE_RECORD.iter_unpack(block)
+
+
+def _write_run(records: List[Tuple[float, int, int]], path: str) -> None:
+  """정렬된 레코드 리스트를 run 파일로 저장"""
+  with open(path, 'wb') as file:
+    file.write(b''.join(EDGE_RECORD.pack(*record) for record in records))
+
+
+def _create_sorted_runs(edges: Iterable[Tuple[int, int, float]], chunk_size: int,
+                        temp_dir: str) -> List[str]:
+  """
+  간선 스트림을 chunk_size개씩 정렬하여 run 파일들로 분할
+
+  Args:
+      edges: (시작 정점, 도착 정점, 가중치) 이터러블
+      chunk_size: 메모리에서 한 번에 정렬할 간선 수
+      temp_dir: run 파일을 저장할 디렉토리
+
+  Returns:
+      run 파일 경로 리스트
+  """
+  runs: List[str] = []
+  chunk: List[Tuple[float, int, int]] = []
+
+  def flush() -> None:
+    chunk.sort()
+    path = os.path.join(temp_dir, f"run_{len(runs)}.bin")
+    _write_run(chunk, path)
+    runs.append(path)
+    chunk.clear()
+
+  for src, dest, weight in edges:
+    chunk.append((weight, src, dest))
+    if len(chunk) >= chunk_size:
+      flush()
+  if chunk:
+    flush()
+
+  return runs
+
+
+def _merge_runs(runs: List[str], max_fan_in: int, temp_dir: str) -> List[str]:
+  """
+  run 파일 수가 max_fan_in 이하가 될 때까지 여러 단계로 병합
+
+  Args:
+      runs: run 파일 경로 리스트
+      max_fan_in: 한 번에 동시에 여는 최대 run 파일 수
+      temp_dir: 병합 결과를 저장할 디렉토리
+
+  Returns:
+      max_fan_in개 이하의 run 파일 경로 리스트
+  """
+  level = 0
+  while len(runs) > max_fan_in:
+    merged_runs = []
+    for i in range(0, len(runs), max_fan_in):
+      group = runs[i:i + max_fan_in]
+      path = os.path.join(temp_dir, f"merge_{level}_{len(merged_runs)}.bin")
+      with open(path, 'wb') as file:
+        for record in heapq.merge(*(_read_records(run) for run in group)):
+          file.write(EDGE_RECORD.pack(*record))
+      for run in group:
+        os.remove(run)
+      merged_runs.append(path)
+    runs = merged_runs
+    level += 1
+  return runs
+
+
+def external_kruskal_mst(path: str, num_vertices: int, file_format: str = 'csv',
+                         chunk_size: int = 1_000_000, max_fan_in: int = 64,
+                         temp_dir: Optional[str] = None) -> Optional[MST]:
+  """
+  외부 정렬 기반 Kruskal MST 알고리즘
+
+  Args:
+      path: 간선 파일 경로
+      num_vertices: 정점의 개수
+      file_format: 'csv' 또는 'binary'
+      chunk_size: 메모리에서 한 번에 정렬할 간선 수
+      max_fan_in: k-way 병합에서 동시에 여는 최대 run 파일 수
+      temp_dir: 임시 run 파일을 만들 디렉토리 (None이면 시스템 기본값)
+
+  Returns:
+      MST 결과 객체 (잘못된 입력인 경우 None)
+  """
+  if num_vertices <= 0 or chunk_size <= 0 or max_fan_in < 2:
+    print("Invalid arguments!")
+    return None
+
+  if file_format == 'csv':
+    edges = read_csv_edges(path)
+  elif file_format == 'binary':
+    edges = read_binary_edges(path)
+  else:
+    raise ValueError(f"Unknown edge file format: {file_format}")
+
+  mst = MST()
+  disjoint_set = DisjointSet(num_vertices)
+
+  with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+    # 1. 정렬된 run 파일 생성
+    runs = _create_sorted_runs(edges, chunk_size, run_dir)
+
+    # 2. 파일 핸들 수를 제한하기 위해 필요하면 여러 단계로 병합
+    runs = _merge_runs(runs, max_fan_in, run_dir)
+
+    # 3. 마지막 k-way 병합 결과를 바로 Union-Find에 공급
+    for weight, src, dest in heapq.merge(*(_read_records(run) for run in runs)):
+      if disjoint_set.union(src, dest):
+        mst.add_edge(Edge(src, dest, int(weight) if weight.is_integer() else weight))
+        if len(mst.edges) >= num_vertices - 1:
+          break
+
+  return mst
+
+
+def main():
+  """
+  메인 함수 - 예제 실행
+  """
+  print("=== External-memory Kruskal MST ===\n")
+
+  # kruskal.py와 동일한 그래프
+  edges = [(0, 7, 16), (2, 3, 17), (1, 7, 19), (0, 2, 26),
+           (5, 7, 28), (1, 3, 29), (1, 5, 32), (2, 7, 34),
+           (4, 5, 35), (1, 2, 36), (4, 7, 37), (0, 4, 38),
+           (6, 2, 40), (3, 6, 52), (6, 0, 58), (6, 4, 93)]
+
+  with tempfile.TemporaryDirectory() as directory:
+    csv_path = os.path.join(directory, "edges.csv")
+    with open(csv_path, 'w') as file:
+      file.write("src,dest,weight\n")
+      for src, dest, weight in edges:
+        file.write(f"{src},{dest},{weight}\n")
+
+    binary_path = os.path.join(directory, "edges.bin")
+    write_binary_edges(binary_path, edges)
+
+    # 작은 chunk와 fan-in으로 run 분할과 다단계 병합을 확인
+    print("CSV input (chunk_size=3, max_fan_in=2):")
+    mst = external_kruskal_mst(csv_path, 8, 'csv', chunk_size=3, max_fan_in=2)
+    if mst:
+      mst.print_mst()
+
+    print("Binary input (chunk_size=5):")
+    mst = external_kruskal_mst(binary_path, 8, 'binary', chunk_size=5)
+    if mst:
+      mst.print_mst()
+
+  # 메모리 내 Kruskal 결과와 비교
+  graph = Graph(8)
+  for src, dest, weight in edges:
+    graph.add_edge(src, dest, weight)
+  in_memory = kruskal_mst(graph, verbose=False)
+  print(f"In-memory Kruskal total weight: {in_memory.total_weight}")
+
+
+if __name__ == "__main__":
+  main()
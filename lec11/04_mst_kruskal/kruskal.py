@@ -2,10 +2,12 @@
 Kruskal MST (Minimum Spanning Tree) 알고리즘 구현 - Union-Find 기반
 그래프에서 최소 신장 트리를 찾습니다.
 
-시간 복잡도: O(E log E) - 간선 정렬이 지배적
+시간 복잡도: O(E log E) - 간선 정렬이 지배적 (Union-Find 연산은 거의 O(1))
 공간 복잡도: O(V + E) - 그래프 저장과 Union-Find 자료구조
 """
 
+from array import array
+from operator import attrgetter
 from typing import List, Tuple, Optional
 
 
@@ -67,19 +69,72 @@ class Graph:
     print()
 
 
-class ComponentTracker:
-  """연결 성분을 추적하는 간단한 클래스"""
+class DisjointSet:
+  """
+  Union-Find (서로소 집합) 자료구조 - 배열 기반 포레스트
+  경로 반감(path halving)과 크기 기준 합치기(union by size)를 사용하여
+  find/union 연산이 거의 상수 시간(역 아커만 함수)에 동작합니다.
+  """
 
   def __init__(self, vertices: int):
     """
-    연결 성분 추적기 초기화
+    서로소 집합 초기화
+
+    Args:
+        vertices: 원소(정점)의 개수
+    """
+    # 각 원소를 자기 자신만의 집합으로 초기화
+    self.parent = array('q', range(vertices))
+    self.size = array('q', [1]) * vertices
+    self.num_sets = vertices
+
+  def find(self, x: int) -> int:
+    """
+    원소가 속한 집합의 대표(루트) 찾기 (반복적, 경로 반감)
+
+    Args:
+        x: 원소
+
+    Returns:
+        대표 원소
+    """
+    parent = self.parent
+    while parent[x] != x:
+      # 조부모를 가리키도록 하여 경로 길이를 절반으로 줄임
+      parent[x] = parent[parent[x]]
+      x = parent[x]
+    return x
+
+  def union(self, u: int, v: int) -> bool:
+    """
+    두 원소가 속한 집합 합치기 (작은 집합을 큰 집합 아래에 연결)
 
     Args:
-        vertices: 정점의 개수
+        u: 첫 번째 원소
+        v: 두 번째 원소
+
+    Returns:
+        합쳐졌으면 True, 이미 같은 집합이었으면 False
     """
-    # 각 정점을 자기 자신만의 연결 성분으로 초기화
-    self.component = list(range(vertices))
-    self.vertices = vertices
+    root_u, root_v = self.find(u), self.find(v)
+    if root_u == root_v:
+      return False
+
+    if self.size[root_u] < self.size[root_v]:
+      root_u, root_v = root_v, root_u
+
+    self.parent[root_v] = root_u
+    self.size[root_u] += self.size[root_v]
+    self.num_sets -= 1
+    return True
+
+  def connected(self, u: int, v: int) -> bool:
+    """두 원소가 같은 집합에 속하는지 확인"""
+    return self.find(u) == self.find(v)
+
+
+class ComponentTracker(DisjointSet):
+  """연결 성분을 추적하는 클래스 (DisjointSet 기반, 기존 인터페이스 유지)"""
 
   def is_connected(self, u: int, v: int) -> bool:
     """
@@ -92,7 +147,7 @@ class ComponentTracker:
     Returns:
         같은 연결 성분에 속하면 True, 아니면 False
     """
-    return self.component[u] == self.component[v]
+    return self.connected(u, v)
 
   def merge_components(self, u: int, v: int) -> None:
     """
@@ -102,13 +157,7 @@ class ComponentTracker:
         u: 첫 번째 정점
         v: 두 번째 정점
     """
-    old_component = self.component[v]
-    new_component = self.component[u]
-
-    # v의 연결 성분에 속한 모든 정점을 u의 연결 성분으로 변경
-    for i in range(self.vertices):
-      if self.component[i] == old_component:
-        self.component[i] = new_component
+    self.union(u, v)
 
 
 class MST:
@@ -149,12 +198,13 @@ def print_sorted_edges(edges: List[Edge]) -> None:
   print()
 
 
-def kruskal_mst(graph: Graph) -> Optional[MST]:
+def kruskal_mst(graph: Graph, verbose: bool = True) -> Optional[MST]:
   """
   Kruskal MST 알고리즘
 
   Args:
       graph: 가중치 그래프
+      verbose: 탐색 과정 출력 여부 (기본값: True)
 
   Returns:
       MST 결과 객체 (연결되지 않은 그래프인 경우 None)
@@ -169,40 +219,41 @@ def kruskal_mst(graph: Graph) -> Optional[MST]:
   # MST 결과 객체 생성
   mst = MST()
 
-  # 간선들을 가중치 오름차순으로 정렬
-  sorted_edges = sorted(graph.edges)
+  # 간선들을 가중치 오름차순으로 정렬 (key 함수로 __lt__ 호출 비용 제거)
+  sorted_edges = sorted(graph.edges, key=attrgetter('weight'))
 
   # 정렬된 간선들 출력
-  print_sorted_edges(sorted_edges)
+  if verbose:
+    print_sorted_edges(sorted_edges)
 
-  # 연결 성분 추적기 초기화
-  tracker = ComponentTracker(vertices)
+  # Union-Find 초기화
+  disjoint_set = DisjointSet(vertices)
 
-  print("=== Kruskal MST Algorithm ===")
-  print("Processing edges in order of increasing weight:\n")
+  if verbose:
+    print("=== Kruskal MST Algorithm ===")
+    print("Processing edges in order of increasing weight:\n")
 
   # 정렬된 간선들을 순서대로 검사
-  for i, edge in enumerate(sorted_edges):
+  for edge in sorted_edges:
     if len(mst.edges) >= vertices - 1:
       break
 
-    src, dest, weight = edge.src, edge.dest, edge.weight
+    if verbose:
+      print(f"Step {len(mst.edges) + 1}: Considering edge {edge}")
 
-    print(f"Step {len(mst.edges) + 1}: Considering edge {edge}")
-
-    # 사이클 검사: 두 정점이 다른 연결 성분에 속하는지 확인
-    if not tracker.is_connected(src, dest):
+    # 사이클 검사와 합치기를 한 번에 수행:
+    # 두 정점이 다른 연결 성분이면 합치고 True 반환
+    if disjoint_set.union(edge.src, edge.dest):
       # 사이클이 생기지 않으므로 MST에 간선 추가
       mst.add_edge(edge)
 
-      # 두 연결 성분을 합침
-      tracker.merge_components(src, dest)
-
-      print("  ✓ Added to MST (no cycle created)")
-    else:
+      if verbose:
+        print("  ✓ Added to MST (no cycle created)")
+    elif verbose:
       print("  ✗ Rejected (would create cycle)")
 
-    print()
+    if verbose:
+      print()
 
   return mst
 
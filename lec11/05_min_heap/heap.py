@@ -8,9 +8,14 @@
 - 최솟값 조회 (peek): O(1)
 
 공간 복잡도: O(n)
+
+IndexedMinHeap은 정점 번호(0 ~ capacity-1)마다 키를 저장하는 인덱스 힙으로,
+위치 배열을 유지하여 decrease_key와 contains를 지원합니다 (Dijkstra/Prim용).
+- 키 감소 (decrease_key): O(log_d n)
+- 포함 여부 (contains): O(1)
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class MinHeap:
@@ -205,6 +210,192 @@ class MinHeap:
       level += 1
 
 
+class IndexedMinHeap:
+  """
+  인덱스 최소 힙 클래스 (d-ary 힙)
+  원소는 0 ~ capacity-1 범위의 정수 id이며, 각 id는 최대 한 번만 힙에 존재합니다.
+  따라서 힙 크기는 항상 capacity(정점 수) 이하로 유지됩니다.
+  """
+
+  def __init__(self, capacity: int, arity: int = 2):
+    """
+    힙 초기화
+
+    Args:
+        capacity: 원소 id의 범위 (정점의 개수)
+        arity: 각 노드의 자식 수 (2: 이진 힙, 4: 4-ary 힙 등)
+    """
+    if arity < 2:
+      raise ValueError("arity must be at least 2")
+
+    self.capacity = capacity
+    self.arity = arity
+    self.heap: List[int] = []                       # 힙 배열 (원소 id)
+    self.keys: List[float] = [float('inf')] * capacity  # id별 키
+    self.position: List[int] = [-1] * capacity      # id별 힙 배열 위치 (-1: 없음)
+
+  def __len__(self) -> int:
+    return len(self.heap)
+
+  def is_empty(self) -> bool:
+    """힙이 비어있는지 확인"""
+    return not self.heap
+
+  def contains(self, item: int) -> bool:
+    """
+    원소가 힙에 있는지 확인
+
+    Args:
+        item: 원소 id
+
+    Returns:
+        힙에 있으면 True
+    """
+    return self.position[item] != -1
+
+  def get_key(self, item: int) -> float:
+    """원소의 현재 키 반환"""
+    return self.keys[item]
+
+  def insert(self, item: int, key: float) -> None:
+    """
+    원소 삽입
+
+    Args:
+        item: 원소 id
+        key: 우선순위 키
+    """
+    if self.position[item] != -1:
+      raise ValueError(f"Item {item} is already in the heap")
+
+    self.keys[item] = key
+    self.position[item] = len(self.heap)
+    self.heap.append(item)
+    self._heapify_up(len(self.heap) - 1)
+
+  def decrease_key(self, item: int, key: float) -> None:
+    """
+    원소의 키를 더 작은 값으로 변경
+
+    Args:
+        item: 원소 id
+        key: 새 키 (현재 키 이하)
+    """
+    if self.position[item] == -1:
+      raise ValueError(f"Item {item} is not in the heap")
+    if key > self.keys[item]:
+      raise ValueError("New key is greater than current key")
+
+    self.keys[item] = key
+    self._heapify_up(self.position[item])
+
+  def peek(self) -> Optional[Tuple[int, float]]:
+    """
+    최솟값 조회 (추출하지 않고)
+
+    Returns:
+        (원소 id, 키) (힙이 비어있으면 None)
+    """
+    if not self.heap:
+      return None
+
+    item = self.heap[0]
+    return item, self.keys[item]
+
+  def extract_min(self) -> Optional[Tuple[int, float]]:
+    """
+    최솟값 추출
+
+    Returns:
+        (원소 id, 키) (힙이 비어있으면 None)
+    """
+    if not self.heap:
+      return None
+
+    min_item = self.heap[0]
+    last_item = self.heap.pop()
+    self.position[min_item] = -1
+
+    # 마지막 원소를 루트로 이동한 뒤 하향 정리
+    if self.heap:
+      self.heap[0] = last_item
+      self.position[last_item] = 0
+      self._heapify_down(0)
+
+    return min_item, self.keys[min_item]
+
+  def _heapify_up(self, index: int) -> None:
+    """
+    상향 힙 정리 (반복적, 구멍 이동 방식)
+
+    Args:
+        index: 정리를 시작할 인덱스
+    """
+    heap, keys, position, arity = self.heap, self.keys, self.position, self.arity
+    item = heap[index]
+    key = keys[item]
+
+    while index > 0:
+      parent_index = (index - 1) // arity
+      parent = heap[parent_index]
+      if keys[parent] <= key:
+        break
+
+      # 부모를 아래로 내리고 위로 이동
+      heap[index] = parent
+      position[parent] = index
+      index = parent_index
+
+    heap[index] = item
+    position[item] = index
+
+  def _heapify_down(self, index: int) -> None:
+    """
+    하향 힙 정리 (반복적, 구멍 이동 방식)
+
+    Args:
+        index: 정리를 시작할 인덱스
+    """
+    heap, keys, position, arity = self.heap, self.keys, self.position, self.arity
+    size = len(heap)
+    item = heap[index]
+    key = keys[item]
+
+    while True:
+      first_child = arity * index + 1
+      if first_child >= size:
+        break
+
+      # 자식들 중 최소 키를 가진 자식 찾기
+      min_child = first_child
+      min_key = keys[heap[first_child]]
+      for child in range(first_child + 1, min(first_child + arity, size)):
+        child_key = keys[heap[child]]
+        if child_key < min_key:
+          min_child, min_key = child, child_key
+
+      if key <= min_key:
+        break
+
+      # 최소 자식을 위로 올리고 아래로 이동
+      heap[index] = heap[min_child]
+      position[heap[index]] = index
+      index = min_child
+
+    heap[index] = item
+    position[item] = index
+
+  def print_heap(self) -> None:
+    """힙 출력"""
+    if not self.heap:
+      print("Heap is empty")
+      return
+
+    elements = [f"{item}:{self.keys[item]}" for item in self.heap]
+    print(f"Heap contents (item:key): [{', '.join(elements)}]")
+    print(f"Size: {len(self.heap)}, Arity: {self.arity}")
+
+
 def main():
   """메인 함수 - 힙 데모"""
   print("=== Min Heap Demo ===")
@@ -231,6 +422,25 @@ def main():
       heap.print_tree_structure()
     print()
 
+  print("\n=== Indexed Min Heap Demo (4-ary) ===")
+
+  # 정점 id별 키를 관리하는 인덱스 힙
+  indexed_heap = IndexedMinHeap(8, arity=4)
+  for item, key in enumerate([14, 10, 4, 2, 11, 6, 9, 8]):
+    indexed_heap.insert(item, key)
+  indexed_heap.print_heap()
+
+  print("\nDecrease key of item 0: 14 -> 1")
+  indexed_heap.decrease_key(0, 1)
+  indexed_heap.print_heap()
+  print(f"Contains item 3: {indexed_heap.contains(3)}")
+
+  print("\n--- Extraction Phase ---")
+  while not indexed_heap.is_empty():
+    item, key = indexed_heap.extract_min()
+    print(f"Extracted item {item} with key {key}")
+  print(f"Contains item 3: {indexed_heap.contains(3)}")
+
 
 if __name__ == "__main__":
   main()
@@ -2,12 +2,23 @@
 Prim MST (Minimum Spanning Tree) 알고리즘 구현 - 우선순위 큐 기반
 그래프에서 최소 신장 트리를 찾습니다.
 
-시간 복잡도: O(E log V) - 우선순위 큐 사용
-공간 복잡도: O(V + E) - 그래프 저장과 우선순위 큐
+시간 복잡도: O(E log V) - 인덱스 우선순위 큐의 decrease_key 사용
+공간 복잡도: O(V + E) - 그래프 저장과 우선순위 큐 (큐 크기는 V 이하)
 """
 
-import heapq
-from typing import List, Tuple, Optional, Dict
+import os
+import sys
+from typing import List, Tuple, Optional, Dict, Union
+
+# 공용 CSR 그래프 모듈을 import하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '09_csr_graph'))
+from csr_graph import CSRGraph, CSRGraphBuilder  # noqa: E402
+
+# 인덱스 최소 힙 모듈을 import하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '05_min_heap'))
+from heap import IndexedMinHeap  # noqa: E402
 
 
 class Edge:
@@ -60,6 +71,18 @@ class Graph:
     edge = Edge(src, dest, weight)
     self.edges.append(edge)
 
+  def weighted_neighbors(self, vertex: int) -> List[Tuple[int, int]]:
+    """
+    (인접 정점, 가중치) 쌍 반환 (CSRGraph와 동일한 인터페이스)
+
+    Args:
+        vertex: 정점
+
+    Returns:
+        (인접 정점, 가중치) 리스트
+    """
+    return self.adj_list[vertex]
+
   def print_graph(self) -> None:
     """
     그래프 구조 출력 (디버깅용)
@@ -96,12 +119,12 @@ class MST:
     print(f"Total Weight: {self.total_weight}\n")
 
 
-def prim_mst(graph: Graph, start_vertex: int = 0) -> Optional[MST]:
+def prim_mst(graph: Union[Graph, CSRGraph], start_vertex: int = 0) -> Optional[MST]:
   """
   Prim MST 알고리즘
 
   Args:
-      graph: 가중치 그래프
+      graph: 가중치 그래프 (Graph 또는 CSRGraph)
       start_vertex: 시작 정점 (기본값: 0)
 
   Returns:
@@ -124,10 +147,12 @@ def prim_mst(graph: Graph, start_vertex: int = 0) -> Optional[MST]:
   # 시작 정점 설정
   key[start_vertex] = 0
 
-  # 우선순위 큐 초기화 (최소 힙)
-  # (가중치, 정점) 튜플로 저장
-  priority_queue = [(key[i], i) for i in range(vertices)]
-  heapq.heapify(priority_queue)
+  # 우선순위 큐 초기화 (인덱스 최소 힙)
+  # 모든 정점을 키 값과 함께 넣어 두므로, 시작 정점과 연결되지 않은 정점도
+  # 키가 INF인 채로 꺼내져 새 트리의 시작점이 됨 (신장 숲)
+  priority_queue = IndexedMinHeap(vertices)
+  for vertex in range(vertices):
+    priority_queue.insert(vertex, key[vertex])
 
   print("=== Prim MST Algorithm (Priority Queue) ===")
   print(f"Starting from vertex {start_vertex}")
@@ -135,13 +160,9 @@ def prim_mst(graph: Graph, start_vertex: int = 0) -> Optional[MST]:
 
   step = 1
 
-  while priority_queue:
+  while not priority_queue.is_empty():
     # 방문하지 않은 정점 중 최소 키 값을 가진 정점 선택
-    current_key, u = heapq.heappop(priority_queue)
-
-    # 이미 MST에 포함된 정점이거나 더 좋은 경로가 이미 발견된 경우 스킵
-    if in_mst[u] or current_key > key[u]:
-      continue
+    u, _ = priority_queue.extract_min()
 
     # 정점을 MST에 추가
     in_mst[u] = True
@@ -156,15 +177,15 @@ def prim_mst(graph: Graph, start_vertex: int = 0) -> Optional[MST]:
       step += 1
 
     # 인접한 정점들의 키 값 업데이트
-    for neighbor, weight in graph.adj_list[u]:
+    for neighbor, weight in graph.weighted_neighbors(u):
       # MST에 포함되지 않았고, 더 작은 가중치를 가진 경우
       if not in_mst[neighbor] and weight < key[neighbor]:
         old_key = key[neighbor]
         key[neighbor] = weight
         parent[neighbor] = u
 
-        # 새로운 키 값으로 우선순위 큐에 추가 (decreaseKey 효과)
-        heapq.heappush(priority_queue, (weight, neighbor))
+        # MST에 포함되지 않은 정점은 항상 큐에 있으므로 키 감소
+        priority_queue.decrease_key(neighbor, weight)
 
         print(
             f"  Updated key[{neighbor}] = {weight} (via {u}), was {old_key if old_key != float('inf') else 'INF'}")
@@ -217,6 +238,26 @@ def main():
   if mst:
     mst.print_mst()
 
+  # 같은 간선을 CSR 그래프로 고정하여 실행
+  print("=== Prim MST on CSR graph ===\n")
+  builder = CSRGraphBuilder(graph.num_vertices, directed=False)
+  builder.add_edges((edge.src, edge.dest, edge.weight) for edge in graph.edges)
+  csr_graph = builder.build()
+
+  csr_mst = prim_mst(csr_graph, 0)
+  if csr_mst:
+    csr_mst.print_mst()
+
+  # 연결되지 않은 그래프: 컴포넌트마다 트리를 만들어 신장 숲을 반환
+  print("=== Prim MST on disconnected graph (0-1, 2-3) ===\n")
+  forest_graph = Graph(4)
+  forest_graph.add_edge(0, 1, 5)
+  forest_graph.add_edge(2, 3, 7)
+
+  forest = prim_mst(forest_graph, 0)
+  if forest:
+    forest.print_mst()
+
 
 if __name__ == "__main__":
   main()
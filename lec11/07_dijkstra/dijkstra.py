@@ -4,12 +4,24 @@ Dijkstra 최단 경로 알고리즘 구현 - 우선순위 큐 기반
 
 전제조건: 모든 간선의 가중치는 0 이상이어야 함 (음의 가중치 불허)
 
-시간 복잡도: O(E log V) - 우선순위 큐 사용
-공간 복잡도: O(V + E) - 그래프 저장과 우선순위 큐
+시간 복잡도: O(E log V) - 인덱스 우선순위 큐의 decrease_key 사용
+공간 복잡도: O(V + E) - 그래프 저장과 우선순위 큐 (큐 크기는 V 이하)
 """
 
 import heapq
-from typing import List, Tuple, Optional, Dict
+import os
+import sys
+from typing import List, Tuple, Optional, Dict, Union
+
+# 공용 CSR 그래프 모듈을 import하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '09_csr_graph'))
+from csr_graph import CSRGraph, CSRGraphBuilder  # noqa: E402
+
+# 인덱스 최소 힙 모듈을 import하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '05_min_heap'))
+from heap import IndexedMinHeap  # noqa: E402
 
 
 class Edge:
@@ -61,6 +73,30 @@ class Graph:
     edge = Edge(src, dest, weight)
     self.edges.append(edge)
 
+  def weighted_neighbors(self, vertex: int) -> List[Tuple[int, int]]:
+    """
+    (인접 정점, 가중치) 쌍 반환 (CSRGraph와 동일한 인터페이스)
+
+    Args:
+        vertex: 정점
+
+    Returns:
+        (인접 정점, 가중치) 리스트
+    """
+    return self.adj_list[vertex]
+
+  def reversed(self) -> "Graph":
+    """
+    모든 간선의 방향을 뒤집은 그래프 반환 (역방향 탐색용)
+
+    Returns:
+        전치(transpose) 그래프
+    """
+    reverse_graph = Graph(self.num_vertices)
+    for edge in self.edges:
+      reverse_graph.add_edge(edge.dest, edge.src, edge.weight)
+    return reverse_graph
+
   def print_graph(self) -> None:
     """
     그래프 구조 출력 (디버깅용)
@@ -114,13 +150,36 @@ class ShortestPath:
     print()
 
 
-def dijkstra(graph: Graph, start_vertex: int = 0) -> Optional[ShortestPath]:
+class PathQueryResult:
+  """두 정점 사이 최단 경로 질의 결과 클래스"""
+
+  def __init__(self):
+    self.distance: float = float('inf')
+    self.path: List[int] = []
+    self.settled: int = 0  # 탐색 중 확정(settle)된 정점 수
+
+  def print_result(self, start_vertex: int, target_vertex: int) -> None:
+    """질의 결과 출력"""
+    if not self.path:
+      print(f"No path from vertex {start_vertex} to vertex {target_vertex}")
+      return
+
+    print(f"Shortest path from vertex {start_vertex} to vertex {target_vertex}:")
+    print(f"Distance: {int(self.distance)}")
+    print(f"Path: {' -> '.join(map(str, self.path))}")
+    print(f"Settled vertices: {self.settled}")
+    print()
+
+
+def dijkstra(graph: Union[Graph, CSRGraph], start_vertex: int = 0,
+             verbose: bool = True) -> Optional[ShortestPath]:
   """
   Dijkstra 최단 경로 알고리즘
 
   Args:
-      graph: 가중치 그래프
+      graph: 가중치 그래프 (Graph 또는 CSRGraph)
       start_vertex: 시작 정점 (기본값: 0)
+      verbose: 탐색 과정 출력 여부 (기본값: True)
 
   Returns:
       최단 경로 결과 객체 (연결되지 않은 그래프인 경우 None)
@@ -138,33 +197,31 @@ def dijkstra(graph: Graph, start_vertex: int = 0) -> Optional[ShortestPath]:
   visited = [False] * vertices      # 방문 여부
   result.distances[start_vertex] = 0  # 시작 정점의 거리는 0
 
-  # 우선순위 큐 초기화 (최소 힙)
-  # (거리, 정점) 튜플로 저장
-  priority_queue = [(result.distances[i], i) for i in range(vertices)]
-  heapq.heapify(priority_queue)
+  # 우선순위 큐 초기화 (인덱스 최소 힙)
+  # 정점마다 하나의 항목만 유지하므로 힙 크기는 V 이하
+  priority_queue = IndexedMinHeap(vertices)
+  priority_queue.insert(start_vertex, 0)
 
-  print("=== Dijkstra Shortest Path Algorithm (Priority Queue) ===")
-  print(f"Starting from vertex {start_vertex}")
-  print("Processing vertices in order of minimum distances:\n")
+  if verbose:
+    print("=== Dijkstra Shortest Path Algorithm (Priority Queue) ===")
+    print(f"Starting from vertex {start_vertex}")
+    print("Processing vertices in order of minimum distances:\n")
 
   step = 1
 
-  while priority_queue:
+  while not priority_queue.is_empty():
     # 방문하지 않은 정점 중 최소 거리를 가진 정점 선택
-    current_dist, u = heapq.heappop(priority_queue)
-
-    # 이미 방문한 정점이거나 더 좋은 경로가 이미 발견된 경우 스킵
-    if visited[u] or current_dist > result.distances[u]:
-      continue
+    u, _ = priority_queue.extract_min()
 
     # 정점을 방문 처리
     visited[u] = True
 
-    print(f"Step {step}: Visit vertex {u} with distance {int(result.distances[u])}")
+    if verbose:
+      print(f"Step {step}: Visit vertex {u} with distance {int(result.distances[u])}")
     step += 1
 
     # 인접한 정점들의 거리 업데이트 (Relaxation)
-    for neighbor, weight in graph.adj_list[u]:
+    for neighbor, weight in graph.weighted_neighbors(u):
       # 방문하지 않았고, 더 짧은 경로를 발견한 경우
       if not visited[neighbor]:
         tentative_distance = result.distances[u] + weight
@@ -174,11 +231,19 @@ def dijkstra(graph: Graph, start_vertex: int = 0) -> Optional[ShortestPath]:
           result.distances[neighbor] = tentative_distance
           result.parents[neighbor] = u
 
-          # 새로운 거리로 우선순위 큐에 추가 (decreaseKey 효과)
-          heapq.heappush(priority_queue, (tentative_distance, neighbor))
+          # 큐에 있으면 키 감소, 없으면 새로 삽입
+          if priority_queue.contains(neighbor):
+            priority_queue.decrease_key(neighbor, tentative_distance)
+          else:
+            priority_queue.insert(neighbor, tentative_distance)
+
+          if verbose:
+            was = int(old_distance) if old_distance != float('inf') else 'INF'
+            print(f"  Updated dist[{neighbor}] = {int(tentative_distance)} "
+                  f"(via {u}), was {was}")
 
-          print(
-              f"  Updated dist[{neighbor}] = {int(tentative_distance)} (via {u}), was {int(old_distance) if old_distance != float('inf') else 'INF'}")
+    if not verbose:
+      continue
 
     # 현재 거리 배열 출력
     distances_str = []
@@ -193,6 +258,109 @@ def dijkstra(graph: Graph, start_vertex: int = 0) -> Optional[ShortestPath]:
   return result
 
 
+def bidirectional_dijkstra(graph: Union[Graph, CSRGraph], start_vertex: int,
+                           target_vertex: int,
+                           reverse_graph: Optional[Union[Graph, CSRGraph]] = None
+                           ) -> Optional[PathQueryResult]:
+  """
+  양방향 Dijkstra 알고리즘 (두 정점 사이 최단 경로)
+  시작 정점에서의 정방향 탐색과 목표 정점에서의 역방향 탐색을 번갈아 수행하고,
+  두 큐의 최솟값 합이 지금까지 찾은 최단 거리 이상이 되면 종료합니다.
+
+  Args:
+      graph: 가중치 그래프 (Graph 또는 CSRGraph)
+      start_vertex: 시작 정점
+      target_vertex: 목표 정점
+      reverse_graph: 역방향 그래프 (여러 번 질의할 때 미리 만들어 재사용,
+                     None이면 graph.reversed()로 생성)
+
+  Returns:
+      질의 결과 객체 (잘못된 입력인 경우 None)
+  """
+  vertices = graph.num_vertices
+
+  if vertices <= 0 or not (0 <= start_vertex < vertices and
+                           0 <= target_vertex < vertices):
+    print("Invalid graph or vertex!")
+    return None
+
+  if reverse_graph is None:
+    reverse_graph = graph.reversed()
+
+  result = PathQueryResult()
+
+  if start_vertex == target_vertex:
+    result.distance = 0
+    result.path = [start_vertex]
+    return result
+
+  # 방문한 정점만 기록하여 O(V) 초기화를 피함
+  # 인덱스 0: 정방향 탐색, 인덱스 1: 역방향 탐색
+  graphs = (graph, reverse_graph)
+  distances: Tuple[Dict[int, float], Dict[int, float]] = (
+      {start_vertex: 0}, {target_vertex: 0})
+  parents: Tuple[Dict[int, int], Dict[int, int]] = (
+      {start_vertex: -1}, {target_vertex: -1})
+  settled: Tuple[set, set] = (set(), set())
+  queues: Tuple[list, list] = ([(0, start_vertex)], [(0, target_vertex)])
+
+  best_distance = float('inf')
+  meeting_vertex = -1
+
+  while queues[0] and queues[1]:
+    # 종료 조건: 두 방향의 최소 거리 합이 현재 최단 거리 이상
+    if queues[0][0][0] + queues[1][0][0] >= best_distance:
+      break
+
+    # 큐가 더 작은 쪽을 확장 (탐색 균형 유지)
+    side = 0 if len(queues[0]) <= len(queues[1]) else 1
+    dist, other_dist = distances[side], distances[1 - side]
+
+    current_dist, u = heapq.heappop(queues[side])
+
+    # 이미 확정되었거나 더 좋은 경로가 이미 발견된 경우 스킵
+    if u in settled[side] or current_dist > dist[u]:
+      continue
+    settled[side].add(u)
+    result.settled += 1
+
+    # 인접한 정점들의 거리 업데이트 (Relaxation)
+    for neighbor, weight in graphs[side].weighted_neighbors(u):
+      tentative_distance = current_dist + weight
+
+      if tentative_distance < dist.get(neighbor, float('inf')):
+        dist[neighbor] = tentative_distance
+        parents[side][neighbor] = u
+        heapq.heappush(queues[side], (tentative_distance, neighbor))
+
+      # 반대 방향 탐색이 이미 도달한 정점이면 후보 경로 갱신
+      if neighbor in other_dist:
+        candidate = dist[neighbor] + other_dist[neighbor]
+        if candidate < best_distance:
+          best_distance = candidate
+          meeting_vertex = neighbor
+
+  if meeting_vertex == -1:
+    return result
+
+  # 경로 재구성: 시작 정점 -> 만난 정점 -> 목표 정점
+  path = []
+  current = meeting_vertex
+  while current != -1:
+    path.append(current)
+    current = parents[0][current]
+  path.reverse()
+
+  current = parents[1][meeting_vertex]
+  while current != -1:
+    path.append(current)
+    current = parents[1][current]
+
+  result.distance = best_distance
+  result.path = path
+  return result
+
+
 def main():
   """
   메인 함수 - 예제 실행
@@ -234,6 +402,24 @@ def main():
     result.print_path(0, 3)
     result.print_path(0, 7)
 
+  # 양방향 Dijkstra로 두 정점 사이 최단 경로 질의
+  print("=== Bidirectional Dijkstra (point-to-point) ===\n")
+  reverse_graph = graph.reversed()
+  for target in (6, 3, 7):
+    query = bidirectional_dijkstra(graph, 0, target, reverse_graph)
+    if query:
+      query.print_result(0, target)
+
+  # 같은 간선을 CSR 그래프로 고정하여 실행
+  print("=== Dijkstra on CSR graph ===\n")
+  builder = CSRGraphBuilder(graph.num_vertices, directed=True)
+  builder.add_edges((edge.src, edge.dest, edge.weight) for edge in graph.edges)
+  csr_graph = builder.build()
+
+  csr_result = dijkstra(csr_graph, 0)
+  if csr_result:
+    csr_result.print_path(0, 6)
+
 
 if __name__ == "__main__":
   main()
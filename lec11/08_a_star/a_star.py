@@ -11,67 +11,22 @@ A* 최단 경로 알고리즘 구현 - 휴리스틱 기반 탐색
 """
 
 import heapq
-from typing import List, Tuple, Optional, Dict, Callable
+import math
+import os
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from typing import List, Tuple, Optional, Dict, Callable, Union
 
+# 공용 CSR 그래프 모듈을 import하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '09_csr_graph'))
+from csr_graph import CSRGraph, CSRGraphBuilder  # noqa: E402
 
-class Edge:
-  """간선 클래스"""
-
-  def __init__(self, src: int, dest: int, weight: int):
-    self.src = src
-    self.dest = dest
-    self.weight = weight
-
-  def __str__(self):
-    return f"({self.src}, {self.dest}, {self.weight})"
-
-  def __repr__(self):
-    return self.__str__()
-
-
-class Graph:
-  """
-  그래프 클래스 (인접 리스트로 표현)
-  """
-
-  def __init__(self, num_vertices: int):
-    """
-    그래프 초기화
-
-    Args:
-        num_vertices: 정점의 개수
-    """
-    self.num_vertices = num_vertices
-    # 인접 리스트: {vertex: [(neighbor, weight), ...]}
-    self.adj_list: Dict[int, List[Tuple[int, int]]] = {
-        i: [] for i in range(num_vertices)}
-    self.edges: List[Edge] = []
-
-  def add_edge(self, src: int, dest: int, weight: int) -> None:
-    """
-    간선 추가 (방향 가중치 그래프)
-
-    Args:
-        src: 시작 정점
-        dest: 도착 정점
-        weight: 간선의 가중치
-    """
-    # 방향 그래프이므로 한 방향만 추가
-    self.adj_list[src].append((dest, weight))
-
-    # 간선 리스트에도 추가 (출력용)
-    edge = Edge(src, dest, weight)
-    self.edges.append(edge)
-
-  def print_graph(self) -> None:
-    """
-    그래프 구조 출력 (디버깅용)
-    """
-    print("Graph representation (edge list):")
-    print(f"Vertices: {self.num_vertices}, Edges: {len(self.edges)}")
-    for i, edge in enumerate(self.edges):
-      print(f"  Edge {i}: {edge}")
-    print()
+# 그래프 클래스(reversed() 포함)와 랜드마크 거리 표 계산용 dijkstra()를 공유
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '07_dijkstra'))
+from dijkstra import Graph, dijkstra  # noqa: E402
 
 
 class AStarResult:
@@ -79,7 +34,8 @@ class AStarResult:
 
   def __init__(self):
     self.path: List[int] = []
-    self.total_cost: int = 0
+    self.total_cost: float = 0
+    self.explored: int = 0  # closed set에 들어간(확장된) 정점 수
 
   def print_result(self, start_vertex: int, goal_vertex: int) -> None:
     """A* 탐색 결과 출력"""
@@ -89,7 +45,7 @@ class AStarResult:
 
     print("=== A* Search Result ===")
     print(f"Shortest path from vertex {start_vertex} to vertex {goal_vertex}:")
-    print(f"Total cost: {self.total_cost}")
+    print(f"Total cost: {self.total_cost:g}")
 
     # 경로 출력
     print(f"Path: {' -> '.join(map(str, self.path))}")
@@ -99,6 +55,8 @@ class AStarResult:
 def heuristic(vertex: int, goal: int) -> int:
   """
   휴리스틱 함수 - 이미지 데이터 사용
+  main()의 예제 그래프(정점 0-7, 목표 6) 전용이므로 다른 그래프에는
+  ZeroHeuristic이나 LandmarkHeuristic 등을 사용합니다.
 
   Args:
       vertex: 현재 정점
@@ -112,14 +70,176 @@ def heuristic(vertex: int, goal: int) -> int:
   return h_values[vertex]
 
 
-def a_star(graph: Graph, start_vertex: int, goal_vertex: int) -> Optional[AStarResult]:
+class Heuristic(ABC):
+  """
+  휴리스틱 인터페이스
+  estimate(vertex, goal)을 구현하며, 인스턴스를 함수처럼 a_star()에 전달합니다.
+  """
+
+  @abstractmethod
+  def estimate(self, vertex: int, goal: int) -> float:
+    """
+    vertex에서 goal까지의 추정 거리 (실제 거리 이하여야 함)
+
+    Args:
+        vertex: 현재 정점
+        goal: 목표 정점
+
+    Returns:
+        휴리스틱 값 (추정 거리)
+    """
+
+  def __call__(self, vertex: int, goal: int) -> float:
+    return self.estimate(vertex, goal)
+
+
+class ZeroHeuristic(Heuristic):
+  """항상 0을 반환하는 휴리스틱 (A*가 Dijkstra와 동일하게 동작)"""
+
+  def estimate(self, vertex: int, goal: int) -> float:
+    return 0
+
+
+class EuclideanHeuristic(Heuristic):
+  """좌표 기반 직선(유클리드) 거리 휴리스틱"""
+
+  def __init__(self, coordinates: List[Tuple[float, float]], scale: float = 1.0):
+    """
+    Args:
+        coordinates: 정점별 (x, y) 좌표
+        scale: 좌표 거리를 간선 가중치 단위로 바꾸는 계수
+               (모든 간선에 대해 가중치 >= scale * 직선 거리여야 admissible)
+    """
+    self.xs = array('d', (x for x, _ in coordinates))
+    self.ys = array('d', (y for _, y in coordinates))
+    self.scale = scale
+
+  def estimate(self, vertex: int, goal: int) -> float:
+    return self.scale * math.hypot(self.xs[vertex] - self.xs[goal],
+                                   self.ys[vertex] - self.ys[goal])
+
+
+class ManhattanHeuristic(EuclideanHeuristic):
+  """좌표 기반 맨해튼 거리 휴리스틱 (4방향 격자 그래프용)"""
+
+  def estimate(self, vertex: int, goal: int) -> float:
+    return self.scale * (abs(self.xs[vertex] - self.xs[goal]) +
+                         abs(self.ys[vertex] - self.ys[goal]))
+
+
+class HaversineHeuristic(Heuristic):
+  """위도/경도 기반 대권(haversine) 거리 휴리스틱"""
+
+  EARTH_RADIUS_KM = 6371.0
+
+  def __init__(self, coordinates: List[Tuple[float, float]],
+               radius: float = EARTH_RADIUS_KM):
+    """
+    Args:
+        coordinates: 정점별 (위도, 경도) - 도(degree) 단위
+        radius: 구의 반지름 (간선 가중치와 같은 단위, 기본값: km)
+    """
+    self.latitudes = array('d', (math.radians(lat) for lat, _ in coordinates))
+    self.longitudes = array('d', (math.radians(lon) for _, lon in coordinates))
+    self.radius = radius
+
+  def estimate(self, vertex: int, goal: int) -> float:
+    lat1, lat2 = self.latitudes[vertex], self.latitudes[goal]
+    d_lat = lat2 - lat1
+    d_lon = self.longitudes[goal] - self.longitudes[vertex]
+    a = (math.sin(d_lat / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin(d_lon / 2) ** 2)
+    return 2 * self.radius * math.asin(min(1.0, math.sqrt(a)))
+
+
+class LandmarkHeuristic(Heuristic):
+  """
+  ALT (A*, Landmarks, Triangle inequality) 휴리스틱
+  랜드마크 L에 대해 삼각 부등식으로 d(v, t) >= d(L, t) - d(L, v),
+  d(v, t) >= d(v, L) - d(t, L)이 성립하므로 그 최댓값을 사용합니다.
+  거리 표는 dijkstra()로 미리 계산하여 랜드마크별 array('d')에 저장합니다.
+  """
+
+  def __init__(self, graph: Union[Graph, CSRGraph], landmarks: List[int]):
+    """
+    Args:
+        graph: 가중치 방향 그래프 (Graph 또는 CSRGraph)
+        landmarks: 랜드마크 정점 리스트 (select_landmarks()로 선택 가능)
+    """
+    self.landmarks = list(landmarks)
+    reverse_graph = graph.reversed()
+
+    # from_landmark[i][v] = d(L_i, v), to_landmark[i][v] = d(v, L_i)
+    self.from_landmark: List[array] = []
+    self.to_landmark: List[array] = []
+    for landmark in self.landmarks:
+      forward = dijkstra(graph, landmark, verbose=False)
+      backward = dijkstra(reverse_graph, landmark, verbose=False)
+      self.from_landmark.append(array('d', forward.distances))
+      self.to_landmark.append(array('d', backward.distances))
+
+  def estimate(self, vertex: int, goal: int) -> float:
+    inf = float('inf')
+    best = 0.0
+    for from_l, to_l in zip(self.from_landmark, self.to_landmark):
+      # 랜드마크에서 도달할 수 없는 항은 하한으로 쓸 수 없으므로 건너뜀
+      if from_l[goal] < inf and from_l[vertex] < inf:
+        best = max(best, from_l[goal] - from_l[vertex])
+      if to_l[vertex] < inf and to_l[goal] < inf:
+        best = max(best, to_l[vertex] - to_l[goal])
+    return best
+
+
+def select_landmarks(graph: Union[Graph, CSRGraph], count: int,
+                     start_vertex: int = 0) -> List[int]:
+  """
+  가장 먼(farthest) 정점을 차례로 고르는 방식으로 랜드마크 선택
+
+  Args:
+      graph: 가중치 방향 그래프
+      count: 선택할 랜드마크 수
+      start_vertex: 탐색을 시작할 정점
+
+  Returns:
+      랜드마크 정점 리스트
+  """
+  vertices = graph.num_vertices
+
+  # 각 정점에서 가장 가까운 기준점(시작 정점 또는 랜드마크)까지의 거리
+  nearest = list(dijkstra(graph, start_vertex, verbose=False).distances)
+  landmarks: List[int] = []
+  chosen = set()
+
+  while len(landmarks) < count:
+    # 도달 가능한 정점 중 기존 기준점들로부터 가장 먼 정점 선택
+    candidates = [v for v in range(vertices)
+                  if nearest[v] < float('inf') and v not in chosen]
+    if not candidates:
+      break
+
+    landmark = max(candidates, key=lambda v: nearest[v])
+    landmarks.append(landmark)
+    chosen.add(landmark)
+
+    distances = dijkstra(graph, landmark, verbose=False).distances
+    nearest = [min(a, b) for a, b in zip(nearest, distances)]
+
+  return landmarks
+
+
+def a_star(graph: Union[Graph, CSRGraph], start_vertex: int, goal_vertex: int,
+           heuristic_fn: Optional[Callable[[int, int], float]] = None,
+           verbose: bool = True) -> Optional[AStarResult]:
   """
   A* 최단 경로 알고리즘
 
   Args:
-      graph: 가중치 그래프
+      graph: 가중치 그래프 (Graph 또는 CSRGraph)
       start_vertex: 시작 정점
       goal_vertex: 목표 정점
+      heuristic_fn: 휴리스틱 함수 또는 Heuristic 객체
+                    (None이면 ZeroHeuristic - 모든 그래프에서 admissible)
+      verbose: 탐색 과정 출력 여부 (기본값: True)
 
   Returns:
       A* 탐색 결과 객체 (경로를 찾지 못한 경우 None)
@@ -130,13 +250,15 @@ def a_star(graph: Graph, start_vertex: int, goal_vertex: int) -> Optional[AStarR
     print("Invalid graph!")
     return None
 
+  if heuristic_fn is None:
+    heuristic_fn = ZeroHeuristic()
+
   # A* 탐색 결과 객체 생성
   result = AStarResult()
 
-  # 초기화
-  g_score: Dict[int, float] = {i: float('inf') for i in range(vertices)}  # 실제 거리
-  f_score: Dict[int, float] = {i: float('inf')
-                               for i in range(vertices)}  # f(n) = g(n) + h(n)
+  # 초기화 (방문한 정점만 기록하여 O(V) 초기화를 피함)
+  g_score: Dict[int, float] = {}  # 실제 거리
+  f_score: Dict[int, float] = {}  # f(n) = g(n) + h(n)
   came_from: Dict[int, int] = {}  # 경로 추적
   closed_set: set = set()  # closed set
 
@@ -145,14 +267,15 @@ def a_star(graph: Graph, start_vertex: int, goal_vertex: int) -> Optional[AStarR
   open_list = []
 
   # 시작 정점 설정
+  start_h = heuristic_fn(start_vertex, goal_vertex)
   g_score[start_vertex] = 0
-  f_score[start_vertex] = heuristic(start_vertex, goal_vertex)
+  f_score[start_vertex] = start_h
   heapq.heappush(open_list, (f_score[start_vertex], start_vertex))
 
-  print("=== A* Search Algorithm ===")
-  print(f"Starting A* search from {start_vertex} to {goal_vertex}")
-  print(
-      f"Initial heuristic h({start_vertex}) = {heuristic(start_vertex, goal_vertex)}\n")
+  if verbose:
+    print("=== A* Search Algorithm ===")
+    print(f"Starting A* search from {start_vertex} to {goal_vertex}")
+    print(f"Initial heuristic h({start_vertex}) = {start_h:g}\n")
 
   step = 1
 
@@ -164,12 +287,15 @@ def a_star(graph: Graph, start_vertex: int, goal_vertex: int) -> Optional[AStarR
     if current in closed_set:
       continue
 
-    print(f"Step {step}: Exploring vertex {current} with f={int(current_f)}")
+    result.explored += 1
+    if verbose:
+      print(f"Step {step}: Exploring vertex {current} with f={int(current_f)}")
     step += 1
 
     # 목표에 도달했는지 확인
     if current == goal_vertex:
-      print("Goal reached! Reconstructing path...")
+      if verbose:
+        print("Goal reached! Reconstructing path...")
 
       # 경로 재구성
       path = []
@@ -182,7 +308,7 @@ def a_star(graph: Graph, start_vertex: int, goal_vertex: int) -> Optional[AStarR
       # 경로를 올바른 순서로 뒤집기
       path.reverse()
       result.path = path
-      result.total_cost = int(g_score[goal_vertex])
+      result.total_cost = g_score[goal_vertex]
 
       return result
 
@@ -190,7 +316,7 @@ def a_star(graph: Graph, start_vertex: int, goal_vertex: int) -> Optional[AStarR
     closed_set.add(current)
 
     # 인접한 정점들 탐색
-    for neighbor, weight in graph.adj_list[current]:
+    for neighbor, weight in graph.weighted_neighbors(current):
       # 이미 closed set에 있는 정점은 스킵
       if neighbor in closed_set:
         continue
@@ -198,22 +324,29 @@ def a_star(graph: Graph, start_vertex: int, goal_vertex: int) -> Optional[AStarR
       # 임시 g 점수 계산
       tentative_g_score = g_score[current] + weight
 
-      print(f"  Checking neighbor {neighbor} with tentative g={int(tentative_g_score)}")
+      if verbose:
+        print(f"  Checking neighbor {neighbor} "
+              f"with tentative g={int(tentative_g_score)}")
 
       # 더 나은 경로를 발견했거나 처음 방문하는 정점인 경우
-      if g_score[neighbor] == float('inf') or tentative_g_score < g_score[neighbor]:
+      if tentative_g_score < g_score.get(neighbor, float('inf')):
         # 경로 정보 업데이트
+        neighbor_h = heuristic_fn(neighbor, goal_vertex)
         came_from[neighbor] = current
         g_score[neighbor] = tentative_g_score
-        f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, goal_vertex)
-
-        print(f"    Updated: g({neighbor})={int(g_score[neighbor])}, "
-              f"h({neighbor})={heuristic(neighbor, goal_vertex)}, "
-              f"f({neighbor})={int(f_score[neighbor])}")
+        f_score[neighbor] = tentative_g_score + neighbor_h
 
         # open list에 추가
         heapq.heappush(open_list, (f_score[neighbor], neighbor))
-        print(f"    Added to open list")
+
+        if verbose:
+          print(f"    Updated: g({neighbor})={int(g_score[neighbor])}, "
+                f"h({neighbor})={neighbor_h:g}, "
+                f"f({neighbor})={int(f_score[neighbor])}")
+          print(f"    Added to open list")
+
+    if not verbose:
+      continue
 
     # 현재 open list 출력 (중복 제거된 상태로)
     open_vertices = set()
@@ -228,15 +361,17 @@ def a_star(graph: Graph, start_vertex: int, goal_vertex: int) -> Optional[AStarR
     print()
 
   # 경로를 찾지 못한 경우
-  print(f"No path found from {start_vertex} to {goal_vertex}")
+  if verbose:
+    print(f"No path found from {start_vertex} to {goal_vertex}")
   return None
 
 
-def print_heuristics(vertices: int, goal_vertex: int) -> None:
+def print_heuristics(vertices: int, goal_vertex: int,
+                     heuristic_fn: Callable[[int, int], float]) -> None:
   """휴리스틱 값 출력"""
   print(f"Heuristic values (h) from each vertex to goal {goal_vertex}:")
   for i in range(vertices):
-    print(f"  h({i}) = {heuristic(i, goal_vertex)}")
+    print(f"  h({i}) = {heuristic_fn(i, goal_vertex):g}")
   print()
 
 
@@ -272,13 +407,62 @@ def main():
   graph.print_graph()
 
   # 휴리스틱 값 출력
-  print_heuristics(8, 6)
+  print_heuristics(8, 6, heuristic)
 
   # A* 탐색 실행 (정점 0에서 시작, 정점 6이 목표)
-  result = a_star(graph, 0, 6)
+  result = a_star(graph, 0, 6, heuristic)
   if result:
     result.print_result(0, 6)
 
+  # 같은 간선을 CSR 그래프로 고정하여 실행
+  print("=== A* Search on CSR graph ===\n")
+  builder = CSRGraphBuilder(graph.num_vertices, directed=True)
+  builder.add_edges((edge.src, edge.dest, edge.weight) for edge in graph.edges)
+  csr_graph = builder.build()
+
+  csr_result = a_star(csr_graph, 0, 6, heuristic)
+  if csr_result:
+    csr_result.print_result(0, 6)
+
+  # 표 대신 랜드마크 거리로 계산한 ALT 휴리스틱 사용
+  print("=== A* Search with ALT heuristic ===\n")
+  landmarks = select_landmarks(graph, 2)
+  print(f"Landmarks: {landmarks}")
+  alt = LandmarkHeuristic(graph, landmarks)
+  print_heuristics(8, 6, alt)
+
+  alt_result = a_star(graph, 0, 6, alt, verbose=False)
+  if alt_result:
+    alt_result.print_result(0, 6)
+
+  # 좌표가 있는 격자 그래프에서 휴리스틱별 확장 정점 수 비교
+  size = 60
+  grid_builder = CSRGraphBuilder(size * size, directed=False)
+  coordinates = []
+  for row in range(size):
+    for col in range(size):
+      coordinates.append((col, row))
+      u = row * size + col
+      if col + 1 < size:
+        grid_builder.add_edge(u, u + 1, 1 + (u * 7) % 5)
+      if row + 1 < size:
+        grid_builder.add_edge(u, u + size, 1 + (u * 3) % 5)
+  grid = grid_builder.build()
+
+  print(f"=== Grid graph {size}x{size} (explored vertices) ===")
+  start, goal = 10 * size + 5, 45 * size + 50
+  heuristics = [
+      ("Zero (Dijkstra)", ZeroHeuristic()),
+      ("Euclidean", EuclideanHeuristic(coordinates)),
+      ("Manhattan", ManhattanHeuristic(coordinates)),
+      ("ALT (4 landmarks)", LandmarkHeuristic(grid, select_landmarks(grid, 4))),
+  ]
+  for name, heuristic_fn in heuristics:
+    grid_result = a_star(grid, start, goal, heuristic_fn, verbose=False)
+    if grid_result:
+      print(f"  {name:<18}: cost {grid_result.total_cost:g}, "
+            f"explored {grid_result.explored}")
+
 
 if __name__ == "__main__":
   main()
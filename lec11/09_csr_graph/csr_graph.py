@@ -0,0 +1,259 @@
+"""
+CSR (Compressed Sparse Row) 그래프 구현 - 배열 기반 압축 인접 리스트
+정점별 간선 시작 위치(offsets)와 간선 도착 정점(targets), 가중치(weights)를
+연속된 배열에 저장하여 간선당 메모리를 몇 개의 machine word로 줄입니다.
+
+정점 u의 인접 간선은 targets[offsets[u]:offsets[u + 1]] 구간에 모여 있습니다.
+
+시간 복잡도:
+- 빌드 (build): O(V + E) - 출발 정점 기준 계수 정렬
+- 인접 정점 조회 (neighbors): O(deg(u))
+
+공간 복잡도: O(V + E) - 파이썬 객체 없이 array 버퍼만 사용
+"""
+
+from array import array
+from typing import Iterable, Iterator, Tuple
+
+
+class CSRGraph:
+  """
+  CSR 그래프 클래스 (읽기 전용)
+  CSRGraphBuilder.build()로 생성합니다.
+  """
+
+  def __init__(self, num_vertices: int, offsets: array, targets: array,
+               weights: array, directed: bool = True):
+    """
+    CSR 그래프 초기화
+
+    Args:
+        num_vertices: 정점의 개수
+        offsets: 정점별 간선 시작 위치 (길이 V + 1)
+        targets: 간선의 도착 정점 (길이 E)
+        weights: 간선의 가중치 (길이 E)
+        directed: 방향 그래프 여부
+    """
+    self.num_vertices = num_vertices
+    self.offsets = offsets
+    self.targets = targets
+    self.weights = weights
+    self.directed = directed
+
+  @property
+  def num_edges(self) -> int:
+    """저장된 (방향) 간선의 개수"""
+    return len(self.targets)
+
+  def get_vertices(self) -> range:
+    """
+    그래프의 모든 정점 반환
+
+    Returns:
+        0 ~ V-1 범위 (in 연산이 O(1))
+    """
+    return range(self.num_vertices)
+
+  def degree(self, vertex: int) -> int:
+    """정점의 출력 차수"""
+    return self.offsets[vertex + 1] - self.offsets[vertex]
+
+  def neighbors(self, vertex: int) -> array:
+    """
+    인접 정점 반환 (가중치 제외)
+
+    Args:
+        vertex: 정점
+
+    Returns:
+        인접 정점 배열 (targets 구간)
+    """
+    return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+  def weighted_neighbors(self, vertex: int) -> Iterator[Tuple[int, int]]:
+    """
+    (인접 정점, 가중치) 쌍 반환
+
+    Args:
+        vertex: 정점
+
+    Returns:
+        (인접 정점, 가중치) 이터레이터
+    """
+    start, end = self.offsets[vertex], self.offsets[vertex + 1]
+    return zip(self.targets[start:end], self.weights[start:end])
+
+  def reversed(self) -> "CSRGraph":
+    """
+    모든 간선의 방향을 뒤집은 그래프 반환 (역방향 탐색용)
+
+    Returns:
+        전치(transpose) CSR 그래프
+    """
+    if not self.directed:
+      return self
+
+    builder = CSRGraphBuilder(self.num_vertices, directed=True,
+                              weight_typecode=self.weights.typecode)
+    for u in range(self.num_vertices):
+      for i in range(self.offsets[u], self.offsets[u + 1]):
+        builder.add_edge(self.targets[i], u, self.weights[i])
+    return builder.build()
+
+  def memory_bytes(self) -> int:
+    """세 배열 버퍼가 차지하는 바이트 수"""
+    return sum(buf.itemsize * len(buf)
+               for buf in (self.offsets, self.targets, self.weights))
+
+  def print_graph(self) -> None:
+    """
+    그래프 구조 출력 (디버깅용)
+    """
+    print("Graph representation (CSR):")
+    print(f"Vertices: {self.num_vertices}, Edges: {self.num_edges}")
+    print(f"  offsets: {self.offsets.tolist()}")
+    print(f"  targets: {self.targets.tolist()}")
+    print(f"  weights: {self.weights.tolist()}")
+    print()
+
+
+class CSRGraphBuilder:
+  """
+  간선 스트림을 받아 CSR 그래프로 고정(freeze)하는 빌더
+  간선은 파이썬 객체가 아닌 array 버퍼에 임시 저장됩니다.
+  """
+
+  def __init__(self, num_vertices: int, directed: bool = True,
+               weight_typecode: str = 'q'):
+    """
+    빌더 초기화
+
+    Args:
+        num_vertices: 정점의 개수
+        directed: 방향 그래프 여부 (False면 양방향 간선 저장)
+        weight_typecode: 가중치 배열의 array typecode ('q': 정수, 'd': 실수)
+    """
+    self.num_vertices = num_vertices
+    self.directed = directed
+    self.weight_typecode = weight_typecode
+    self._sources = array('q')
+    self._targets = array('q')
+    self._weights = array(weight_typecode)
+
+  def add_edge(self, src: int, dest: int, weight: int = 1) -> None:
+    """
+    간선 추가
+
+    Args:
+        src: 시작 정점
+        dest: 도착 정점
+        weight: 간선의 가중치 (기본값: 1)
+    """
+    if not (0 <= src < self.num_vertices and 0 <= dest < self.num_vertices):
+      raise ValueError(f"Invalid edge ({src}, {dest})")
+
+    self._sources.append(src)
+    self._targets.append(dest)
+    self._weights.append(weight)
+
+    # 무방향 그래프이므로 반대 방향도 추가
+    if not self.directed:
+      self._sources.append(dest)
+      self._targets.append(src)
+      self._weights.append(weight)
+
+  def add_edges(self, edges: Iterable[Tuple]) -> None:
+    """
+    간선 스트림 추가
+
+    Args:
+        edges: (src, dest) 또는 (src, dest, weight) 튜플 이터러블
+    """
+    for edge in edges:
+      self.add_edge(*edge)
+
+  def build(self) -> CSRGraph:
+    """
+    저장된 간선을 출발 정점 기준으로 계수 정렬하여 CSR 그래프 생성
+    같은 출발 정점 안에서는 추가된 순서가 유지됩니다 (안정 정렬).
+
+    Returns:
+        CSR 그래프
+    """
+    vertices = self.num_vertices
+    num_edges = len(self._sources)
+
+    # 1. 정점별 출력 차수 계산
+    offsets = array('q', [0]) * (vertices + 1)
+    for src in self._sources:
+      offsets[src + 1] += 1
+
+    # 2. 누적 합으로 시작 위치 계산
+    for i in range(vertices):
+      offsets[i + 1] += offsets[i]
+
+    # 3. 각 간선을 자기 구간에 배치
+    targets = array('q', [0]) * num_edges
+    weights = array(self.weight_typecode, [0]) * num_edges
+    cursor = offsets[:-1]
+    for i in range(num_edges):
+      src = self._sources[i]
+      pos = cursor[src]
+      targets[pos] = self._targets[i]
+      weights[pos] = self._weights[i]
+      cursor[src] = pos + 1
+
+    return CSRGraph(vertices, offsets, targets, weights, self.directed)
+
+
+def from_edges(num_vertices: int, edges: Iterable[Tuple], directed: bool = True,
+               weight_typecode: str = 'q') -> CSRGraph:
+  """
+  간선 스트림으로부터 CSR 그래프를 바로 생성
+
+  Args:
+      num_vertices: 정점의 개수
+      edges: (src, dest) 또는 (src, dest, weight) 튜플 이터러블
+      directed: 방향 그래프 여부
+      weight_typecode: 가중치 배열의 array typecode
+
+  Returns:
+      CSR 그래프
+  """
+  builder = CSRGraphBuilder(num_vertices, directed, weight_typecode)
+  builder.add_edges(edges)
+  return builder.build()
+
+
+def main():
+  """
+  메인 함수 - 예제 실행
+  """
+  print("=== CSR (Compressed Sparse Row) Graph ===\n")
+
+  # Dijkstra 예제와 동일한 방향 가중치 그래프
+  builder = CSRGraphBuilder(8, directed=True)
+  builder.add_edges([
+      (0, 1, 5), (0, 4, 9), (0, 7, 8), (1, 2, 12),
+      (1, 3, 15), (1, 7, 4), (2, 3, 3), (2, 6, 11),
+      (3, 6, 9), (4, 5, 4), (4, 6, 20), (4, 7, 5),
+      (5, 2, 1), (5, 6, 13), (7, 5, 6), (7, 2, 7),
+  ])
+  graph = builder.build()
+  graph.print_graph()
+
+  print("Weighted neighbors:")
+  for u in graph.get_vertices():
+    print(f"  Vertex {u}: {list(graph.weighted_neighbors(u))}")
+  print()
+
+  print(f"Memory: {graph.memory_bytes()} bytes "
+        f"for {graph.num_edges} edges\n")
+
+  # 역방향 그래프
+  print("Reversed graph:")
+  graph.reversed().print_graph()
+
+
+if __name__ == "__main__":
+  main()
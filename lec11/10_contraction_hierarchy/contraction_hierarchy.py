@@ -0,0 +1,482 @@
+"""
+Contraction Hierarchies (CH) 구현 - 전처리 후 빠른 최단 경로 질의
+정점을 중요도 순서로 하나씩 축약(contract)하면서 최단 경로를 보존하는
+지름길(shortcut) 간선을 추가하고, 질의 시에는 순위가 높아지는 방향의
+간선만 따라가는 양방향 Dijkstra를 수행합니다.
+
+전제조건: 모든 간선의 가중치는 0 이상이어야 함 (음의 가중치 불허)
+
+시간 복잡도:
+- 전처리: 그래프 구조에 의존 (도로망에서는 거의 선형)
+- 질의: 상향 탐색 공간만 방문하므로 일반 Dijkstra보다 수백 배 적은 정점 확정
+
+공간 복잡도: O(V + E + S) - S는 추가된 지름길 간선 수
+"""
+
+import heapq
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple, Union
+
+# Dijkstra 모듈의 Graph/PathQueryResult를 재사용하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '07_dijkstra'))
+from dijkstra import (  # noqa: E402
+    CSRGraph, Graph, PathQueryResult, bidirectional_dijkstra)
+
+# 계층 파일 헤더: 매직 문자열, 정점 수, 상향 간선 수, 하향 간선 수
+HIERARCHY_MAGIC = b'CHG1'
+HIERARCHY_HEADER = struct.Struct('<4sqqq')
+
+
+class ContractionHierarchy:
+  """
+  축약 계층 클래스 (읽기 전용)
+  ContractionHierarchy.build()로 전처리하거나 load()로 파일에서 읽어옵니다.
+
+  - upward: 정점 u에서 순위가 더 높은 정점 v로 가는 간선 u -> v
+  - downward: 순위가 더 높은 정점 v에서 u로 들어오는 간선 v -> u를
+              u 기준으로 저장 (역방향 탐색용)
+  - *_middle: 지름길 간선이 건너뛴 정점 (원래 간선이면 -1)
+  """
+
+  def __init__(self, rank: array, upward: CSRGraph, upward_middle: array,
+               downward: CSRGraph, downward_middle: array):
+    self.num_vertices = len(rank)
+    self.rank = rank
+    self.upward = upward
+    self.upward_middle = upward_middle
+    self.downward = downward
+    self.downward_middle = downward_middle
+
+  @property
+  def num_edges(self) -> int:
+    """계층에 저장된 간선 수 (지름길 포함)"""
+    return self.upward.num_edges + self.downward.num_edges
+
+  @classmethod
+  def build(cls, graph: Union[Graph, CSRGraph],
+            witness_settle_limit: int = 50) -> "ContractionHierarchy":
+    """
+    그래프를 전처리하여 축약 계층 생성
+
+    Args:
+        graph: 가중치 방향 그래프 (Graph 또는 CSRGraph)
+        witness_settle_limit: 지름길 필요 여부를 확인하는 local 탐색에서
+                              확정할 최대 정점 수 (작을수록 빠르지만 지름길 증가)
+
+    Returns:
+        축약 계층 객체
+    """
+    vertices = graph.num_vertices
+
+    # 축약 중 변하는 그래프: 정점별 {이웃: (가중치, 중간 정점)}
+    out_edges: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(vertices)]
+    in_edges: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(vertices)]
+    for u in range(vertices):
+      for v, weight in graph.weighted_neighbors(u):
+        # 자기 루프는 최단 경로에 쓰이지 않고, 평행 간선은 최소 가중치만 유지
+        if u != v and weight < out_edges[u].get(v, (float('inf'),))[0]:
+          out_edges[u][v] = (weight, -1)
+          in_edges[v][u] = (weight, -1)
+
+    contracted = [False] * vertices
+    deleted_neighbors = [0] * vertices
+    rank = array('q', [0]) * vertices
+    upward_lists: List[List[Tuple[int, float, int]]] = [[] for _ in range(vertices)]
+    downward_lists: List[List[Tuple[int, float, int]]] = [[] for _ in range(vertices)]
+
+    def witness_distance(source: int, skip: int, limit: float) -> Dict[int, float]:
+      """skip 정점을 제외하고 source에서 limit 이하 거리의 정점까지 local Dijkstra"""
+      distances = {source: 0}
+      queue = [(0, source)]
+      settled = 0
+      while queue and settled < witness_settle_limit:
+        dist, u = heapq.heappop(queue)
+        if dist > distances[u]:
+          continue
+        if dist > limit:
+          break
+        settled += 1
+        for v, (weight, _) in out_edges[u].items():
+          if v == skip or contracted[v]:
+            continue
+          tentative = dist + weight
+          if tentative < distances.get(v, float('inf')):
+            distances[v] = tentative
+            heapq.heappush(queue, (tentative, v))
+      return distances
+
+    def find_shortcuts(v: int) -> List[Tuple[int, int, float]]:
+      """정점 v를 축약할 때 필요한 지름길 (u, w, 가중치) 목록"""
+      shortcuts = []
+      if not out_edges[v]:
+        return shortcuts
+
+      max_out = max(weight for weight, _ in out_edges[v].values())
+      for u, (in_weight, _) in in_edges[v].items():
+        distances = witness_distance(u, v, in_weight + max_out)
+        for w, (out_weight, _) in out_edges[v].items():
+          if w == u:
+            continue
+          via_v = in_weight + out_weight
+          # v를 거치지 않는 같거나 더 짧은 경로(witness)가 없으면 지름길 필요
+          if distances.get(w, float('inf')) > via_v:
+            shortcuts.append((u, w, via_v))
+      return shortcuts
+
+    def priority(v: int) -> int:
+      """축약 우선순위: 간선 차이(edge difference) + 축약된 이웃 수"""
+      edge_difference = len(find_shortcuts(v)) - len(in_edges[v]) - len(out_edges[v])
+      return edge_difference + deleted_neighbors[v]
+
+    # 정점 순서 결정 (lazy update 방식의 우선순위 큐)
+    order_queue = [(priority(v), v) for v in range(vertices)]
+    heapq.heapify(order_queue)
+    next_rank = 0
+
+    while order_queue:
+      _, v = heapq.heappop(order_queue)
+      if contracted[v]:
+        continue
+
+      # 우선순위를 다시 계산하여 여전히 최소인지 확인
+      current_priority = priority(v)
+      if order_queue and current_priority > order_queue[0][0]:
+        heapq.heappush(order_queue, (current_priority, v))
+        continue
+
+      # 1. 지름길 추가 (기존 간선보다 짧을 때만)
+      for u, w, weight in find_shortcuts(v):
+        if weight < out_edges[u].get(w, (float('inf'),))[0]:
+          out_edges[u][w] = (weight, v)
+          in_edges[w][u] = (weight, v)
+
+      # 2. 남아있는 간선은 모두 순위가 더 높은 정점과 연결됨
+      for w, (weight, middle) in out_edges[v].items():
+        upward_lists[v].append((w, weight, middle))
+        del in_edges[w][v]
+        deleted_neighbors[w] += 1
+      for u, (weight, middle) in in_edges[v].items():
+        downward_lists[v].append((u, weight, middle))
+        del out_edges[u][v]
+        deleted_neighbors[u] += 1
+      out_edges[v].clear()
+      in_edges[v].clear()
+
+      # 3. 정점 축약 완료
+      contracted[v] = True
+      rank[v] = next_rank
+      next_rank += 1
+
+    upward, upward_middle = _freeze(upward_lists)
+    downward, downward_middle = _freeze(downward_lists)
+    return cls(rank, upward, upward_middle, downward, downward_middle)
+
+  def query(self, start_vertex: int, target_vertex: int) -> Optional[PathQueryResult]:
+    """
+    상향 양방향 Dijkstra로 두 정점 사이 최단 경로 질의
+
+    Args:
+        start_vertex: 시작 정점
+        target_vertex: 목표 정점
+
+    Returns:
+        질의 결과 객체 (잘못된 정점인 경우 None)
+    """
+    vertices = self.num_vertices
+    if not (0 <= start_vertex < vertices and 0 <= target_vertex < vertices):
+      print("Invalid vertex!")
+      return None
+
+    result = PathQueryResult()
+
+    # 인덱스 0: 정방향(upward) 탐색, 인덱스 1: 역방향(downward) 탐색
+    graphs = (self.upward, self.downward)
+    distances: Tuple[Dict[int, float], Dict[int, float]] = (
+        {start_vertex: 0}, {target_vertex: 0})
+    parents: Tuple[Dict[int, int], Dict[int, int]] = (
+        {start_vertex: -1}, {target_vertex: -1})
+    queues: Tuple[list, list] = ([(0, start_vertex)], [(0, target_vertex)])
+
+    best_distance = float('inf')
+    meeting_vertex = -1
+    side = 0
+
+    while queues[0] or queues[1]:
+      # 두 방향을 번갈아 진행하되, 한 쪽이 끝났으면 다른 쪽만 진행
+      if not queues[side]:
+        side = 1 - side
+
+      dist = distances[side]
+      current_dist, u = heapq.heappop(queues[side])
+
+      # 상향 탐색은 목표를 지나칠 수 있으므로 각 방향을 독립적으로 종료
+      if current_dist >= best_distance:
+        queues[side].clear()
+        side = 1 - side
+        continue
+      if current_dist > dist[u]:
+        continue
+      result.settled += 1
+
+      # 반대 방향 탐색이 이미 도달한 정점이면 후보 경로 갱신
+      other_dist = distances[1 - side].get(u)
+      if other_dist is not None and current_dist + other_dist < best_distance:
+        best_distance = current_dist + other_dist
+        meeting_vertex = u
+
+      for neighbor, weight in graphs[side].weighted_neighbors(u):
+        tentative_distance = current_dist + weight
+        if tentative_distance < dist.get(neighbor, float('inf')):
+          dist[neighbor] = tentative_distance
+          parents[side][neighbor] = u
+          heapq.heappush(queues[side], (tentative_distance, neighbor))
+
+      side = 1 - side
+
+    if meeting_vertex == -1:
+      return result
+
+    # 계층 경로 재구성: 시작 정점 -> 만난 정점 -> 목표 정점
+    forward = []
+    current = meeting_vertex
+    while current != -1:
+      forward.append(current)
+      current = parents[0][current]
+    forward.reverse()
+
+    backward = [meeting_vertex]
+    current = parents[1][meeting_vertex]
+    while current != -1:
+      backward.append(current)
+      current = parents[1][current]
+
+    # 지름길을 원래 간선으로 풀어서 실제 경로 생성
+    path = [start_vertex]
+    for u, v in zip(forward, forward[1:]):
+      self._unpack(u, v, path)
+    for u, v in zip(backward, backward[1:]):
+      self._unpack(u, v, path)
+
+    result.distance = best_distance
+    result.path = path
+    return result
+
+  def _find_middle(self, u: int, v: int) -> int:
+    """
+    계층 간선 u -> v의 중간 정점 찾기
+
+    Args:
+        u: 간선 시작 정점
+        v: 간선 도착 정점
+
+    Returns:
+        중간 정점 (원래 간선이면 -1)
+    """
+    # 순위가 낮은 쪽에 간선이 저장되어 있음
+    if self.rank[u] < self.rank[v]:
+      graph, middles, owner, other = self.upward, self.upward_middle, u, v
+    else:
+      graph, middles, owner, other = self.downward, self.downward_middle, v, u
+
+    best_weight, best_middle = float('inf'), -1
+    for i in range(graph.offsets[owner], graph.offsets[owner + 1]):
+      if graph.targets[i] == other and graph.weights[i] < best_weight:
+        best_weight, best_middle = graph.weights[i], middles[i]
+    return best_middle
+
+  def _unpack(self, u: int, v: int, path: List[int]) -> None:
+    """
+    계층 간선 u -> v를 원래 간선 경로로 풀어서 path 뒤에 추가 (반복적)
+
+    Args:
+        u: 간선 시작 정점 (path의 마지막 정점)
+        v: 간선 도착 정점
+        path: 경로 리스트
+    """
+    stack = [(u, v)]
+    while stack:
+      a, b = stack.pop()
+      middle = self._find_middle(a, b)
+      if middle == -1:
+        path.append(b)
+      else:
+        # a -> middle을 먼저 처리하도록 역순으로 push
+        stack.append((middle, b))
+        stack.append((a, middle))
+
+  def save(self, path: str) -> None:
+    """
+    계층을 고정 레이아웃 이진 파일로 저장
+
+    Args:
+        path: 파일 경로
+    """
+    arrays = [self.rank,
+              self.upward.offsets, self.upward.targets, self.upward.weights,
+              self.upward_middle,
+              self.downward.offsets, self.downward.targets, self.downward.weights,
+              self.downward_middle]
+
+    with open(path, 'wb') as file:
+      file.write(HIERARCHY_HEADER.pack(HIERARCHY_MAGIC, self.num_vertices,
+                                       self.upward.num_edges,
+                                       self.downward.num_edges))
+      for buffer in arrays:
+        # 파일은 항상 little-endian으로 저장
+        if sys.byteorder != 'little':
+          buffer = array(buffer.typecode, buffer)
+          buffer.byteswap()
+        buffer.tofile(file)
+
+  @classmethod
+  def load(cls, path: str) -> "ContractionHierarchy":
+    """
+    save()로 저장한 계층 파일 읽기
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        축약 계층 객체
+    """
+    with open(path, 'rb') as file:
+      magic, vertices, num_up, num_down = HIERARCHY_HEADER.unpack(
+          file.read(HIERARCHY_HEADER.size))
+      if magic != HIERARCHY_MAGIC:
+        raise ValueError(f"Not a contraction hierarchy file: {path}")
+
+      def read(typecode: str, count: int) -> array:
+        buffer = array(typecode)
+        buffer.fromfile(file, count)
+        if sys.byteorder != 'little':
+          buffer.byteswap()
+        return buffer
+
+      rank = read('q', vertices)
+      upward = CSRGraph(vertices, read('q', vertices + 1), read('q', num_up),
+                        read('d', num_up))
+      upward_middle = read('q', num_up)
+      downward = CSRGraph(vertices, read('q', vertices + 1), read('q', num_down),
+                          read('d', num_down))
+      downward_middle = read('q', num_down)
+
+    return cls(rank, upward, upward_middle, downward, downward_middle)
+
+  def print_hierarchy(self) -> None:
+    """계층 구조 출력 (디버깅용)"""
+    print("Contraction hierarchy:")
+    print(f"Vertices: {self.num_vertices}, Edges: {self.num_edges}")
+    order = sorted(range(self.num_vertices), key=lambda v: self.rank[v])
+    print(f"  Contraction order: {order}")
+    for name, graph, middles in (("Upward", self.upward, self.upward_middle),
+                                 ("Downward", self.downward, self.downward_middle)):
+      print(f"  {name} edges:")
+      for u in range(self.num_vertices):
+        for i in range(graph.offsets[u], graph.offsets[u + 1]):
+          v, weight = graph.targets[i], int(graph.weights[i])
+          edge = f"{u} -> {v}" if name == "Upward" else f"{v} -> {u}"
+          shortcut = f" (shortcut via {middles[i]})" if middles[i] != -1 else ""
+          print(f"    {edge} : {weight}{shortcut}")
+    print()
+
+
+def _freeze(edge_lists: List[List[Tuple[int, float, int]]]) -> Tuple[CSRGraph, array]:
+  """
+  정점별 (이웃, 가중치, 중간 정점) 리스트를 CSR 그래프와 중간 정점 배열로 변환
+
+  Args:
+      edge_lists: 정점별 간선 리스트
+
+  Returns:
+      (CSR 그래프, targets와 같은 순서의 중간 정점 배열)
+  """
+  offsets = array('q', [0])
+  targets = array('q')
+  weights = array('d')
+  middles = array('q')
+  for edges in edge_lists:
+    for target, weight, middle in edges:
+      targets.append(target)
+      weights.append(weight)
+      middles.append(middle)
+    offsets.append(len(targets))
+  return CSRGraph(len(edge_lists), offsets, targets, weights), middles
+
+
+def main():
+  """
+  메인 함수 - 예제 실행
+  """
+  print("=== Contraction Hierarchies ===\n")
+
+  # Dijkstra 예제와 동일한 그래프 (8개 정점: 0-7)
+  graph = Graph(8)
+  for src, dest, weight in [(0, 1, 5), (0, 4, 9), (0, 7, 8), (1, 2, 12),
+                            (1, 3, 15), (1, 7, 4), (2, 3, 3), (2, 6, 11),
+                            (3, 6, 9), (4, 5, 4), (4, 6, 20), (4, 7, 5),
+                            (5, 2, 1), (5, 6, 13), (7, 5, 6), (7, 2, 7)]:
+    graph.add_edge(src, dest, weight)
+
+  # 1. 전처리
+  hierarchy = ContractionHierarchy.build(graph)
+  hierarchy.print_hierarchy()
+
+  # 2. 질의
+  for target in (6, 3, 7):
+    result = hierarchy.query(0, target)
+    if result:
+      result.print_result(0, target)
+
+  # 3. 파일로 저장 후 다시 읽어서 질의
+  with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "graph.ch")
+    hierarchy.save(path)
+    print(f"Saved hierarchy: {os.path.getsize(path)} bytes")
+    loaded = ContractionHierarchy.load(path)
+
+  result = loaded.query(0, 6)
+  if result:
+    result.print_result(0, 6)
+
+  # 4. 격자 그래프에서 양방향 Dijkstra와 질의 비교
+  size = 30
+  grid = Graph(size * size)
+  for row in range(size):
+    for col in range(size):
+      u = row * size + col
+      for d_row, d_col in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+        n_row, n_col = row + d_row, col + d_col
+        if 0 <= n_row < size and 0 <= n_col < size:
+          grid.add_edge(u, n_row * size + n_col, 1 + (u * 7 + n_col) % 9)
+
+  print(f"=== Grid graph {size}x{size} ===")
+  start = time.perf_counter()
+  grid_hierarchy = ContractionHierarchy.build(grid)
+  print(f"Preprocessing: {time.perf_counter() - start:.2f} s, "
+        f"{grid_hierarchy.num_edges} hierarchy edges")
+
+  source, target = 0, size * size - 1
+  reverse_grid = grid.reversed()
+
+  start = time.perf_counter()
+  baseline = bidirectional_dijkstra(grid, source, target, reverse_grid)
+  baseline_time = time.perf_counter() - start
+
+  start = time.perf_counter()
+  ch_result = grid_hierarchy.query(source, target)
+  ch_time = time.perf_counter() - start
+
+  print(f"Bidirectional Dijkstra: distance {int(baseline.distance)}, "
+        f"settled {baseline.settled}, {baseline_time * 1000:.2f} ms")
+  print(f"CH query:               distance {int(ch_result.distance)}, "
+        f"settled {ch_result.settled}, {ch_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+  main()
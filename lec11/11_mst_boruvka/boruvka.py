@@ -0,0 +1,283 @@
+"""
+Borůvka MST (Minimum Spanning Tree) 알고리즘 구현 - 프로세스 병렬화
+매 라운드마다 각 연결 성분의 가장 가벼운 외부 간선을 찾아 한꺼번에 추가하고,
+성분을 합친(contract) 뒤 내부 간선을 제거합니다.
+
+간선 배열은 공유 메모리(shared memory)에 두고, 간선 구간을 프로세스 풀의
+작업자들이 나누어 "성분별 최소 외부 간선" 탐색과 내부 간선 압축을 병렬로 수행합니다.
+
+시간 복잡도: O(E log V) - 라운드마다 성분 수가 절반 이하로 감소 (작업자 p개면 O(E log V / p) 탐색)
+공간 복잡도: O(V + E) - 공유 간선 배열과 Union-Find
+"""
+
+import os
+import random
+import sys
+import time
+from array import array
+from functools import partial
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+
+# Kruskal 모듈의 Graph/MST/DisjointSet을 재사용하기 위해 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '04_mst_kruskal'))
+from kruskal import DisjointSet, Graph, MST, kruskal_mst  # noqa: E402
+
+# 공유 배열 구성: 이름 -> typecode
+# src/dest/weight/edge_id는 라운드마다 작업자가 자기 구간 안에서 압축하고,
+# component는 메인 프로세스가 라운드마다 갱신하는 정점별 성분 번호
+SHARED_LAYOUT = (('src', 'q'), ('dest', 'q'), ('weight', 'd'),
+                 ('edge_id', 'q'), ('component', 'q'))
+
+# 작업자 프로세스에서 공유 배열에 접근하기 위한 전역 상태
+_worker_arrays: Dict[str, memoryview] = {}
+_worker_blocks: List[SharedMemory] = []
+
+
+class SharedArrays:
+  """
+  공유 메모리 위의 고정 길이 배열 묶음
+  메인 프로세스가 create=True로 만들고, 작업자는 이름으로 attach합니다.
+  """
+
+  def __init__(self, lengths: Dict[str, int], names: Optional[Dict[str, str]] = None):
+    """
+    Args:
+        lengths: 배열 이름별 길이
+        names: 기존 공유 메모리 이름 (None이면 새로 생성)
+    """
+    self.owner = names is None
+    self.blocks: Dict[str, SharedMemory] = {}
+    self.views: Dict[str, memoryview] = {}
+    self._casts: List[memoryview] = []
+
+    for key, typecode in SHARED_LAYOUT:
+      length = lengths[key]
+      if self.owner:
+        size = max(1, length * array(typecode).itemsize)
+        block = SharedMemory(create=True, size=size)
+      else:
+        block = SharedMemory(name=names[key])
+      cast = block.buf.cast(typecode)
+      self.blocks[key] = block
+      self._casts.append(cast)
+      self.views[key] = cast[:length]
+
+  @property
+  def names(self) -> Dict[str, str]:
+    """작업자에게 전달할 공유 메모리 이름"""
+    return {key: block.name for key, block in self.blocks.items()}
+
+  def close(self) -> None:
+    """뷰를 해제하고 공유 메모리를 닫음 (소유자면 삭제까지)"""
+    for view in list(self.views.values()) + self._casts:
+      view.release()
+    self.views.clear()
+    self._casts.clear()
+    for block in self.blocks.values():
+      block.close()
+      if self.owner:
+        block.unlink()
+    self.blocks.clear()
+
+
+def _init_worker(names: Dict[str, str], lengths: Dict[str, int]) -> None:
+  """작업자 프로세스 초기화: 공유 배열에 attach"""
+  shared = SharedArrays(lengths, names)
+  _worker_arrays.update(shared.views)
+  _worker_blocks.extend(shared.blocks.values())
+
+
+def _scan_partition(task: Tuple[int, int]) -> Tuple[int, Dict[int, Tuple[float, int]]]:
+  """
+  간선 구간 하나를 처리: 성분 내부 간선을 제거(압축)하고 성분별 최소 외부 간선 탐색
+
+  Args:
+      task: (구간 시작 위치, 구간 길이)
+
+  Returns:
+      (압축 후 구간 길이, {성분: (가중치, 간선 번호)})
+  """
+  start, length = task
+  src, dest = _worker_arrays['src'], _worker_arrays['dest']
+  weight, edge_id = _worker_arrays['weight'], _worker_arrays['edge_id']
+  component = _worker_arrays['component']
+
+  cheapest: Dict[int, Tuple[float, int]] = {}
+  write = start
+
+  for i in range(start, start + length):
+    comp_u, comp_v = component[src[i]], component[dest[i]]
+
+    # 같은 성분 안의 간선은 다시 쓰이지 않으므로 제거
+    if comp_u == comp_v:
+      continue
+
+    # 살아남은 간선을 구간 앞쪽으로 이동
+    if write != i:
+      src[write], dest[write] = src[i], dest[i]
+      weight[write], edge_id[write] = weight[i], edge_id[i]
+
+    # (가중치, 간선 번호)로 비교하여 동일 가중치에서도 사이클이 생기지 않도록 함
+    key = (weight[write], edge_id[write])
+    for comp in (comp_u, comp_v):
+      best = cheapest.get(comp)
+      if best is None or key < best:
+        cheapest[comp] = key
+
+    write += 1
+
+  return write - start, cheapest
+
+
+def boruvka_mst(graph: Graph, workers: Optional[int] = None,
+                verbose: bool = True) -> Optional[MST]:
+  """
+  병렬 Borůvka MST 알고리즘
+
+  Args:
+      graph: 가중치 그래프 (num_vertices와 edges를 가진 Kruskal/Prim Graph)
+      workers: 작업자 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+      verbose: 라운드별 진행 상황 출력 여부 (기본값: True)
+
+  Returns:
+      MST 결과 객체 (연결되지 않은 그래프면 최소 신장 포레스트)
+  """
+  vertices = graph.num_vertices
+  num_edges = len(graph.edges)
+
+  if vertices <= 0 or num_edges <= 0:
+    print("Invalid graph!")
+    return None
+
+  if workers is None:
+    workers = os.cpu_count() or 1
+
+  # 간선 원본 (MST 간선 복원용)과 공유 배열 준비
+  lengths = {'src': num_edges, 'dest': num_edges, 'weight': num_edges,
+             'edge_id': num_edges, 'component': vertices}
+  shared = SharedArrays(lengths)
+  pool = None
+
+  try:
+    views = shared.views
+    for i, edge in enumerate(graph.edges):
+      views['src'][i] = edge.src
+      views['dest'][i] = edge.dest
+      views['weight'][i] = edge.weight
+      views['edge_id'][i] = i
+    for v in range(vertices):
+      views['component'][v] = v
+
+    # 간선 구간 분할: 작업자마다 여러 구간을 주어 부하를 분산
+    num_parts = max(1, min(num_edges, workers * 4))
+    part_size = -(-num_edges // num_parts)
+    partitions = [(start, min(part_size, num_edges - start))
+                  for start in range(0, num_edges, part_size)]
+
+    if workers > 1:
+      pool = Pool(workers, initializer=_init_worker, initargs=(shared.names, lengths))
+      scan = partial(pool.map, _scan_partition)
+    else:
+      _worker_arrays.update(views)
+      scan = partial(map, _scan_partition)
+
+    mst = MST()
+    disjoint_set = DisjointSet(vertices)
+    round_number = 1
+
+    while disjoint_set.num_sets > 1:
+      # 1. 구간별 병렬 탐색 (내부 간선 압축 + 성분별 최소 외부 간선)
+      results = list(scan(partitions))
+      partitions = [(start, new_length)
+                    for (start, _), (new_length, _) in zip(partitions, results)]
+
+      # 2. 구간별 결과를 합쳐 성분별 최소 외부 간선 결정
+      cheapest: Dict[int, Tuple[float, int]] = {}
+      for _, part_cheapest in results:
+        for comp, key in part_cheapest.items():
+          best = cheapest.get(comp)
+          if best is None or key < best:
+            cheapest[comp] = key
+
+      # 외부 간선이 없으면 남은 성분들은 서로 연결되지 않음
+      if not cheapest:
+        break
+
+      # 3. 선택된 간선을 추가하며 성분 합치기
+      added = 0
+      for _, edge_index in cheapest.values():
+        edge = graph.edges[edge_index]
+        if disjoint_set.union(edge.src, edge.dest):
+          mst.add_edge(edge)
+          added += 1
+
+      # 4. 성분 번호 갱신 (다음 라운드의 압축 기준)
+      component = views['component']
+      for v in range(vertices):
+        component[v] = disjoint_set.find(v)
+
+      if verbose:
+        remaining = sum(length for _, length in partitions)
+        print(f"Round {round_number}: added {added} edges, "
+              f"{disjoint_set.num_sets} components, "
+              f"{remaining} candidate edges scanned")
+      round_number += 1
+
+    return mst
+  finally:
+    if pool is not None:
+      pool.close()
+      pool.join()
+    _worker_arrays.clear()
+    shared.close()
+
+
+def main():
+  """
+  메인 함수 - 예제 실행
+  """
+  print("=== Borůvka MST Algorithm (Parallel) ===\n")
+
+  # 그래프 생성 (8개 정점: 0-7) - Kruskal과 동일한 그래프
+  graph = Graph(8)
+  for src, dest, weight in [(0, 7, 16), (2, 3, 17), (1, 7, 19), (0, 2, 26),
+                            (5, 7, 28), (1, 3, 29), (1, 5, 32), (2, 7, 34),
+                            (4, 5, 35), (1, 2, 36), (4, 7, 37), (0, 4, 38),
+                            (6, 2, 40), (3, 6, 52), (6, 0, 58), (6, 4, 93)]:
+    graph.add_edge(src, dest, weight)
+
+  graph.print_graph()
+
+  mst = boruvka_mst(graph, workers=2)
+  if mst:
+    print()
+    mst.print_mst()
+
+  # 큰 무작위 그래프에서 작업자 수별 실행 시간 비교
+  random.seed(42)
+  vertices = 50000
+  large_graph = Graph(vertices)
+  for v in range(1, vertices):
+    large_graph.add_edge(v, random.randrange(v), random.randint(1, 1000))
+  for _ in range(4 * vertices):
+    large_graph.add_edge(random.randrange(vertices), random.randrange(vertices),
+                         random.randint(1, 1000))
+
+  print(f"=== Random graph: {vertices} vertices, {len(large_graph.edges)} edges ===")
+  start = time.perf_counter()
+  reference = kruskal_mst(large_graph, verbose=False)
+  print(f"Kruskal           : weight {reference.total_weight}, "
+        f"{time.perf_counter() - start:.2f} s")
+
+  for workers in sorted({1, min(4, os.cpu_count() or 1)}):
+    start = time.perf_counter()
+    result = boruvka_mst(large_graph, workers=workers, verbose=False)
+    print(f"Borůvka ({workers} workers): weight {result.total_weight}, "
+          f"{time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+  main()